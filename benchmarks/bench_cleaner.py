@@ -0,0 +1,76 @@
+"""
+Benchmark JobDataCleaner.clean_jobs_dataframe against the original row-by-row `apply` path.
+
+Usage:
+    python benchmarks/bench_cleaner.py --rows 10000 100000 1000000
+"""
+import argparse
+import random
+import re
+
+import pandas as pd
+
+from common import best_time, print_table, quiet_logger
+
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+from Utils.constants import LOCATION_MAPPING
+
+
+class ApplyJobDataCleaner(JobDataCleaner):
+    """JobDataCleaner with the original per-row `Series.apply` implementations."""
+
+    def process_location_data(self, df, location_mapping=LOCATION_MAPPING):
+        df['Location'] = df['Location'].apply(lambda x: x.split(',')[0])
+        df['Location'] = df['Location'].apply(lambda loc: location_mapping.get(loc, 'Other'))
+        df = df[df['Location'] != 'Other']
+        df['Location'] = df['Location'].astype('category')
+        return df
+
+    def process_urls_and_job_ids(self, df):
+        df['Url'] = df['Url'].apply(lambda url: url.split('?position')[0])
+        df['JobID'] = df['Url'].apply(lambda url: url[-10:])
+        return df
+
+    def filter_valid_job_ids(self, df):
+        df = df[df['JobID'].notna()]
+        return df[df['JobID'].apply(lambda x: re.fullmatch(r'\d{10}', str(x)) is not None)]
+
+
+def merged_history(rows, seed=0):
+    """Build a merged multi-city history of scraped cards."""
+    rng = random.Random(seed)
+    cities = list(LOCATION_MAPPING) + ['Austin', 'Bogotá', 'Remote']
+    regions = [', Nuevo León, Mexico', ', Jalisco, Mexico', ', Mexico', '']
+    return pd.DataFrame({
+        'Location': [rng.choice(cities) + rng.choice(regions) for _ in range(rows)],
+        'Title': [f'Data Scientist {rng.randint(0, 500)}' for _ in range(rows)],
+        'Company': [f'Company {rng.randint(0, 2000)}' for _ in range(rows)],
+        'Url': [f'https://mx.linkedin.com/jobs/view/data-scientist-{4000000000 + i}?position={i % 10}&pageNum=0'
+                for i in range(rows)],
+        'Remote': 'REMOTE',
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logger = quiet_logger()
+    results = []
+    for rows in args.rows:
+        df = merged_history(rows)
+        apply_time, expected = best_time(lambda: ApplyJobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING),
+                                         repeat=args.repeat)
+        vectorized_time, result = best_time(lambda: JobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING),
+                                            repeat=args.repeat)
+        pd.testing.assert_frame_equal(result, expected)
+        results.append({'rows': rows, 'apply_s': round(apply_time, 3), 'vectorized_s': round(vectorized_time, 3),
+                        'speedup': f'{apply_time / vectorized_time:.1f}x'})
+
+    print_table(results, ['rows', 'apply_s', 'vectorized_s', 'speedup'])
+
+
+if __name__ == '__main__':
+    main()
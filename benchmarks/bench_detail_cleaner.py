@@ -0,0 +1,121 @@
+"""
+Benchmark JobDataCleaner.clean_extracted_job_data against the original per-row detail field normalization.
+
+Usage:
+    python benchmarks/bench_detail_cleaner.py --rows 10000 100000 1000000
+"""
+import argparse
+import random
+import re
+
+import pandas as pd
+
+from common import best_time, print_table, quiet_logger
+
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+
+
+class ApplyJobDataCleaner(JobDataCleaner):
+    """JobDataCleaner with the original per-row `Series.apply` detail field normalization."""
+
+    def clean_num_applicants(self, df_jobs):
+        def extract_num_applicants(text):
+            match = re.search(r'\d+', text)
+            if match:
+                return int(match.group())
+            elif "Be among the first 25" in text:
+                return 25
+            elif "Over 200 applicants" in text:
+                return 200
+            return 'N/A'
+
+        df_jobs['NumApplicants'] = df_jobs['NumApplicants'].apply(extract_num_applicants)
+        return df_jobs
+
+    def clean_seniority_level(self, df_jobs):
+        df_jobs['SeniorityLevel'] = df_jobs['SeniorityLevel'].apply(lambda x: 'N/A' if 'Not Applicable' in x else x)
+        seniority_categories = ['Entry level', 'Mid-Senior level', 'Executive', 'N/A', 'Associate', 'Internship']
+        df_jobs['SeniorityLevel'] = pd.Categorical(df_jobs['SeniorityLevel'], categories=seniority_categories)
+        return df_jobs
+
+    def standardize_job_function(self, df_jobs):
+        def standardize_job_function(text):
+            if ' and ' in text:
+                text = text.replace(' and ', ', ')
+            job_functions = text.split(', ')
+            if len(job_functions) > 3:
+                job_functions = job_functions[:3]
+            return ', '.join(job_functions)
+
+        df_jobs['JobFunction'] = df_jobs['JobFunction'].replace({
+            'Research and Design': 'R&D',
+            'Design and Product Management': 'Product Management'
+        }, regex=False)
+        df_jobs['JobFunction'] = df_jobs['JobFunction'].apply(standardize_job_function)
+        return df_jobs
+
+    def split_job_functions(self, df_jobs):
+        def split_job_functions(text):
+            job_functions = text.split(', ')
+            return pd.Series([job_functions[i] if len(job_functions) > i else None for i in range(3)])
+
+        columns = ['JobFunction1', 'JobFunction2', 'JobFunction3']
+        df_jobs[columns] = df_jobs['JobFunction'].apply(split_job_functions)
+        for column in columns:
+            df_jobs[column] = df_jobs[column].fillna('N/A')
+        job_function_categories = list(set(sum((df_jobs[column].unique().tolist() for column in columns), [])))
+        for column in columns:
+            df_jobs[column] = pd.Categorical(df_jobs[column], categories=job_function_categories)
+        df_jobs.drop(columns=['JobFunction'], inplace=True)
+        return df_jobs
+
+
+def enriched_jobs(rows, seed=0):
+    """Build scraped job details with the detail field texts LinkedIn shows."""
+    rng = random.Random(seed)
+    seniority = ['Entry level', 'Mid-Senior level', 'Not Applicable', 'Executive', 'Associate', 'Internship']
+    functions = ['Engineering and Information Technology', 'Research and Design', 'Analyst',
+                 'Analyst, Information Technology, and Engineering', 'Sales and Business Development', 'Other']
+    return pd.DataFrame({
+        'Title': [f'Data Scientist {rng.randint(0, 500)}' for _ in range(rows)],
+        'Company': [f'Company {rng.randint(0, 2000)}' for _ in range(rows)],
+        'Location': 'Monterrey',
+        'Remote': 'REMOTE',
+        'SeniorityLevel': [rng.choice(seniority) for _ in range(rows)],
+        'EmploymentType': [rng.choice(['Full-time', 'Contract', 'Part-time']) for _ in range(rows)],
+        'Industries': 'IT Services and IT Consulting',
+        'PostedTime': [f'{rng.randint(1, 6)} {rng.choice(["hours", "days", "weeks"])} ago' for _ in range(rows)],
+        'NumApplicants': [rng.choice(['Be among the first 25 applicants', 'Over 200 applicants',
+                                      f'{rng.randint(26, 199)} applicants']) for _ in range(rows)],
+        'JobFunction': [rng.choice(functions) for _ in range(rows)],
+        'Description': 'Description',
+        'Url': [f'https://mx.linkedin.com/jobs/view/{4000000000 + i}' for i in range(rows)],
+        'JobID': [str(4000000000 + i) for i in range(rows)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logger = quiet_logger()
+    results = []
+    for rows in args.rows:
+        df = enriched_jobs(rows)
+        apply_time, expected = best_time(lambda: ApplyJobDataCleaner(logger).clean_extracted_job_data(df.copy()),
+                                         repeat=args.repeat)
+        vectorized_time, result = best_time(lambda: JobDataCleaner(logger).clean_extracted_job_data(df.copy()),
+                                            repeat=args.repeat)
+        assert result.columns.tolist() == expected.columns.tolist()
+        assert result['NumApplicants'].astype(int).tolist() == expected['NumApplicants'].tolist()
+        assert result['JobFunction3'].astype(str).tolist() == expected['JobFunction3'].astype(str).tolist()
+        results.append({'rows': rows, 'apply_s': round(apply_time, 3), 'vectorized_s': round(vectorized_time, 3),
+                        'rows_per_s': f'{rows / vectorized_time:,.0f}', 'speedup': f'{apply_time / vectorized_time:.1f}x'})
+
+    print_table(results, ['rows', 'apply_s', 'vectorized_s', 'rows_per_s', 'speedup'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+End-to-end benchmark of LinkedInJobScraper.run, fully offline.
+
+LinkedIn is replaced by a local ReplayServer and OpenAI by a FakeOpenAIClient, both
+serving either a recorded fixture archive (see record_fixtures.py) or a synthetic
+corpus. Each mode runs in its own process and reports wall time, requests per second,
+CPU time per pipeline stage and peak RSS.
+
+Usage:
+    python benchmarks/bench_pipeline.py --jobs 500 --latency 0.02 --openai-latency 0.05
+    python benchmarks/bench_pipeline.py --archive fixtures.json.gz --modes sequential concurrent
+"""
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from common import peak_rss_mb, print_table, quiet_logger
+
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import FakeOpenAIClient, FixtureArchive, ReplayServer, build_synthetic_archive
+from LinkedInWebScraper.utils import HttpFetcher
+
+# Pipeline stages timed separately, in execution order
+STAGES = ['scrape_jobs', 'clean_jobs', 'classify_jobs', 'fetch_job_details', 'clean_job_details',
+          'enrich_jobs_with_descriptions', 'final_processing']
+
+# JobScraperConfig options of each benchmarked mode
+MODES = {
+    'sequential': {},
+    'async_pages': {'async_pages': True, 'max_pages_in_flight': 8},
+    'detail_workers': {'detail_workers': 8},
+    'concurrent': {'async_pages': True, 'max_pages_in_flight': 8, 'detail_workers': 8, 'max_requests_per_host': 8,
+                   'openai_max_in_flight': 8},
+}
+
+
+def instrument(scraper, stage_times):
+    """Wrap the stage methods of a LinkedInJobScraper to accumulate their wall and CPU time."""
+    for stage in STAGES:
+        method = getattr(scraper, stage)
+
+        @functools.wraps(method)
+        def timed(*args, _method=method, _stage=stage, **kwargs):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                stage_times[_stage]['wall'] += time.perf_counter() - wall_start
+                stage_times[_stage]['cpu'] += time.process_time() - cpu_start
+
+        setattr(scraper, stage, timed)
+
+
+def run_mode(mode, archive_path, args):
+    """Run the pipeline once in the current process and return its measurements."""
+    archive = FixtureArchive.load(archive_path)
+    logger = quiet_logger()
+    stage_times = defaultdict(lambda: {'wall': 0.0, 'cpu': 0.0})
+    rate_limiter = AdaptiveRateLimiter(initial_rate=args.rate, max_rate=args.rate,
+                                       initial_concurrency=32, max_concurrency=32)
+    openai_client = FakeOpenAIClient(archive, latency=args.openai_latency, error_rate=args.openai_error_rate, seed=0)
+
+    with ReplayServer(archive, latency=args.latency, error_rate=args.error_rate, seed=0) as server, \
+         HttpFetcher(logger, pool_size=32, rate_limiter=rate_limiter) as fetcher:
+        config = JobScraperConfig(args.position, args.location, openai_enabled=not args.no_openai,
+                                  time_posted=args.time_posted, remote=args.remote, base_url=server.url,
+                                  parser_backend=args.parser, **MODES[mode])
+        scraper = LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=openai_client)
+        instrument(scraper, stage_times)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        jobs = scraper.run()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        requests_served = server.requests_served
+
+    return {
+        'mode': mode,
+        'jobs': len(jobs),
+        'wall_s': round(wall_time, 3),
+        'cpu_s': round(cpu_time, 3),
+        'requests': requests_served,
+        'req_per_s': round(requests_served / wall_time, 1) if wall_time else 0.0,
+        'openai_calls': openai_client.calls,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'stages': {stage: {key: round(value, 3) for key, value in times.items()} for stage, times in stage_times.items()},
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archive', help='Fixture archive to replay. Defaults to a synthetic corpus.')
+    parser.add_argument('--jobs', type=int, default=300, help='Postings in the synthetic corpus.')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--position', default='Data Scientist')
+    parser.add_argument('--location', default='Monterrey')
+    parser.add_argument('--remote', default='REMOTE')
+    parser.add_argument('--time-posted', default='DAY')
+    parser.add_argument('--parser', default='bs4', help="Parser backend, 'bs4' or 'lxml'.")
+    parser.add_argument('--latency', type=float, default=0.01, help='Seconds added to each HTTP response.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of HTTP requests answered 429.')
+    parser.add_argument('--openai-latency', type=float, default=0.02, help='Seconds taken by each completion.')
+    parser.add_argument('--openai-error-rate', type=float, default=0.0, help='Fraction of completions that fail.')
+    parser.add_argument('--no-openai', action='store_true', help='Disable the enrichment stages.')
+    parser.add_argument('--rate', type=float, default=1000.0, help='Requests per second allowed by the rate limiter.')
+    parser.add_argument('--json', help='Also write the results to this JSON file.')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_path = args.archive
+        if archive_path is None:
+            archive_path = os.path.join(tmp_dir, 'synthetic.json.gz')
+            build_synthetic_archive(args.jobs, args.position, args.location, remote_types=(args.remote,),
+                                    time_posted=args.time_posted).save(archive_path)
+
+        # A fresh process per mode keeps the peak RSS of each mode separate
+        results = []
+        context = multiprocessing.get_context('spawn')
+        for mode in args.modes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(executor.submit(run_mode, mode, archive_path, args).result())
+
+    print_table(results, ['mode', 'jobs', 'wall_s', 'cpu_s', 'requests', 'req_per_s', 'openai_calls', 'peak_rss_mb'])
+    print()
+    stage_rows = [dict(stage=stage, **{result['mode']: result['stages'].get(stage, {}).get('cpu', 0.0) for result in results})
+                  for stage in STAGES]
+    print('CPU seconds per stage')
+    print_table(stage_rows, ['stage'] + [result['mode'] for result in results])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
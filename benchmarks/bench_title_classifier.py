@@ -0,0 +1,92 @@
+"""
+Benchmark JobTitleClassifier against the original per-keyword regex search.
+
+Usage:
+    python benchmarks/bench_title_classifier.py --titles 100000 --keywords 1000
+"""
+import argparse
+import random
+import re
+
+import pandas as pd
+
+from common import best_time, print_table, quiet_logger
+
+from LinkedInWebScraper.job_title_classifier import JobTitleClassifier
+from Utils.constants import DATA_SCIENCE_KEYWORDS
+
+
+class PerKeywordTitleClassifier(JobTitleClassifier):
+    """JobTitleClassifier with the original per-title, per-keyword `re.search` loop."""
+
+    def classify_titles(self, titles):
+        return titles.apply(self._classify_single_title).astype(bool)
+
+    def _classify_single_title(self, title):
+        title_lower = title.lower()
+        for keyword in self.keywords:
+            if re.search(rf'\b{re.escape(keyword)}\b', title_lower):
+                self.logger.log.debug(f"Title '{title}' matches keyword '{keyword}'")
+                return 1
+        self.logger.log.debug(f"Title '{title}' does not match any keywords.")
+        return 0
+
+
+def synthetic_keywords(count, seed=0):
+    """The data science keywords padded with generated multi-word skills."""
+    rng = random.Random(seed)
+    syllables = ['da', 'ta', 'ml', 'ops', 'quant', 'neu', 'ral', 'graph', 'vi', 'sion', 'stat', 'geo', 'bio', 'fin']
+    keywords = list(DATA_SCIENCE_KEYWORDS)
+    while len(keywords) < count:
+        word = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        keywords.append(word if rng.random() < 0.7 else f'{word} {rng.choice(syllables)}ing')
+    return keywords[:count]
+
+
+def synthetic_titles(count, distinct=5000, seed=0):
+    """Job titles drawn from a pool of distinct titles, repeating like multi-city history does."""
+    rng = random.Random(seed)
+    words = ['Senior', 'Junior', 'Lead', 'Data', 'Scientist', 'Engineer', 'Analyst', 'Sales', 'Manager', 'Machine',
+             'Learning', 'Marketing', 'Software', 'Developer', 'Accountant', 'BI', 'Consultant', 'Operations', 'AI']
+    pool = [' '.join(rng.sample(words, rng.randint(2, 4))) + f' {rng.randint(1, 99)}' for _ in range(distinct)]
+    return pd.Series([rng.choice(pool) for _ in range(count)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=100000)
+    parser.add_argument('--keywords', type=int, nargs='+', default=[20, 1000])
+    parser.add_argument('--baseline-titles', type=int, default=2000,
+                        help='Titles classified by the slow per-keyword baseline; throughput is compared per title.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logger = quiet_logger()
+    titles = synthetic_titles(args.titles)
+    results = []
+    for keyword_count in args.keywords:
+        keywords = synthetic_keywords(keyword_count)
+        variants = {
+            'per-keyword re.search': PerKeywordTitleClassifier(logger, 'Data Scientist', keywords, memoize=False),
+            'single pattern': JobTitleClassifier(logger, 'Data Scientist', keywords, memoize=False),
+            'single pattern + memo': JobTitleClassifier(logger, 'Data Scientist', keywords, memoize=True),
+        }
+
+        baseline = variants.pop('per-keyword re.search')
+        sample = titles.head(args.baseline_titles)
+        elapsed, expected = best_time(baseline.classify_titles, sample, repeat=1)
+        results.append({'keywords': keyword_count, 'variant': 'per-keyword re.search', 'titles': len(sample),
+                        'seconds': round(elapsed, 3), 'titles_per_s': f'{len(sample) / elapsed:,.0f}'})
+
+        for name, classifier in variants.items():
+            JobTitleClassifier._shared_memos.clear()
+            elapsed, result = best_time(classifier.classify_titles, titles, repeat=args.repeat)
+            assert result.head(len(sample)).equals(expected), name
+            results.append({'keywords': keyword_count, 'variant': name, 'titles': len(titles),
+                            'seconds': round(elapsed, 3), 'titles_per_s': f'{len(titles) / elapsed:,.0f}'})
+
+    print_table(results, ['keywords', 'variant', 'titles', 'seconds', 'titles_per_s'])
+
+
+if __name__ == '__main__':
+    main()
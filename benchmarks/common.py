@@ -0,0 +1,52 @@
+"""Helpers shared by the benchmark scripts."""
+import logging
+import os
+import resource
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Make the src/ packages importable when a benchmark is run from a checkout
+SRC_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import LinkedInWebScraper  # noqa: E402,F401  (initializes the package before Utils)
+from Utils.logger import Logger  # noqa: E402
+
+
+def quiet_logger(filename='benchmark.log'):
+    """Returns the package Logger writing to `filename` under benchmarks/, with console output limited to warnings."""
+    logger = Logger(os.path.join(BENCHMARKS_DIR, filename))
+    for handler in logger.log.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setLevel(logging.WARNING)
+    return logger
+
+
+def peak_rss_mb():
+    """Returns the peak resident set size of the current process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def best_time(func, *args, repeat=3, **kwargs):
+    """Returns the best wall time in seconds of `repeat` calls, and the result of the last one."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(rows, columns):
+    """Print a list of dictionaries as an aligned text table."""
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    print('  '.join(column.ljust(widths[column]) for column in columns))
+    print('  '.join('-' * widths[column] for column in columns))
+    for row in rows:
+        print('  '.join(str(row[column]).ljust(widths[column]) for column in columns))
@@ -0,0 +1,48 @@
+"""
+Record a real scraping run into a fixture archive for offline replay.
+
+Every search page, job posting and OpenAI completion returned during the run is
+captured, so bench_pipeline.py can replay the exact same workload later.
+
+Usage:
+    python benchmarks/record_fixtures.py fixtures.json.gz --position "Data Scientist" --location Monterrey --openai
+"""
+import argparse
+
+from common import quiet_logger
+
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.replay import FixtureArchive, RecordingFetcher, RecordingOpenAIClient
+from LinkedInWebScraper.utils import HttpFetcher
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('archive', help='Path of the fixture archive to write.')
+    parser.add_argument('--position', default='Data Scientist')
+    parser.add_argument('--location', default='Monterrey')
+    parser.add_argument('--remote', nargs='+', default=['REMOTE', 'HYBRID', 'ON-SITE'])
+    parser.add_argument('--time-posted', default='DAY')
+    parser.add_argument('--openai', action='store_true', help='Also record the OpenAI completions.')
+    args = parser.parse_args()
+
+    logger = quiet_logger('record_fixtures.log')
+    archive = FixtureArchive()
+    openai_client = RecordingOpenAIClient(OpenAIHandler(logger).client, archive) if args.openai else None
+
+    with HttpFetcher(logger) as fetcher:
+        recording_fetcher = RecordingFetcher(fetcher, archive)
+        for remote in args.remote:
+            config = JobScraperConfig(args.position, args.location, openai_enabled=args.openai,
+                                      time_posted=args.time_posted, remote=remote)
+            jobs = LinkedInJobScraper(logger, config, fetcher=recording_fetcher, openai_client=openai_client).run()
+            print(f"{remote}: {len(jobs)} jobs")
+
+    archive.save(args.archive)
+    print(f"Recorded {len(archive.responses)} responses and {len(archive.completions)} completions to {args.archive}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,7 @@ if __name__ == '__main__':
         city_start_time = time.time()
         city_filename = city.replace(" ", "_")
         file = f'LinkedIn_Jobs_Data_Scientist_{city_filename}.csv'
-        run_ds_daily_scraper(logger=logger, location=city, file_name=file)
+        run_ds_daily_scraper(logger=logger, location=city, file_name=file, incremental=True)
 
         city_end_time = time.time()
         city_duration = city_end_time - city_start_time
@@ -1,21 +1,38 @@
 from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
 from LinkedInWebScraper.job_scraper_config import JobScraperConfig
 from LinkedInWebScraper.job_scraper_config_factory import JobScraperConfigFactory
+from LinkedInWebScraper.utils import HttpFetcher
 from Utils.logger import Logger
 from Utils.file_manager import FileManager
 import pandas as pd
 
-def run_ds_daily_scraper(logger: Logger, openai_enabled: bool = True, position:str = 'Data Scientist', location:str = 'Monterrey', time_posted:str = 'DAY', file_name:str = None):
+def run_ds_daily_scraper(logger: Logger, openai_enabled: bool = True, position:str = 'Data Scientist', location:str = 'Monterrey', time_posted:str = 'DAY', file_name:str = None, incremental: bool = False, batch_size: int = None, dedupe_index_file: str = None, completion_cache_file: str = None):
     try:
         logger.log.info(f'Starting web scraping for {position} in {location}.')
 
         remote_types = ['REMOTE', 'HYBRID', 'ON-SITE']
         scraper_results = {}
 
-        for remote in remote_types:
-            config = JobScraperConfigFactory.create(position, location, openai_enabled, time_posted, remote)
-            scraper = LinkedInJobScraper(logger=logger, config=config)
-            scraper_results[f"scraper_{remote.lower()}"] = scraper.run()
+        file_manager_config = JobScraperConfig(position, location, remote='ALL')
+        file_manager = FileManager(logger, file_manager_config)
+        known_jobs_file = file_name if file_name != None else file_manager.generate_file_name()
+
+        # Share one pooled HTTP session across all remote types
+        with HttpFetcher(logger) as fetcher:
+            for remote in remote_types:
+                config = JobScraperConfigFactory.create(position, location, openai_enabled, time_posted, remote,
+                                                        incremental=incremental, known_jobs_file=known_jobs_file,
+                                                        dedupe_index_file=dedupe_index_file,
+                                                        completion_cache_file=completion_cache_file)
+                scraper = LinkedInJobScraper(logger=logger, config=config, fetcher=fetcher)
+                if batch_size:
+                    # Write each batch as soon as it is processed
+                    file_manager.stream_jobs_to_csv(scraper.stream(batch_size), file_name=known_jobs_file)
+                else:
+                    scraper_results[f"scraper_{remote.lower()}"] = scraper.run()
+
+        if batch_size:
+            return
 
         # Concatenate all the results into a single DataFrame
         df_remote = scraper_results.get('scraper_remote', pd.DataFrame())
@@ -25,8 +42,6 @@ def run_ds_daily_scraper(logger: Logger, openai_enabled: bool = True, position:s
         df_jobs_all = pd.concat([df_remote, df_hybrid, df_on_site], ignore_index=True)
 
         # Save to CSV
-        file_manager_config = JobScraperConfig(position, location, remote='ALL')
-        file_manager = FileManager(logger, file_manager_config)
         if file_name != None:
             file_manager.save_jobs_to_csv(df=df_jobs_all, file_name=file_name,append=True)
         else:
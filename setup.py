@@ -19,6 +19,11 @@ setup(
         'openai>=1.43.0',
         'python-dotenv>=1.0.1'
     ],
+    extras_require={
+        'lxml': ['lxml>=4.9.0'],
+        'pyarrow': ['pyarrow>=14.0.0'],
+        'polars': ['polars>=1.0.0'],
+    },
     python_requires='>=3.7',
     classifiers=[
         'Programming Language :: Python :: 3',
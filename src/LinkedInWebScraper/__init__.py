@@ -17,9 +17,19 @@ from .job_scraper_advanced_config import JobScraperAdvancedConfig
 from .linkedin_scraper import LinkedInJobScraper
 from .job_scraper import JobScraper
 from .job_description_processor import JobDescriptionProcessor
-from .job_data_cleaner import JobDataCleaner
+from .job_data_cleaner import JobDataCleaner, get_job_data_cleaner
+from .polars_job_data_cleaner import PolarsJobDataCleaner
 from .job_title_classifier import JobTitleClassifier
-from .utils import get_random_header, fetch_until_success 
+from .tech_stack_categorizer import TechStackCategorizer
+from .location_resolver import LocationResolver
+from .dedupe_index import DedupeIndex
+from .near_duplicate_index import NearDuplicateIndex
+from .completion_cache import CompletionCache
+from .batch_enrichment import BatchEnricher
+from .request_packer import RequestPacker
+from .description_trimmer import DescriptionTrimmer
+from .job_schema import JOB_SCHEMA, enforce_schema, memory_report
+from .utils import get_random_header, fetch_until_success, HttpFetcher
 
 __all__ = [
     'JobScraperConfig', 
@@ -29,9 +39,23 @@ __all__ = [
     'JobScraper',
     'JobDescriptionProcessor',
     'JobDataCleaner',
+    'PolarsJobDataCleaner',
+    'get_job_data_cleaner',
     'JobTitleClassifier',
+    'TechStackCategorizer',
+    'LocationResolver',
+    'DedupeIndex',
+    'NearDuplicateIndex',
+    'CompletionCache',
+    'BatchEnricher',
+    'RequestPacker',
+    'DescriptionTrimmer',
+    'JOB_SCHEMA',
+    'enforce_schema',
+    'memory_report',
     'get_random_header', 
     'fetch_until_success', 
+    'HttpFetcher',
     'OpenAIHandler',
     'TIME_POSTED_OPTION', 
     'REMOTE_OPTION', 
@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+
+from OpenAIHandler.openai_handler import BATCH_TERMINAL_STATUSES
+
+# Days a downloaded result waits for its posting to come back before it is dropped
+RESULT_TTL_DAYS = 7
+
+class BatchEnricher:
+    """
+    Enriches job descriptions through the OpenAI Batch API instead of synchronous chat completions.
+
+    The requests of all pending postings are serialized into one JSONL file and submitted as a
+    batch, which OpenAI processes within 24 hours at a lower price and outside the per-minute rate
+    limits. The submitted batches and the downloaded results are kept in a JSON state file, so a
+    run that stops waiting, or a process that restarts, resumes polling the same batches instead of
+    paying for the requests again. Results are keyed by JobID and handed out when the posting is
+    enriched again; postings whose request failed are submitted again by the next call.
+
+    Args:
+        openai_handler (OpenAIHandler): Handler building and submitting the requests.
+        logger (Logger): Logger instance.
+        state_file (str): JSON file persisting the submitted batches and their downloaded results.
+        poll_interval (float, optional): Seconds between two polls of the pending batches. Defaults to 30.
+        max_wait (float, optional): Seconds to wait for the batches of the requested postings before
+            returning the results available so far. Defaults to 3600.
+    """
+
+    def __init__(self, openai_handler, logger, state_file: str, poll_interval: float = 30, max_wait: float = 3600):
+        self.openai_handler = openai_handler
+        self.logger = logger
+        self.state_file = state_file
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+    def load_state(self) -> dict:
+        """Returns the persisted batches and results, empty if there is no state file yet."""
+        if not os.path.exists(self.state_file):
+            return {'batches': {}, 'results': {}}
+        with open(self.state_file, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        state.setdefault('batches', {})
+        state.setdefault('results', {})
+        return state
+
+    def save_state(self, state: dict):
+        """Write the state file atomically."""
+        temporary_path = f"{self.state_file}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(temporary_path, self.state_file)
+
+    def enrich(self, postings: dict) -> dict:
+        """
+        Returns the enrichment of the postings whose batch result is available.
+
+        Postings neither answered nor part of a pending batch are submitted in a new batch, then the
+        pending batches are polled until every requested posting has a result or `max_wait` elapses.
+
+        Args:
+            postings (dict): JobIDs mapped to their job description.
+
+        Returns:
+            dict: JobIDs mapped to their parsed enrichment. Postings still waiting for their batch are missing.
+        """
+        postings = {str(job_id): description for job_id, description in postings.items()}
+        with self._lock:
+            state = self.load_state()
+            self.poll(state)
+
+            submitted = {job_id for batch in state['batches'].values() for job_id in batch['job_ids']}
+            missing = {job_id: description for job_id, description in postings.items()
+                       if job_id not in state['results'] and job_id not in submitted}
+            if missing:
+                self.submit(state, missing)
+            self.save_state(state)
+
+            deadline = time.monotonic() + self.max_wait
+            while self.waiting_for(state, postings) and time.monotonic() < deadline:
+                time.sleep(max(0.0, min(self.poll_interval, deadline - time.monotonic())))
+                self.poll(state)
+                self.save_state(state)
+
+            enrichments = {job_id: state['results'].pop(job_id)['enrichment']
+                           for job_id in postings if job_id in state['results']}
+            self.save_state(state)
+
+        waiting = len(postings) - len(enrichments)
+        if waiting:
+            self.logger.log.info(f"{waiting} job descriptions are still waiting for their OpenAI batch.")
+        return enrichments
+
+    @staticmethod
+    def waiting_for(state: dict, postings: dict) -> bool:
+        """Returns whether a pending batch holds one of the postings."""
+        return any(job_id in postings for batch in state['batches'].values() for job_id in batch['job_ids'])
+
+    def submit(self, state: dict, postings: dict):
+        """Write the requests of the postings to a JSONL file, submit it and record the batch in the state."""
+        batch_file = f"{os.path.splitext(self.state_file)[0]}_{int(time.time() * 1000)}.jsonl"
+        with open(batch_file, 'w', encoding='utf-8') as file:
+            for job_id, description in postings.items():
+                request = self.openai_handler.create_batch_request(job_id, self.openai_handler.create_messages(description))
+                file.write(json.dumps(request) + '\n')
+
+        batch_id = self.openai_handler.submit_batch(batch_file, metadata={'prompt_version': self.openai_handler.prompt_version})
+        state['batches'][batch_id] = {
+            'job_ids': list(postings),
+            'batch_file': batch_file,
+            'model': self.openai_handler.model,
+            'prompt_version': self.openai_handler.prompt_version,
+            'submitted_at': time.time(),
+        }
+        self.logger.log.info(f"Submitted {len(postings)} job descriptions in OpenAI batch {batch_id}.")
+
+    def poll(self, state: dict):
+        """Refresh the pending batches, moving the results of the finished ones into the state."""
+        now = time.time()
+        for batch_id, entry in list(state['batches'].items()):
+            batch = self.openai_handler.retrieve_batch(batch_id)
+            if batch.status not in BATCH_TERMINAL_STATUSES:
+                continue
+
+            results, errors = self.openai_handler.download_batch_results(batch)
+            if (entry['model'], entry['prompt_version']) != (self.openai_handler.model, self.openai_handler.prompt_version):
+                # The prompt or model changed since the submission, the postings will be submitted again
+                self.logger.log.warning(f"Discarding OpenAI batch {batch_id}, submitted with another prompt or model.")
+                results = {}
+            for job_id, enrichment in results.items():
+                state['results'][job_id] = {'enrichment': enrichment, 'stored_at': now}
+            if errors:
+                self.logger.log.warning(f"OpenAI batch {batch_id} failed for {len(errors)} job descriptions, "
+                                        f"they will be submitted again.")
+            self.logger.log.info(f"OpenAI batch {batch_id} {batch.status} with {len(results)} results.")
+
+            del state['batches'][batch_id]
+            if os.path.exists(entry['batch_file']):
+                os.remove(entry['batch_file'])
+
+        expired = [job_id for job_id, result in state['results'].items()
+                   if now - result['stored_at'] > RESULT_TTL_DAYS * 86400]
+        for job_id in expired:
+            del state['results'][job_id]
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+
+# Accessed entries whose new access time is written in one statement
+TOUCH_BATCH_SIZE = 256
+
+class CompletionCache:
+    """
+    A persistent, size-bounded cache of parsed chat completions stored in SQLite.
+
+    Entries are content-addressed: the key hashes the normalized job description together with
+    the version stamp of the prompt and the model name, so reposts, the same posting seen under
+    several remote filters and reruns after a crash share one completion, while a prompt or model
+    change never serves a stale one. The least recently used entries are evicted once the stored
+    completions grow beyond `max_size_mb`. Access times are written in batches, so a hit is a
+    single primary key lookup.
+
+    Args:
+        path (str): Path of the SQLite cache file.
+        max_size_mb (int or float, optional): Maximum size of the stored completions. Defaults to 64.
+    """
+
+    def __init__(self, path: str, max_size_mb: float = 64):
+        self.path = path
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+        self._touched = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, prompt_version TEXT NOT NULL, model TEXT NOT NULL, completion TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS completions_accessed_at ON completions (accessed_at)")
+        self._connection.commit()
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+
+    @staticmethod
+    def normalize_description(description) -> str:
+        """Normalize a description so copies differing only in Unicode form or whitespace share an entry."""
+        return ' '.join(unicodedata.normalize('NFKC', str(description)).split())
+
+    @classmethod
+    def key(cls, description, prompt_version: str, model: str) -> str:
+        """Returns the cache key of a description enriched with the given prompt version and model."""
+        content = f"{prompt_version}\x1f{model}\x1f{cls.normalize_description(description)}"
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, description, prompt_version: str, model: str):
+        """
+        Look up the cached completion of a description.
+
+        Returns:
+            dict or None: The parsed completion, or None on a miss.
+        """
+        key = self.key(description, prompt_version, model)
+        with self._lock:
+            row = self._connection.execute("SELECT completion FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH_SIZE:
+                self._flush_touched()
+                self._connection.commit()
+
+        return json.loads(row[0])
+
+    def put(self, description, prompt_version: str, model: str, completion: dict):
+        """Store the parsed completion of a description, evicting old entries if the cache is full."""
+        key = self.key(description, prompt_version, model)
+        value = json.dumps(completion, ensure_ascii=False)
+        size = len(value.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM completions WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO completions (key, prompt_version, model, completion, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, prompt_version, model, value, now, now, size)
+            )
+            self._touched.pop(key, None)
+            self._size += size - (previous[0] if previous else 0)
+            self._flush_touched()
+            self._evict()
+            self._connection.commit()
+
+    def _flush_touched(self):
+        """Write the pending access times of the entries read since the last flush."""
+        if self._touched:
+            self._connection.executemany("UPDATE completions SET accessed_at = ? WHERE key = ?",
+                                         [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        """Delete the least recently used entries until the cache is back under its size limit."""
+        if self._size <= self.max_size:
+            return
+
+        target = int(self.max_size * 0.9)
+        rows = self._connection.execute("SELECT key, size FROM completions ORDER BY accessed_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._connection.executemany("DELETE FROM completions WHERE key = ?", evicted)
+
+    def invalidate(self, prompt_version: str = None, model: str = None, keep_prompt_versions: tuple = None) -> int:
+        """
+        Delete cached completions, typically after the prompt changed.
+
+        Args:
+            prompt_version (str, optional): Only delete the entries of this prompt version.
+            model (str, optional): Only delete the entries of this model.
+            keep_prompt_versions (tuple, optional): Delete every entry except those of these prompt versions.
+
+        Returns:
+            int: The number of deleted entries. Without any filter, every entry is deleted.
+        """
+        conditions, parameters = [], []
+        if prompt_version is not None:
+            conditions.append("prompt_version = ?")
+            parameters.append(prompt_version)
+        if model is not None:
+            conditions.append("model = ?")
+            parameters.append(model)
+        if keep_prompt_versions is not None:
+            conditions.append(f"prompt_version NOT IN ({', '.join('?' * len(keep_prompt_versions))})")
+            parameters.extend(keep_prompt_versions)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            self._flush_touched()
+            deleted = self._connection.execute(f"DELETE FROM completions{where}", parameters).rowcount
+            self._connection.commit()
+            self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+        return deleted
+
+    def versions(self) -> list:
+        """Returns (prompt_version, model, entries) for each prompt version and model stored."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT prompt_version, model, COUNT(*) FROM completions GROUP BY prompt_version, model ORDER BY 1, 2"
+            ).fetchall()
+
+    def stats(self) -> dict:
+        """Returns the hit and miss counters of this cache instance."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'size_bytes': self._size
+        }
+
+    def log_stats(self, logger):
+        """Log the cache hit and miss counters."""
+        stats = self.stats()
+        logger.log.info(f"Completion cache: {stats['hits']} hits, {stats['misses']} misses "
+                        f"(hit rate {stats['hit_rate']:.1%}, {stats['size_bytes'] / 1024 / 1024:.1f} MB stored).")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def close(self):
+        """Write the pending access times and close the underlying SQLite connection."""
+        with self._lock:
+            self._flush_touched()
+            self._connection.commit()
+            self._connection.close()
@@ -0,0 +1,50 @@
+"""
+Inspect and invalidate the OpenAI completion cache, typically after the prompt changed.
+
+Usage:
+    python -m LinkedInWebScraper.completion_cache_cli stats completions.sqlite
+    python -m LinkedInWebScraper.completion_cache_cli invalidate completions.sqlite --stale
+    python -m LinkedInWebScraper.completion_cache_cli invalidate completions.sqlite --prompt-version 1a2b3c4d5e6f
+"""
+import argparse
+
+from LinkedInWebScraper.completion_cache import CompletionCache
+from OpenAIHandler.openai_handler import PACKED_PROMPT_VERSION, PROMPT_VERSION
+
+# Single and packed requests store their completions under the version of their own prompt
+CURRENT_PROMPT_VERSIONS = (PROMPT_VERSION, PACKED_PROMPT_VERSION)
+
+def main(argv: list = None):
+    """Command line entry point: print the cache contents or invalidate entries."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    stats_parser = commands.add_parser('stats', help='Print the entries stored per prompt version and model.')
+    stats_parser.add_argument('path', help='Path of the SQLite cache file.')
+
+    invalidate_parser = commands.add_parser('invalidate', help='Delete cached completions.')
+    invalidate_parser.add_argument('path', help='Path of the SQLite cache file.')
+    selection = invalidate_parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument('--stale', action='store_true', help='Delete the entries of every prompt version but the current ones.')
+    selection.add_argument('--prompt-version', help='Delete the entries of this prompt version.')
+    selection.add_argument('--all', action='store_true', help='Delete every entry.')
+    invalidate_parser.add_argument('--model', help='Only delete the entries of this model.')
+
+    args = parser.parse_args(argv)
+    cache = CompletionCache(args.path)
+    try:
+        if args.command == 'stats':
+            print(f"Current prompt versions: {PROMPT_VERSION} (single), {PACKED_PROMPT_VERSION} (packed)")
+            for prompt_version, model, entries in cache.versions():
+                current = ' (current)' if prompt_version in CURRENT_PROMPT_VERSIONS else ''
+                print(f"{prompt_version}{current}  {model}  {entries} entries")
+            print(f"{len(cache)} entries, {cache.stats()['size_bytes'] / 1024 / 1024:.1f} MB")
+        else:
+            deleted = cache.invalidate(prompt_version=args.prompt_version, model=args.model,
+                                       keep_prompt_versions=CURRENT_PROMPT_VERSIONS if args.stale else None)
+            print(f"Deleted {deleted} cached completions.")
+    finally:
+        cache.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from LinkedInWebScraper.sqlite_keys import hash_key, select_keys
+
+class DedupeIndex:
+    """
+    A persistent index of the postings already processed, shared by every run, city and remote type.
+
+    Each posting is stored twice, under the hash of its JobID and under the hash of its
+    (Location, Title, Company) listing, so a posting republished under a new JobID is caught as
+    well. Keys are 64-bit hashes in an integer primary key, so a lookup is a single B-tree probe
+    and the file stays small without loading any historical CSV. Entries older than
+    `max_age_days` no longer count as seen and are purged when the index is opened.
+
+    Args:
+        path (str): Path of the SQLite index file.
+        max_age_days (int or float, optional): Days after which a posting counts as new again.
+            Defaults to None (entries never expire).
+    """
+
+    def __init__(self, path: str, max_age_days: float = None):
+        self.path = path
+        self.max_age_days = max_age_days
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS seen_postings (key INTEGER PRIMARY KEY, seen_at REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS seen_postings_seen_at ON seen_postings (seen_at)")
+        self._connection.commit()
+        self.purge_expired()
+
+    @staticmethod
+    def job_id_key(job_id) -> int:
+        """Returns the index key of a JobID."""
+        return hash_key(f'job:{job_id}')
+
+    @staticmethod
+    def listing_key(location, title, company) -> int:
+        """Returns the index key of a (Location, Title, Company) listing."""
+        return hash_key(f'listing:{location}\x1f{title}\x1f{company}')
+
+    def _cutoff(self) -> float:
+        """Returns the timestamp before which entries are expired."""
+        return time.time() - self.max_age_days * 86400 if self.max_age_days is not None else float('-inf')
+
+    def _keys(self, df_jobs: pd.DataFrame) -> tuple:
+        job_keys = [self.job_id_key(job_id) for job_id in df_jobs['JobID']]
+        listing_keys = [self.listing_key(*listing) for listing in zip(df_jobs['Location'], df_jobs['Title'], df_jobs['Company'])]
+        return job_keys, listing_keys
+
+    def seen_keys(self, keys) -> set:
+        """Returns the given keys that are in the index and not expired."""
+        cutoff = self._cutoff()
+        with self._lock:
+            return select_keys(self._connection, "SELECT key FROM seen_postings WHERE seen_at >= ? AND key IN ({placeholders})",
+                               keys, (cutoff,))
+
+    def seen_mask(self, df_jobs: pd.DataFrame) -> np.ndarray:
+        """
+        Flag the jobs whose JobID or listing was already recorded.
+
+        Args:
+            df_jobs (pd.DataFrame): Jobs with JobID, Location, Title and Company columns.
+
+        Returns:
+            np.ndarray: A boolean array, True for the jobs seen before.
+        """
+        job_keys, listing_keys = self._keys(df_jobs)
+        seen = self.seen_keys(job_keys + listing_keys)
+        return np.array([job_key in seen or listing_key in seen for job_key, listing_key in zip(job_keys, listing_keys)],
+                        dtype=bool)
+
+    def add(self, df_jobs: pd.DataFrame):
+        """Record the JobIDs and listings of processed jobs. Expired entries are renewed, fresh ones keep their date."""
+        job_keys, listing_keys = self._keys(df_jobs)
+        now = time.time()
+        cutoff = self._cutoff()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT INTO seen_postings (key, seen_at) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET seen_at = excluded.seen_at WHERE seen_postings.seen_at < ?",
+                [(key, now, cutoff) for key in job_keys + listing_keys]
+            )
+            self._connection.commit()
+
+    def purge_expired(self) -> int:
+        """Delete the expired entries and return how many were deleted."""
+        if self.max_age_days is None:
+            return 0
+        with self._lock:
+            deleted = self._connection.execute("DELETE FROM seen_postings WHERE seen_at < ?", (self._cutoff(),)).rowcount
+            self._connection.commit()
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM seen_postings").fetchone()[0]
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
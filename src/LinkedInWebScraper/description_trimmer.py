@@ -0,0 +1,234 @@
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken is an optional dependency
+    tiktoken = None
+
+from LinkedInWebScraper.sqlite_keys import hash_key, select_keys
+from OpenAIHandler.openai_handler import DEFAULT_MODEL
+
+# Sentences ending with terminal punctuation followed by whitespace
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Sentences carrying the fields the enrichment extracts are never stripped, however common they are
+REQUIREMENT_PATTERN = re.compile(
+    r'\d|\b(?:years?|experience|degree|bachelor|master|english|años|experiencia|licenciatura|inglés|ingles)\b',
+    re.IGNORECASE
+)
+
+class DescriptionTrimmer:
+    """
+    Shrinks job descriptions before they are sent for enrichment.
+
+    Company blurbs, benefit lists and equal-opportunity statements are repeated word for word
+    across the postings of a company, and often across companies, while the extraction prompt
+    ignores them. The trimmer keeps a persistent index of how many distinct postings contained
+    each sentence; a sentence seen in at least `min_postings` of them is boilerplate and is
+    stripped, unless it is shorter than `min_words` words or mentions years, experience, degrees
+    or English. The remaining sentences are then capped to `max_tokens`, keeping them in order.
+    Tokens are counted with tiktoken when it is installed and its encoding can be loaded, otherwise
+    estimated at four characters per token.
+
+    Args:
+        path (str, optional): Path of the SQLite sentence index. Defaults to ':memory:' (counts kept for this process only).
+        min_postings (int, optional): Distinct postings containing a sentence before it counts as boilerplate. Defaults to 5.
+        min_words (int, optional): Minimum number of words of a strippable sentence. Defaults to 8.
+        max_tokens (int, optional): Maximum tokens of a trimmed description. Defaults to None (no cap).
+        model (str, optional): Model whose tokenizer counts the tokens. Defaults to DEFAULT_MODEL.
+        encoding (optional): The tiktoken encoding counting the tokens, or None to estimate them from the length.
+            Defaults to 'auto' (the encoding of `model`, when it can be loaded).
+        logger (Logger, optional): Logger warned when the tiktoken encoding cannot be loaded. Defaults to None.
+    """
+
+    def __init__(self, path: str = ':memory:', min_postings: int = 5, min_words: int = 8, max_tokens: int = None,
+                 model: str = DEFAULT_MODEL, encoding='auto', logger=None):
+        self.path = path
+        self.min_postings = min_postings
+        self.min_words = min_words
+        self.max_tokens = max_tokens
+        self.logger = logger
+        self.encoding = self._encoding(model) if encoding == 'auto' else encoding
+        self.descriptions = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self.sentences_stripped = 0
+        self.truncated = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS postings (key INTEGER PRIMARY KEY)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sentences (key INTEGER PRIMARY KEY, postings INTEGER NOT NULL, last_seen REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def _encoding(self, model: str):
+        """Returns the tiktoken encoding of a model, or None when tiktoken is not installed or cannot load it."""
+        if tiktoken is None:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding('o200k_base')
+        except Exception as e:
+            # tiktoken downloads its BPE files on first use, which fails on offline or firewalled hosts
+            if self.logger is not None:
+                self.logger.log.warning(f"Failed to load the tiktoken encoding of {model}, "
+                                        f"estimating four characters per token instead: {e}")
+            return None
+
+    @staticmethod
+    def sentence_key(sentence: str) -> int:
+        """Returns the index key of a sentence, insensitive to case, Unicode form and whitespace."""
+        return hash_key(' '.join(unicodedata.normalize('NFKC', sentence).casefold().split()))
+
+    @staticmethod
+    def split_sentences(text: str) -> list:
+        """Split a description into its sentences."""
+        return [sentence for sentence in SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
+    def count_tokens(self, text: str) -> int:
+        """Returns the tokens of a text for the configured model."""
+        if self.encoding is not None:
+            return len(self.encoding.encode(text))
+        return (len(text) + 3) // 4
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text to its first `max_tokens` tokens."""
+        if self.encoding is not None:
+            return self.encoding.decode(self.encoding.encode(text)[:max_tokens])
+        return text[:max_tokens * 4]
+
+    def strippable(self, sentence: str) -> bool:
+        """Returns whether a sentence may be stripped when it is common, i.e. it is long and holds no requirement."""
+        return len(sentence.split()) >= self.min_words and not REQUIREMENT_PATTERN.search(sentence)
+
+    def observe(self, postings: dict):
+        """
+        Count the sentences of postings not recorded yet, once per posting.
+
+        Args:
+            postings (dict): Posting keys mapped to the keys of their distinct sentences.
+        """
+        now = time.time()
+        with self._lock:
+            recorded = select_keys(self._connection, "SELECT key FROM postings WHERE key IN ({placeholders})", postings)
+            new = [key for key in postings if key not in recorded]
+            self._connection.executemany("INSERT INTO postings (key) VALUES (?)", [(key,) for key in new])
+            self._connection.executemany(
+                "INSERT INTO sentences (key, postings, last_seen) VALUES (?, 1, ?) "
+                "ON CONFLICT (key) DO UPDATE SET postings = postings + 1, last_seen = excluded.last_seen",
+                [(sentence_key, now) for key in new for sentence_key in postings[key]]
+            )
+            self._connection.commit()
+
+    def boilerplate_keys(self, keys) -> set:
+        """Returns the given sentence keys seen in at least `min_postings` postings."""
+        with self._lock:
+            return select_keys(self._connection, "SELECT key FROM sentences WHERE postings >= ? AND key IN ({placeholders})",
+                               keys, (self.min_postings,))
+
+    def trim_descriptions(self, job_ids: list, descriptions: list) -> list:
+        """
+        Returns the descriptions without boilerplate sentences and within the token budget.
+
+        The sentences of the given postings are counted first, so boilerplate shared by the postings
+        of a single run is already stripped. A description made only of boilerplate is kept whole.
+
+        Args:
+            job_ids (list): JobIDs of the postings. A posting without JobID is identified by its description.
+            descriptions (list): The job descriptions, aligned with `job_ids`.
+
+        Returns:
+            list: The trimmed descriptions, in order. Missing descriptions are returned unchanged.
+        """
+        split = {}
+        postings = {}
+        for position, (job_id, description) in enumerate(zip(job_ids, descriptions)):
+            if not isinstance(description, str) or description == 'N/A':
+                continue
+            sentences = self.split_sentences(description)
+            keys = [self.sentence_key(sentence) for sentence in sentences]
+            split[position] = (sentences, keys)
+            posting_key = hash_key(f'job:{job_id}' if job_id is not None else f'text:{description}')
+            postings[posting_key] = set(keys)
+
+        self.observe(postings)
+        boilerplate = self.boilerplate_keys(key for _, keys in split.values() for key in keys)
+
+        trimmed = list(descriptions)
+        stripped = 0
+        tokens_before = 0
+        tokens_after = 0
+        truncated = 0
+        for position, (sentences, keys) in split.items():
+            kept = [sentence for sentence, key in zip(sentences, keys) if key not in boilerplate or not self.strippable(sentence)]
+            if not kept:
+                kept = sentences
+            stripped += len(sentences) - len(kept)
+
+            text = ' '.join(kept)
+            if self.max_tokens is not None and self.count_tokens(text) > self.max_tokens:
+                text = self.cap(kept)
+                truncated += 1
+
+            tokens_before += self.count_tokens(descriptions[position])
+            tokens_after += self.count_tokens(text)
+            trimmed[position] = text
+
+        with self._lock:
+            self.descriptions += len(split)
+            self.tokens_before += tokens_before
+            self.tokens_after += tokens_after
+            self.sentences_stripped += stripped
+            self.truncated += truncated
+        return trimmed
+
+    def cap(self, sentences: list) -> str:
+        """Returns the leading sentences fitting in `max_tokens`, cutting the first one if it exceeds the budget alone."""
+        kept, tokens = [], 0
+        for sentence in sentences:
+            sentence_tokens = self.count_tokens(sentence)
+            if tokens + sentence_tokens > self.max_tokens:
+                break
+            kept.append(sentence)
+            tokens += sentence_tokens
+        if not kept:
+            return self.truncate(sentences[0], self.max_tokens)
+        return ' '.join(kept)
+
+    def stats(self) -> dict:
+        """Returns the descriptions trimmed and the tokens saved since the trimmer was created."""
+        with self._lock:
+            saved = self.tokens_before - self.tokens_after
+            return {
+                'descriptions': self.descriptions,
+                'tokens_before': self.tokens_before,
+                'tokens_after': self.tokens_after,
+                'tokens_saved': saved,
+                'saved_rate': round(saved / self.tokens_before, 3) if self.tokens_before else 0.0,
+                'sentences_stripped': self.sentences_stripped,
+                'truncated': self.truncated
+            }
+
+    def log_stats(self, logger):
+        """Log the tokens saved by trimming the descriptions."""
+        stats = self.stats()
+        logger.log.info(f"Description trimming: {stats['tokens_saved']} of {stats['tokens_before']} tokens saved "
+                        f"({stats['saved_rate']:.1%}), {stats['sentences_stripped']} boilerplate sentences stripped, "
+                        f"{stats['truncated']} descriptions capped.")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
@@ -1,19 +1,25 @@
+import numpy as np
 import pandas as pd
 import re
-from datetime import datetime, timedelta
 
+from LinkedInWebScraper.location_resolver import LocationResolver
+from LinkedInWebScraper.tech_stack_categorizer import TechStackCategorizer
 from Utils.constants import LOCATION_MAPPING, TECH_STACK_CATEGORIES
 
 class JobDataCleaner:
-    def __init__(self, logger):
+    def __init__(self, logger, location_cache_file: str = None):
         self.logger = logger
+        self.location_cache_file = location_cache_file
+        self._location_resolver = None
+        self._tech_stack_categorizer = None
+        self._tech_stack_categories = None
 
     def clean_jobs_dataframe(self, df, location_mapping) ->pd.DataFrame:
         """Main method to clean and preprocess the job DataFrame."""
         self.logger.log.info("Starting data cleaning process.")
 
         if location_mapping != None:
-            df = self.process_location_data(df)
+            df = self.process_location_data(df, location_mapping)
 
         df = self.process_urls_and_job_ids(df)
 
@@ -26,35 +32,56 @@ class JobDataCleaner:
         self.logger.log.info("Data cleaning process completed.")
         return df
 
-    def process_location_data(self, df):
+    def get_location_resolver(self, location_mapping: dict) -> LocationResolver:
+        """Returns the LocationResolver of a mapping, built once and reused while the mapping stays the same."""
+        if self._location_resolver is None or self._location_resolver.location_mapping is not location_mapping:
+            self._location_resolver = LocationResolver(location_mapping, cache_file=self.location_cache_file)
+        return self._location_resolver
+
+    def process_location_data(self, df, location_mapping: dict = LOCATION_MAPPING):
         """Clean the Location column and apply location-specific transformations."""
-        self.logger.log.info(f"Initial unique locations: {df['Location'].nunique()}")
+        resolver = self.get_location_resolver(location_mapping)
+
+        # Resolve each distinct location once, then broadcast the result back to the rows
+        codes, unique_locations = pd.factorize(df['Location'])
+        self.logger.log.info(f"Initial unique locations: {len(unique_locations)}")
 
-        df['Location'] = df['Location'].apply(lambda x: x.split(',')[0])
+        cities = pd.Series(unique_locations, dtype=object).str.split(',', n=1).str[0]
+        mapped_cities = pd.Series(resolver.resolve_all(unique_locations), index=cities.index, dtype=object)
+        resolver.save()
 
-        unmatched_locations = df[~df['Location'].isin(LOCATION_MAPPING.keys())]['Location'].unique()
+        unmatched_locations = cities[mapped_cities.isna()].unique()
         self.logger.log.info(f"Unique 'Other' locations before mapping: {unmatched_locations}")
 
-        df['Location'] = df['Location'].apply(lambda loc: LOCATION_MAPPING.get(loc, 'Other'))
+        # The extra trailing 'Other' is picked by the -1 code factorize gives to missing locations
+        mapped_locations = np.append(mapped_cities.fillna('Other').to_numpy(dtype=object), 'Other')
+        area_codes, areas = pd.factorize(pd.Index(mapped_locations))
+        row_area_codes = area_codes[codes]
 
-        other_count = df[df['Location'] == 'Other'].shape[0]
-        self.logger.log.info(f"Found {other_count} 'Other' locations. Dropping them.")
+        is_other = row_area_codes == areas.get_loc('Other')
+        self.logger.log.info(f"Found {int(is_other.sum())} 'Other' locations. Dropping them.")
 
-        df = df[df['Location'] != 'Other']
+        df = df[~is_other]
 
-        # Convert Location column to a categorical datatype
-        df['Location'] = df['Location'].astype('category')
+        # Build the categorical Location column straight from the codes, with the sorted
+        # categories `astype('category')` would give
+        kept_codes = row_area_codes[~is_other]
+        present = np.bincount(kept_codes, minlength=len(areas)) > 0
+        categories = areas[present].sort_values()
+        df['Location'] = pd.Categorical.from_codes(categories.get_indexer(areas)[kept_codes], categories=categories)
 
-        self.logger.log.info(f"Locations after renaming and dropping 'Other': {df['Location'].nunique()} unique values.")
+        self.logger.log.info(f"Locations after renaming and dropping 'Other': {len(categories)} unique values.")
         return df
 
     def process_urls_and_job_ids(self, df):
         """Truncate URLs and extract JobIDs from the URLs."""
         self.logger.log.info("Processing URLs and extracting JobIDs.")
 
-        df['Url'] = df['Url'].apply(lambda url: url.split('?position')[0])
+        # Comprehensions over the raw values beat both `apply` and the `.str` accessor on Python-backed strings
+        urls = [url.split('?position', 1)[0] for url in df['Url'].to_numpy(dtype=object)]
+        df['Url'] = pd.Series(urls, index=df.index, dtype=df['Url'].dtype)
 
-        df['JobID'] = df['Url'].apply(lambda url: url[-10:])
+        df['JobID'] = pd.Series([url[-10:] for url in urls], index=df.index, dtype=df['Url'].dtype)
 
         return df
 
@@ -63,7 +90,10 @@ class JobDataCleaner:
         original_count = df.shape[0]
 
         df = df[df['JobID'].notna()]
-        df = df[df['JobID'].apply(lambda x: re.fullmatch(r'\d{10}', str(x)) is not None)]
+
+        # Same as re.fullmatch(r'\d{10}'): \d matches exactly the characters str.isdecimal accepts
+        job_ids = df['JobID'].astype(str)
+        df = df[((job_ids.str.len() == 10) & job_ids.str.isdecimal()).astype(bool)]
 
         filtered_count = df.shape[0]
         removed_count = original_count - filtered_count
@@ -92,42 +122,50 @@ class JobDataCleaner:
 
         return df
 
-    def clean_extracted_job_data(self, df_jobs):
-        """Master function to clean and process extracted enriched job data."""
+    def clean_extracted_job_data(self, df_jobs, reference_time=None):
+        """
+        Master function to clean and process extracted enriched job data.
+
+        Args:
+            df_jobs (pd.DataFrame): The jobs with their fetched details.
+            reference_time (pd.Timestamp, optional): Moment the posted times are relative to, shared by every
+                batch of a run. Defaults to now.
+        """
         df_jobs = self.clean_num_applicants(df_jobs)
         df_jobs = self.clean_seniority_level(df_jobs)
         df_jobs = self.standardize_employment_type(df_jobs)
         df_jobs = self.standardize_job_function(df_jobs)
         df_jobs = self.split_job_functions(df_jobs)
-        df_jobs = self.convert_posted_time(df_jobs)
+        df_jobs = self.convert_posted_time(df_jobs, reference_time)
         df_jobs = self.reorder_columns(df_jobs)
         return df_jobs
 
-    def clean_num_applicants(self, df_jobs):
-        """Clean and standardize the number of applicants."""
-
-        def extract_num_applicants(text):
-            match = re.search(r'\d+', text)
-            if match:
-                return int(match.group())
-            elif "Be among the first 25" in text:
-                return 25
-            elif "Over 200 applicants" in text:
-                return 200
-            return 'N/A'
+    SENIORITY_LEVELS = ['Entry level', 'Mid-Senior level', 'Executive', 'N/A', 'Associate', 'Internship']
 
+    JOB_FUNCTION_REPLACEMENTS = {
+        'Research and Design': 'R&D',
+        'Design and Product Management': 'Product Management'
+    }
+
+    def clean_num_applicants(self, df_jobs):
+        """Clean and standardize the number of applicants as a nullable Int16 column."""
         self.logger.log.info("Cleaning the 'NumApplicants' column.")
-        df_jobs['NumApplicants'] = df_jobs['NumApplicants'].apply(extract_num_applicants)
+
+        # 'Be among the first 25' and 'Over 200 applicants' carry their count, so the first number is enough
+        num_applicants = pd.to_numeric(df_jobs['NumApplicants'].astype(object).str.extract(r'(\d+)', expand=False))
+        num_applicants = num_applicants.where(num_applicants <= np.iinfo(np.int16).max)
+        df_jobs['NumApplicants'] = num_applicants.astype('Int16')
         return df_jobs
 
     def clean_seniority_level(self, df_jobs):
         """Clean up the 'SeniorityLevel' column."""
         self.logger.log.info("Cleaning the 'SeniorityLevel' column.")
-        df_jobs['SeniorityLevel'] = df_jobs['SeniorityLevel'].apply(
-            lambda x: 'N/A' if 'Not Applicable' in x else x
-        )
-        seniority_categories = ['Entry level', 'Mid-Senior level', 'Executive', 'N/A', 'Associate', 'Internship']
-        df_jobs['SeniorityLevel'] = pd.Categorical(df_jobs['SeniorityLevel'], categories=seniority_categories)
+        seniority_levels = df_jobs['SeniorityLevel'].astype(object)
+        not_applicable = seniority_levels.str.contains('Not Applicable', regex=False).astype(bool)
+        seniority_levels = seniority_levels.mask(not_applicable, 'N/A')
+        # Levels outside the categories become missing, as pd.Categorical would do implicitly
+        seniority_levels = seniority_levels.where(seniority_levels.isin(self.SENIORITY_LEVELS))
+        df_jobs['SeniorityLevel'] = pd.Categorical(seniority_levels, categories=self.SENIORITY_LEVELS)
         return df_jobs
 
     def standardize_employment_type(self, df_jobs):
@@ -137,80 +175,70 @@ class JobDataCleaner:
         return df_jobs
 
     def standardize_job_function(self, df_jobs):
-        """Standardize the 'JobFunction' column."""
-
-        def standardize_job_function(text):
-            if ' and ' in text:
-                text = text.replace(' and ', ', ')
-            job_functions = text.split(', ')
-            if len(job_functions) > 3:
-                job_functions = job_functions[:3]
-            return ', '.join(job_functions)
-
+        """Standardize the 'JobFunction' column, keeping at most three functions per job."""
         self.logger.log.info("Standardizing the 'JobFunction' column.")
-        df_jobs['JobFunction'] = df_jobs['JobFunction'].replace({
-        'Research and Design': 'R&D',
-        'Design and Product Management': 'Product Management'
-        }, regex=False)
+        job_functions = df_jobs['JobFunction'].replace(self.JOB_FUNCTION_REPLACEMENTS, regex=False)
 
-        df_jobs['JobFunction'] = df_jobs['JobFunction'].apply(standardize_job_function)
+        # Standardize each distinct text once, then broadcast the result back to the rows
+        codes, unique_job_functions = pd.factorize(job_functions)
+        standardized = (pd.Series(unique_job_functions, dtype=object)
+                        .str.replace(' and ', ', ', regex=False)
+                        .str.split(', ', n=3).str[:3].str.join(', '))
+
+        df_jobs['JobFunction'] = pd.Series(np.append(standardized.to_numpy(dtype=object), None)[codes],
+                                           index=df_jobs.index, dtype=df_jobs['JobFunction'].dtype)
         return df_jobs
 
     def split_job_functions(self, df_jobs):
         """Split 'JobFunction' into three separate columns."""
-
-        def split_job_functions(text):
-            job_functions = text.split(', ')
-            job_function_1 = job_functions[0] if len(job_functions) > 0 else None
-            job_function_2 = job_functions[1] if len(job_functions) > 1 else None
-            job_function_3 = job_functions[2] if len(job_functions) > 2 else None
-            return pd.Series([job_function_1, job_function_2, job_function_3])
-
         self.logger.log.info("Splitting 'JobFunction' into three separate columns.")
-        df_jobs[['JobFunction1', 'JobFunction2', 'JobFunction3']] = df_jobs['JobFunction'].apply(split_job_functions)
+        codes, unique_job_functions = pd.factorize(df_jobs['JobFunction'])
+        parts = pd.Series(unique_job_functions, dtype=object).str.split(', ', n=3, expand=True)
 
-        # Fill any None values with 'N/A'
-        df_jobs['JobFunction1'] = df_jobs['JobFunction1'].fillna('N/A')
-        df_jobs['JobFunction2'] = df_jobs['JobFunction2'].fillna('N/A')
-        df_jobs['JobFunction3'] = df_jobs['JobFunction3'].fillna('N/A')
+        # Jobs with fewer than three functions get 'N/A' in the missing columns
+        parts = parts.reindex(columns=range(3)).fillna('N/A')
 
         # Extract unique job function categories
-        job_function_categories = list(set(
-            df_jobs['JobFunction1'].unique().tolist() +
-            df_jobs['JobFunction2'].unique().tolist() +
-            df_jobs['JobFunction3'].unique().tolist()
-        ))
+        job_function_categories = pd.Index(sorted(pd.unique(parts.to_numpy(dtype=object).ravel())))
 
-        # Convert the new columns to categorical data types
-        df_jobs['JobFunction1'] = pd.Categorical(df_jobs['JobFunction1'], categories=job_function_categories)
-        df_jobs['JobFunction2'] = pd.Categorical(df_jobs['JobFunction2'], categories=job_function_categories)
-        df_jobs['JobFunction3'] = pd.Categorical(df_jobs['JobFunction3'], categories=job_function_categories)
+        # Convert the new columns to categorical data types, broadcasting the distinct texts back to the rows
+        for position, column in enumerate(['JobFunction1', 'JobFunction2', 'JobFunction3']):
+            category_codes = np.append(job_function_categories.get_indexer(parts[position]), -1)
+            df_jobs[column] = pd.Categorical.from_codes(category_codes[codes], categories=job_function_categories)
 
         # Drop the original 'JobFunction' column since it's no longer needed
         df_jobs.drop(columns=['JobFunction'], inplace=True)
         return df_jobs
 
-    def convert_posted_time(self, df_jobs):
-        """Convert 'PostedTime' into days since the job was posted."""
-
-        def convert_posted_time(text):
-            today = datetime.today()
-
-            if 'hour' in text:
-                return today
-            if 'day' in text:
-                days = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
-                return today - timedelta(days=days)
-            if 'week' in text:
-                weeks = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
-                return today - timedelta(days=weeks * 7)
-            if 'month' in text:
-                months = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
-                return today - timedelta(days=months * 30)
-            return 'N/A'
+    # Days subtracted per unit of a relative posted time; hours count as posted today
+    POSTED_TIME_UNIT_DAYS = {'hour': 0, 'day': 1, 'week': 7, 'month': 30}
+
+    def convert_posted_time(self, df_jobs, reference_time=None):
+        """
+        Convert the relative 'PostedTime' text into a 'DatePosted' timestamp column.
 
+        The number and unit of every row are pulled with one `str.extract` and turned into a
+        timedelta, so every row is dated against the same reference clock. A missing number
+        counts as 1, and texts without a known unit become NaT.
+
+        Args:
+            df_jobs (pd.DataFrame): DataFrame with a 'PostedTime' column such as '3 days ago'.
+            reference_time (pd.Timestamp, optional): Moment the times are relative to. Defaults to now.
+
+        Returns:
+            pd.DataFrame: DataFrame with 'PostedTime' replaced by a datetime64[ns] 'DatePosted' column.
+        """
         self.logger.log.info("Converting 'PostedTime' to DatePosted.")
-        df_jobs['PostedTime'] = df_jobs['PostedTime'].apply(convert_posted_time)
+        reference_time = pd.Timestamp.now() if reference_time is None else pd.Timestamp(reference_time)
+
+        units = '|'.join(self.POSTED_TIME_UNIT_DAYS)
+        parts = df_jobs['PostedTime'].astype(object).str.extract(rf'^\D*?(?:(\d+)\D*?)?({units})')
+
+        amounts = pd.to_numeric(parts[0]).fillna(1)
+        days = amounts * parts[1].map(self.POSTED_TIME_UNIT_DAYS).astype(float)
+        posted = reference_time - pd.to_timedelta(days, unit='D')
+
+        df_jobs['PostedTime'] = posted.astype('datetime64[ns]')
         df_jobs.rename(columns={'PostedTime': 'DatePosted'}, inplace=True)
         return df_jobs
 
@@ -305,30 +333,34 @@ class JobDataCleaner:
 
     def categorize_tech_stack(self, df_jobs, tech_stack_categories):
         """Categorize the tech stack into predefined categories and add them as columns."""
-        
-        # Initialize columns with 0s
-        for category in tech_stack_categories:
-            df_jobs[category] = 0
-
-        # Add 'Other' category
-        df_jobs['Other'] = 0
-
-        # Function to categorize tech stack for each row
-        def categorize_single_tech_stack(tech_stack, index):
-            tech_stack_elements = [element.strip() for element in tech_stack.split(',')]
-            category_found = False
-
-            for category, items in tech_stack_categories.items():
-                for item in items:
-                    if any(item in element for element in tech_stack_elements):
-                        df_jobs.at[index, category] = 1
-                        category_found = True
-            
-            if not category_found:
-                df_jobs.at[index, 'Other'] = 1
 
-        # Apply categorization to each row
-        for index, row in df_jobs.iterrows():
-            categorize_single_tech_stack(row['TechStack'], index)
+        # Compile the categories once and reuse them for every later call with the same mapping
+        if self._tech_stack_categorizer is None or self._tech_stack_categories is not tech_stack_categories:
+            self._tech_stack_categorizer = TechStackCategorizer(tech_stack_categories)
+            self._tech_stack_categories = tech_stack_categories
+
+        categorizer = self._tech_stack_categorizer
+        df_jobs[categorizer.columns] = categorizer.categorize(df_jobs['TechStack'])
 
         return df_jobs
+
+def get_job_data_cleaner(backend: str, logger, location_cache_file: str = None) -> JobDataCleaner:
+    """
+    Create the job data cleaner for the configured backend.
+
+    Args:
+        backend (str): Either 'pandas' or 'polars'.
+        logger (Logger): Logger instance passed to the cleaner.
+        location_cache_file (str, optional): JSON file persisting the fuzzy location matches. Defaults to None.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend's optional dependency is not installed.
+    """
+    if backend == 'pandas':
+        return JobDataCleaner(logger, location_cache_file=location_cache_file)
+    if backend == 'polars':
+        # Imported here because the polars cleaner subclasses JobDataCleaner
+        from LinkedInWebScraper.polars_job_data_cleaner import PolarsJobDataCleaner
+        return PolarsJobDataCleaner(logger, location_cache_file=location_cache_file)
+    raise ValueError(f"Unknown cleaner backend '{backend}'. Choose one of ['pandas', 'polars'].")
@@ -1,18 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import threading
+
+from LinkedInWebScraper.batch_enrichment import BatchEnricher
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.description_trimmer import DescriptionTrimmer
+from LinkedInWebScraper.near_duplicate_index import NearDuplicateIndex
+from LinkedInWebScraper.rate_limiter import RequestBudget
+from LinkedInWebScraper.request_packer import RequestPacker
 from OpenAIHandler.openai_handler import OpenAIHandler
 from Utils.logger import Logger
+import numpy as np
 import pandas as pd
 
+# Tokens reserved for each completion on top of the prompt when checking the token budget
+COMPLETION_TOKENS_ESTIMATE = 300
+
 class JobDescriptionProcessor:
-    def __init__(self, openai_handler: OpenAIHandler, logger:Logger):
+    def __init__(self, openai_handler: OpenAIHandler, logger:Logger, near_duplicate_index: NearDuplicateIndex = None,
+                 max_in_flight: int = 1, requests_per_minute: int = None, tokens_per_minute: int = None,
+                 completion_cache: CompletionCache = None, batch_enricher: BatchEnricher = None,
+                 packer: RequestPacker = None, pack_retries: int = 1, trimmer: DescriptionTrimmer = None):
         """
         Initialize the JobDescriptionProcessor.
 
         Args:
             openai_handler (OpenAIHandler): An instance of the OpenAIHandler class to interact with the OpenAI API.
             logger (Logger): An instance of the Logger class to log the process.
+            near_duplicate_index (NearDuplicateIndex, optional): Index of the descriptions already enriched. A posting
+                whose description nearly duplicates one of them reuses its enrichment instead of calling the API.
+                Defaults to None.
+            max_in_flight (int, optional): Maximum number of OpenAI requests in flight at the same time.
+                Defaults to 1 (sequential).
+            requests_per_minute (int, optional): Maximum OpenAI requests per minute. Defaults to None (unlimited).
+            tokens_per_minute (int, optional): Maximum estimated OpenAI tokens per minute. Defaults to None (unlimited).
+            completion_cache (CompletionCache, optional): Cache of the completions keyed by description, prompt
+                version and model. Cached descriptions are not sent to the API again. Defaults to None.
+            batch_enricher (BatchEnricher, optional): Sends the descriptions through the OpenAI Batch API instead of
+                synchronous requests. Postings whose batch is still running are left out of the result and picked
+                up by a later run. Defaults to None.
+            packer (RequestPacker, optional): Packs several descriptions into each request, sizing the packs from
+                the measured token counts. Defaults to None (one description per request).
+            pack_retries (int, optional): Packed requests sent again for the entries missing or invalid in a packed
+                response. Entries still failing afterwards are sent on their own. Defaults to 1.
+            trimmer (DescriptionTrimmer, optional): Strips boilerplate sentences and caps the tokens of each description
+                sent to OpenAI. The Description column, the completion cache and the near-duplicate index keep the
+                full text. Defaults to None.
         """
         self.openai_handler = openai_handler
         self.logger = logger
+        self.near_duplicate_index = near_duplicate_index
+        self.completion_cache = completion_cache
+        self.batch_enricher = batch_enricher
+        self.packer = packer
+        self.pack_retries = pack_retries
+        self.trimmer = trimmer
+        if packer is not None and not packer.fixed_chars:
+            packer.fixed_chars = self.message_chars(openai_handler.create_packed_messages({}))
+        self.max_in_flight = max(1, max_in_flight or 1)
+        self.budget = None
+        if requests_per_minute or tokens_per_minute:
+            self.budget = RequestBudget(requests_per_minute, tokens_per_minute)
+        self.api_calls = 0
+        self.api_calls_saved = 0
+        self.waiting_job_ids = []
+        self._lock = threading.Lock()
 
     def process_job_descriptions(self, df_jobs:pd.DataFrame):
         """
@@ -26,19 +78,351 @@ class JobDescriptionProcessor:
         """
         self.logger.log.info(f"Processing {len(df_jobs)} job descriptions using OpenAI API.")
 
-        for index, row in df_jobs.iterrows():
-            description = row['Description']
-            
-            # Create messages and generate a completion using the OpenAI handler
-            messages = self.openai_handler.create_messages(description)
-            response = self.openai_handler.generate_chat_completion(messages)
-            
-            # Add the parsed JSON fields into the DataFrame as new columns
-            df_jobs.at[index, 'ShortDescription'] = response.get('Description', 'N/A')
-            df_jobs.at[index, 'TechStack'] = ', '.join(response.get('TechStack', []))
-            df_jobs.at[index, 'YoE'] = response.get('YoE', 'N/A')
-            df_jobs.at[index, 'MinLevelStudies'] = response.get('MinLevelStudies', 'N/A')
-            df_jobs.at[index, 'English'] = response.get('English', 'N/A')
+        job_ids = df_jobs['JobID'].tolist() if 'JobID' in df_jobs.columns else [None] * len(df_jobs)
+        descriptions = df_jobs['Description'].tolist()
+
+        if self.batch_enricher is not None:
+            responses = self.enrich_descriptions_in_batch(job_ids, descriptions)
+            enriched = [response is not None for response in responses]
+            if not all(enriched):
+                self.logger.log.info(f"Leaving out {enriched.count(False)} jobs until their OpenAI batch completes.")
+                self.waiting_job_ids.extend(str(job_id) for job_id, done in zip(job_ids, enriched) if not done)
+                df_jobs = df_jobs.loc[enriched].copy()
+                responses = [response for response in responses if response is not None]
+        else:
+            responses = self.enrich_descriptions(job_ids, descriptions)
+
+        # Add the parsed JSON fields into the DataFrame as new columns
+        df_jobs[['ShortDescription', 'TechStack', 'YoE', 'MinLevelStudies', 'English']] = pd.DataFrame({
+            'ShortDescription': [response.get('Description', 'N/A') for response in responses],
+            'TechStack': [', '.join(response.get('TechStack', [])) for response in responses],
+            'YoE': [response.get('YoE', 'N/A') for response in responses],
+            'MinLevelStudies': [response.get('MinLevelStudies', 'N/A') for response in responses],
+            'English': [response.get('English', 'N/A') for response in responses],
+        }, index=df_jobs.index, dtype=object)
 
         self.logger.log.info(f"Finished processing job descriptions.")
+        self.log_stats()
         return df_jobs
+
+    def enrich_descriptions(self, job_ids: list, descriptions: list) -> list:
+        """
+        Returns the parsed enrichment of each description, in order.
+
+        Near-duplicates and cached completions are resolved before submitting: a description matching the
+        index, an earlier description of the same batch or a cached completion reuses that enrichment
+        instead of sending its own request. The remaining descriptions are trimmed and sent on a pool of
+        `max_in_flight` worker threads or, with a packer, several per request.
+
+        Args:
+            job_ids (list): JobIDs of the postings.
+            descriptions (list): The job descriptions, aligned with `job_ids`.
+
+        Returns:
+            list: One dictionary of parsed JSON fields per description.
+        """
+        responses = [None] * len(descriptions)
+        pending = []
+        followers = {}
+        first_of = {}
+        index = self.near_duplicate_index
+        if index is not None:
+            leader_signatures = np.empty((len(descriptions), index.num_perm), dtype=np.uint32)
+            leader_positions = []
+
+        for position, (job_id, description) in enumerate(zip(job_ids, descriptions)):
+            if index is not None:
+                responses[position] = self.find_near_duplicate(job_id, description)
+                if responses[position] is not None:
+                    continue
+
+                signature = index.signature(description)
+                if signature is not None:
+                    if leader_positions:
+                        similarities = (leader_signatures[:len(leader_positions)] == signature).mean(axis=1)
+                        best = int(similarities.argmax())
+                        if similarities[best] >= index.threshold:
+                            followers[position] = leader_positions[best]
+                            self.api_calls_saved += 1
+                            continue
+                    leader_signatures[len(leader_positions)] = signature
+                    leader_positions.append(position)
+            elif isinstance(description, str):
+                # Without an index, identical descriptions of the batch still share one request
+                if description in first_of:
+                    followers[position] = first_of[description]
+                    continue
+                first_of[description] = position
+            pending.append(position)
+
+        if self.packer is not None:
+            self.enrich_packed(pending, job_ids, descriptions, responses)
+        else:
+            to_send = [position for position in pending
+                       if not self.use_cached_completion(job_ids, descriptions, responses, position)]
+            prompts = self.trimmed_prompts(job_ids, descriptions, to_send)
+            self.logger.log.info(f"Sending {len(to_send)} OpenAI requests with up to {self.max_in_flight} in flight.")
+            with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+                futures = {executor.submit(self.send_enrichment, job_ids[position], descriptions[position],
+                                           prompts[position]): position
+                           for position in to_send}
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    responses[futures[future]] = future.result()
+                    if completed % 50 == 0:
+                        self.logger.log.info(f"Enriched {completed}/{len(to_send)} job descriptions.")
+
+        for position, leader in followers.items():
+            responses[position] = responses[leader]
+        return responses
+
+    def use_cached_completion(self, job_ids: list, descriptions: list, responses: list, position: int,
+                              prompt_version: str = None) -> bool:
+        """Write the cached completion of the description at `position` into `responses`. Returns False on a miss."""
+        cached = self.get_cached_completion(descriptions[position], prompt_version)
+        if cached is None:
+            return False
+        responses[position] = cached
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.add(job_ids[position], descriptions[position], cached)
+        return True
+
+    def trimmed_prompts(self, job_ids: list, descriptions: list, positions: list) -> dict:
+        """
+        Returns the text sent to OpenAI for the descriptions at the given positions.
+
+        Only the descriptions about to be sent are trimmed. The completion cache and the near-duplicate
+        index are keyed on the full description, so a cached enrichment is found whatever the trimmer
+        strips on a later run.
+        """
+        if self.trimmer is None:
+            return {position: descriptions[position] for position in positions}
+        trimmed = self.trimmer.trim_descriptions([job_ids[position] for position in positions],
+                                                 [descriptions[position] for position in positions])
+        return dict(zip(positions, trimmed))
+
+    def enrich_packed(self, positions: list, job_ids: list, descriptions: list, responses: list):
+        """
+        Enrich the descriptions at the given positions with packed requests, writing them into `responses`.
+
+        Packs are sized by the packer and sent in waves of `max_in_flight` requests, so the token counts
+        measured on a wave size the packs of the next one.
+        """
+        to_send = [position for position in positions
+                   if not self.use_cached_completion(job_ids, descriptions, responses, position,
+                                                     self.openai_handler.packed_prompt_version)]
+        prompts = self.trimmed_prompts(job_ids, descriptions, to_send)
+        remaining = [(position, job_ids[position], descriptions[position], prompts[position]) for position in to_send]
+
+        entry_chars = [len(json.dumps({"JobID": str(job_id), "Description": str(prompt)}, ensure_ascii=False)) + 2
+                       for _, job_id, _, prompt in remaining]
+        self.logger.log.info(f"Packing {len(remaining)} job descriptions into OpenAI requests "
+                             f"with up to {self.max_in_flight} in flight.")
+
+        start = 0
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while start < len(remaining):
+                wave = []
+                while len(wave) < self.max_in_flight and start < len(remaining):
+                    size = self.packer.next_pack_size(entry_chars[start:])
+                    wave.append(remaining[start:start + size])
+                    start += size
+                for results in executor.map(self.request_packed_enrichment, wave):
+                    for position, response in results.items():
+                        responses[position] = response
+
+    def request_packed_enrichment(self, pack: list) -> dict:
+        """
+        Enrich a pack of descriptions with one request, retrying only the entries that failed.
+
+        Args:
+            pack (list): (position, job_id, description, prompt) of each packed description, where the prompt
+                is the text sent and the description the full text the enrichment is stored under.
+
+        Returns:
+            dict: The parsed enrichment of each position.
+        """
+        postings, description_of, job_id_of, positions_of = {}, {}, {}, {}
+        for position, job_id, description, prompt in pack:
+            key = str(job_id) if job_id is not None else f'#{position}'
+            postings.setdefault(key, prompt)
+            description_of.setdefault(key, description)
+            job_id_of.setdefault(key, job_id)
+            positions_of.setdefault(key, []).append(position)
+
+        results = {}
+        remaining = postings
+        for _ in range(self.pack_retries + 1):
+            messages = self.openai_handler.create_packed_messages(remaining)
+            if self.budget is not None:
+                self.budget.acquire(self.estimate_tokens(messages, completions=len(remaining)))
+            parsed, failed, usage = self.openai_handler.generate_packed_completion(messages, list(remaining))
+            with self._lock:
+                self.api_calls += 1
+            if usage is not None:
+                self.packer.record(self.message_chars(messages), usage[0], usage[1], len(parsed))
+
+            for key, response in parsed.items():
+                results[key] = response
+                self.remember_enrichment(job_id_of[key], description_of[key], response, self.openai_handler.packed_prompt_version)
+            remaining = {key: remaining[key] for key in failed}
+            if not remaining:
+                break
+            self.logger.log.warning(f"{len(remaining)} entries of a packed OpenAI response are missing or invalid.")
+
+        # Entries failing every packed attempt are sent on their own
+        for key, prompt in remaining.items():
+            results[key] = self.request_enrichment(job_id_of[key], description_of[key], prompt)
+
+        return {position: results[key] for key, positions in positions_of.items() for position in positions}
+
+    def enrich_descriptions_in_batch(self, job_ids: list, descriptions: list) -> list:
+        """
+        Returns the parsed enrichment of each description, sending the ones not found in the near-duplicate index
+        or the completion cache through the OpenAI Batch API. Results are merged back by JobID.
+
+        Args:
+            job_ids (list): JobIDs of the postings.
+            descriptions (list): The job descriptions, aligned with `job_ids`.
+
+        Returns:
+            list: One dictionary of parsed JSON fields per description, None for those still waiting for their batch.
+        """
+        responses = [None] * len(descriptions)
+        pending = {}
+        for position, (job_id, description) in enumerate(zip(job_ids, descriptions)):
+            responses[position] = self.find_near_duplicate(job_id, description)
+            if responses[position] is None:
+                responses[position] = self.get_cached_completion(description)
+                if responses[position] is None:
+                    pending[str(job_id)] = position
+                elif self.near_duplicate_index is not None:
+                    self.near_duplicate_index.add(job_id, description, responses[position])
+
+        if pending:
+            prompts = self.trimmed_prompts(job_ids, descriptions, list(pending.values()))
+            results = self.batch_enricher.enrich({job_id: prompts[position] for job_id, position in pending.items()})
+            for job_id, response in results.items():
+                position = pending[job_id]
+                responses[position] = response
+                self.api_calls += 1
+                self.remember_enrichment(job_ids[position], descriptions[position], response)
+        return responses
+
+    def enrich_description(self, job_id, description) -> dict:
+        """
+        Returns the parsed enrichment of a description, reusing the one of a near-duplicate posting when possible.
+
+        Args:
+            job_id: JobID of the posting, stored with its enrichment.
+            description (str): The job description.
+
+        Returns:
+            dict: The parsed JSON fields of the description.
+        """
+        enrichment = self.find_near_duplicate(job_id, description)
+        if enrichment is not None:
+            return enrichment
+        return self.request_enrichment(job_id, description)
+
+    def find_near_duplicate(self, job_id, description):
+        """Returns the enrichment of a near-duplicate in the index, or None if there is no index or no match."""
+        if self.near_duplicate_index is None:
+            return None
+
+        match = self.near_duplicate_index.find(description)
+        if match is None:
+            return None
+
+        enrichment, matched_job_id, similarity = match
+        with self._lock:
+            self.api_calls_saved += 1
+        self.logger.log.debug(f"Job {job_id} nearly duplicates job {matched_job_id} ({similarity:.0%} similar). "
+                              f"Reusing its enrichment.")
+        return enrichment
+
+    def request_enrichment(self, job_id, description, prompt=None) -> dict:
+        """
+        Enrich a description from the completion cache or with the OpenAI API, within the request budgets,
+        and store it in the near-duplicate index.
+
+        Args:
+            job_id: JobID of the posting, stored with its enrichment.
+            description (str): The full job description, the key of the cache and the near-duplicate index.
+            prompt (str, optional): The text sent to OpenAI. Defaults to the description, trimmed when a trimmer is set.
+        """
+        response = self.get_cached_completion(description)
+        if response is None:
+            if prompt is None:
+                prompt = self.trimmed_prompts([job_id], [description], [0])[0]
+            return self.send_enrichment(job_id, description, prompt)
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.add(job_id, description, response)
+        return response
+
+    def send_enrichment(self, job_id, description, prompt) -> dict:
+        """Enrich a description with the OpenAI API, sending `prompt`, and store the enrichment under the full description."""
+        response = self.generate_completion(prompt)
+        self.remember_enrichment(job_id, description, response)
+        return response
+
+    def remember_enrichment(self, job_id, description, response: dict, prompt_version: str = None):
+        """Store a new enrichment in the completion cache and the near-duplicate index."""
+        if self.completion_cache is not None:
+            self.completion_cache.put(description, prompt_version or self.openai_handler.prompt_version,
+                                      self.openai_handler.model, response)
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.add(job_id, description, response)
+
+    def get_cached_completion(self, description, prompt_version: str = None):
+        """Returns the cached completion of a description for the current prompt and model, or None."""
+        if self.completion_cache is None:
+            return None
+        return self.completion_cache.get(description, prompt_version or self.openai_handler.prompt_version,
+                                         self.openai_handler.model)
+
+    def generate_completion(self, description) -> dict:
+        """Call the OpenAI API for a description once the request budgets allow it."""
+        # Create messages and generate a completion using the OpenAI handler
+        messages = self.openai_handler.create_messages(description)
+        if self.budget is not None:
+            self.budget.acquire(self.estimate_tokens(messages))
+        response = self.openai_handler.generate_chat_completion(messages)
+        with self._lock:
+            self.api_calls += 1
+        return response
+
+    @staticmethod
+    def message_chars(messages: list) -> int:
+        """Returns the characters of the contents of a list of messages."""
+        return sum(len(message['content']) for message in messages)
+
+    @classmethod
+    def estimate_tokens(cls, messages: list, completions: int = 1) -> int:
+        """Estimate the tokens of a request: about four characters per prompt token plus the expected completions."""
+        return cls.message_chars(messages) // 4 + completions * COMPLETION_TOKENS_ESTIMATE
+
+    def stats(self) -> dict:
+        """Returns the OpenAI calls made and the ones saved by reusing the enrichment of near-duplicates."""
+        descriptions = self.api_calls + self.api_calls_saved
+        return {
+            'api_calls': self.api_calls,
+            'api_calls_saved': self.api_calls_saved,
+            'saved_rate': round(self.api_calls_saved / descriptions, 3) if descriptions else 0.0
+        }
+
+    def log_stats(self):
+        """Log the OpenAI calls and tokens saved by the completion cache, trimmer, packer and near-duplicate index."""
+        if self.completion_cache is not None:
+            self.completion_cache.log_stats(self.logger)
+        if self.trimmer is not None:
+            self.trimmer.log_stats(self.logger)
+        if self.packer is not None:
+            stats = self.packer.stats()
+            self.logger.log.info(f"Request packing: {stats['packs']} packed requests of {stats['mean_pack_size']} descriptions "
+                                 f"on average ({stats['tokens_per_char']} prompt tokens per character, "
+                                 f"{stats['completion_tokens']} completion tokens per description).")
+        if self.near_duplicate_index is None:
+            return
+        stats = self.stats()
+        self.logger.log.info(f"Near-duplicate index: {stats['api_calls_saved']} OpenAI calls saved, {stats['api_calls']} made "
+                             f"(saved rate {stats['saved_rate']:.1%}).")
@@ -0,0 +1,289 @@
+from bs4 import BeautifulSoup
+
+from Utils.logger import Logger
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is an optional dependency
+    etree = None
+
+def empty_job_details() -> dict:
+    """Returns the job details of a posting where nothing could be extracted."""
+    return {
+        'SeniorityLevel': 'N/A',
+        'EmploymentType': 'N/A',
+        'JobFunction': 'N/A',
+        'Industries': 'N/A',
+        'PostedTime': 'N/A',
+        'NumApplicants': 'N/A',
+        'Description': 'N/A'
+    }
+
+# Map the job criteria headers to the job detail fields, in the order they are checked
+CRITERIA_FIELDS = [
+    ('Seniority level', 'SeniorityLevel'),
+    ('Employment type', 'EmploymentType'),
+    ('Job function', 'JobFunction'),
+    ('Industries', 'Industries'),
+]
+
+class BeautifulSoupJobParser:
+    """
+    Parses LinkedIn search and job posting pages with BeautifulSoup and the built-in 'html.parser'.
+
+    Each job card is returned as a dictionary with the keys Location, Title, Company, Url and
+    ListedDate. Job postings are returned as a dictionary of the fields in `empty_job_details`.
+    """
+
+    name = 'bs4'
+
+    def __init__(self, logger: Logger):
+        self.logger = logger
+
+    def parse_total_jobs(self, html_content) -> int:
+        """Parse the total number of jobs from the results header of a search page."""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        job_count_element = soup.find('span', {'class': 'results-context-header__job-count'})
+        return int(job_count_element.text.strip().replace(',', '')) if job_count_element else 0
+
+    def parse_job_cards(self, html_content) -> list:
+        """Parse every job listing of a search page."""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        job_cards = []
+
+        for job in soup.find_all('li'):
+            try:
+                job_info = self.extract_job_info(job)
+                if job_info:
+                    job_cards.append(job_info)
+            except Exception as e:
+                self.logger.log.error(f"Error processing job listing: {e}")
+                continue
+
+        return job_cards
+
+    def extract_job_info(self, job):
+        """Extract job information from a single job listing."""
+        try:
+            info = job.find('div', class_="base-search-card__info")
+            title = info.find('h3', class_="base-search-card__title").text.strip() if info else 'N/A'
+            company = info.find('h4', class_="base-search-card__subtitle").text.strip() if info else 'N/A'
+
+            metadata = job.find('div', class_="base-search-card__metadata")
+            location_element = metadata.find('span', class_="job-search-card__location") if metadata else None
+            location_job = location_element.text.strip() if location_element else 'N/A'
+
+            joburl_element = job.find('a', class_="base-card__full-link")
+            joburl = joburl_element['href'] if joburl_element else 'N/A'
+
+            time_element = job.find('time')
+            listed_date = time_element.get('datetime') if time_element else None
+
+            return {
+                'Location': location_job,
+                'Title': title,
+                'Company': company,
+                'Url': joburl,
+                'ListedDate': listed_date
+            }
+        except Exception as e:
+            self.logger.log.error(f"Error extracting job info: {e}")
+            return None
+
+    def parse_job_details(self, html_content) -> dict:
+        """Parse the details of a job posting from its HTML content."""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        details = empty_job_details()
+
+        # Find job criteria list
+        criteria_list = soup.find('ul', class_='description__job-criteria-list')
+        if criteria_list:
+            criteria_items = criteria_list.find_all('li', class_='description__job-criteria-item')
+            for item in criteria_items:
+                item_text = item.get_text()
+                for header, field in CRITERIA_FIELDS:
+                    if header in item_text:
+                        details[field] = item.find('span', class_='description__job-criteria-text').get_text(strip=True)
+                        break
+
+        # Extract additional job information
+        num_applicants_tag = soup.find('figcaption', class_='num-applicants__caption') or \
+                             soup.find('span', class_='num-applicants__caption topcard__flavor--metadata topcard__flavor--bullet')
+        if num_applicants_tag:
+            details['NumApplicants'] = num_applicants_tag.get_text(strip=True)
+
+        posted_time = soup.find('span', class_='posted-time-ago__text')
+        if posted_time:
+            details['PostedTime'] = posted_time.get_text(strip=True)
+
+        description_tag = soup.find('div', class_='show-more-less-html__markup')
+        if description_tag:
+            details['Description'] = description_tag.get_text(separator=' ', strip=True)
+
+        return details
+
+def _class_xpath(tag: str, class_name: str, first: bool = True):
+    """Compile a relative XPath matching `tag` elements carrying the CSS class `class_name`."""
+    path = f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    return etree.XPath(f"({path})[1]" if first else path)
+
+class LxmlJobParser:
+    """
+    Parses LinkedIn search and job posting pages with lxml and precompiled XPath selectors.
+
+    It extracts the same fields as BeautifulSoupJobParser and reproduces its text
+    normalization, but runs in C and reads each job card in a single pass.
+    """
+
+    name = 'lxml'
+
+    def __init__(self, logger: Logger):
+        if etree is None:
+            raise ImportError("The 'lxml' parser backend requires the lxml package. Install it with `pip install lxml`.")
+
+        self.logger = logger
+        self._bytes_parser = etree.HTMLParser(encoding='utf-8')
+        self._text_parser = etree.HTMLParser()
+
+        # Text nodes as seen by BeautifulSoup.get_text, which skips script, style and template strings
+        self._strings = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+        self._job_count = _class_xpath('span', 'results-context-header__job-count')
+        self._job_listings = etree.XPath("//li")
+        self._info = _class_xpath('div', 'base-search-card__info')
+        self._title = _class_xpath('h3', 'base-search-card__title')
+        self._company = _class_xpath('h4', 'base-search-card__subtitle')
+        self._metadata = _class_xpath('div', 'base-search-card__metadata')
+        self._location = _class_xpath('span', 'job-search-card__location')
+        self._job_url = _class_xpath('a', 'base-card__full-link')
+        self._listed_date = etree.XPath("(.//time)[1]")
+
+        self._criteria_list = _class_xpath('ul', 'description__job-criteria-list')
+        self._criteria_items = _class_xpath('li', 'description__job-criteria-item', first=False)
+        self._criteria_text = _class_xpath('span', 'description__job-criteria-text')
+        self._num_applicants = _class_xpath('figcaption', 'num-applicants__caption')
+        self._num_applicants_bullet = etree.XPath(
+            "(.//span[normalize-space(@class)='num-applicants__caption topcard__flavor--metadata topcard__flavor--bullet'])[1]")
+        self._posted_time = _class_xpath('span', 'posted-time-ago__text')
+        self._description = _class_xpath('div', 'show-more-less-html__markup')
+
+    def _parse(self, html_content):
+        """Parse the HTML content into an lxml tree, returning None for empty documents."""
+        if isinstance(html_content, bytes):
+            return etree.HTML(html_content, self._bytes_parser)
+        return etree.HTML(html_content, self._text_parser)
+
+    @staticmethod
+    def _first(xpath, element):
+        matches = xpath(element)
+        return matches[0] if matches else None
+
+    def _text(self, element) -> str:
+        """Equivalent of BeautifulSoup's `element.text`."""
+        return ''.join(self._strings(element))
+
+    def _stripped_text(self, element, separator: str = '') -> str:
+        """Equivalent of BeautifulSoup's `element.get_text(separator, strip=True)`."""
+        return separator.join(text for text in (string.strip() for string in self._strings(element)) if text)
+
+    def parse_total_jobs(self, html_content) -> int:
+        """Parse the total number of jobs from the results header of a search page."""
+        document = self._parse(html_content)
+        job_count_element = self._first(self._job_count, document) if document is not None else None
+        return int(self._text(job_count_element).strip().replace(',', '')) if job_count_element is not None else 0
+
+    def parse_job_cards(self, html_content) -> list:
+        """Parse every job listing of a search page."""
+        document = self._parse(html_content)
+        if document is None:
+            return []
+
+        job_cards = []
+        for job in self._job_listings(document):
+            try:
+                job_cards.append(self.extract_job_info(job))
+            except Exception as e:
+                self.logger.log.error(f"Error extracting job info: {e}")
+                continue
+
+        return job_cards
+
+    def extract_job_info(self, job) -> dict:
+        """Extract job information from a single job listing, raising if a required element is missing."""
+        info = self._first(self._info, job)
+        if info is not None:
+            title = self._text(self._title(info)[0]).strip()
+            company = self._text(self._company(info)[0]).strip()
+        else:
+            title = company = 'N/A'
+
+        metadata = self._first(self._metadata, job)
+        location_element = self._first(self._location, metadata) if metadata is not None else None
+        location_job = self._text(location_element).strip() if location_element is not None else 'N/A'
+
+        joburl_element = self._first(self._job_url, job)
+        joburl = joburl_element.attrib['href'] if joburl_element is not None else 'N/A'
+
+        time_element = self._first(self._listed_date, job)
+        listed_date = time_element.get('datetime') if time_element is not None else None
+
+        return {
+            'Location': location_job,
+            'Title': title,
+            'Company': company,
+            'Url': joburl,
+            'ListedDate': listed_date
+        }
+
+    def parse_job_details(self, html_content) -> dict:
+        """Parse the details of a job posting from its HTML content."""
+        details = empty_job_details()
+        document = self._parse(html_content)
+        if document is None:
+            return details
+
+        criteria_list = self._first(self._criteria_list, document)
+        if criteria_list is not None:
+            for item in self._criteria_items(criteria_list):
+                item_text = self._text(item)
+                for header, field in CRITERIA_FIELDS:
+                    if header in item_text:
+                        details[field] = self._stripped_text(self._criteria_text(item)[0])
+                        break
+
+        num_applicants_tag = self._first(self._num_applicants, document)
+        if num_applicants_tag is None:
+            num_applicants_tag = self._first(self._num_applicants_bullet, document)
+        if num_applicants_tag is not None:
+            details['NumApplicants'] = self._stripped_text(num_applicants_tag)
+
+        posted_time = self._first(self._posted_time, document)
+        if posted_time is not None:
+            details['PostedTime'] = self._stripped_text(posted_time)
+
+        description_tag = self._first(self._description, document)
+        if description_tag is not None:
+            details['Description'] = self._stripped_text(description_tag, separator=' ')
+
+        return details
+
+PARSER_BACKENDS = {
+    BeautifulSoupJobParser.name: BeautifulSoupJobParser,
+    LxmlJobParser.name: LxmlJobParser,
+}
+
+def get_job_parser(backend: str, logger: Logger):
+    """
+    Create the job page parser for the configured backend.
+
+    Args:
+        backend (str): Either 'bs4' or 'lxml'.
+        logger (Logger): Logger instance passed to the parser.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend's optional dependency is not installed.
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}'. Choose one of {list(PARSER_BACKENDS)}.")
+    return PARSER_BACKENDS[backend](logger)
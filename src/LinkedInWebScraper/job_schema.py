@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:  # pyarrow is an optional dependency
+    pyarrow = None
+
+# Kinds of compact column types a schema entry can declare
+CATEGORY = 'category'
+TEXT = 'text'
+BOOLEAN = 'boolean'
+DATETIME = 'datetime64[ns]'
+
+# Compact dtype of every column the pipeline produces. Low-cardinality fields are categoricals,
+# free text is a string column (pyarrow-backed when pyarrow is installed) and counts are nullable
+# integers, so 'N/A' sentinels become missing values instead of forcing an object column.
+JOB_SCHEMA = {
+    'Title': TEXT,
+    'Company': CATEGORY,
+    'Location': CATEGORY,
+    'Remote': CATEGORY,
+    'Url': TEXT,
+    'JobID': TEXT,
+    'SeniorityLevel': CATEGORY,
+    'EmploymentType': CATEGORY,
+    'JobFunction': CATEGORY,
+    'JobFunction1': CATEGORY,
+    'JobFunction2': CATEGORY,
+    'JobFunction3': CATEGORY,
+    'Industries': CATEGORY,
+    'PostedTime': CATEGORY,
+    'DatePosted': DATETIME,
+    'NumApplicants': 'Int16',
+    'Description': TEXT,
+    'ShortDescription': TEXT,
+    'TechStack': TEXT,
+    'YoE': CATEGORY,
+    'MinYoE': 'Int8',
+    'MinLevelStudies': CATEGORY,
+    'English': BOOLEAN,
+}
+
+# Dtype of the one-hot tech stack category columns, whose names depend on the configured categories
+ONE_HOT_DTYPE = 'uint8'
+
+BOOLEAN_VALUES = {True: True, False: False, 'True': True, 'False': False, 'true': True, 'false': False}
+
+def text_dtype() -> pd.StringDtype:
+    """Returns the string dtype of text columns: pyarrow-backed when pyarrow is installed."""
+    return pd.StringDtype('pyarrow' if pyarrow is not None else 'python')
+
+def enforce_column(column: pd.Series, kind: str) -> pd.Series:
+    """
+    Convert a column to the compact dtype declared by a schema entry.
+
+    Values that do not fit the dtype, such as 'N/A' in an integer or boolean column, become missing.
+
+    Args:
+        column (pd.Series): The column to convert.
+        kind (str): CATEGORY, TEXT, BOOLEAN, DATETIME or a numpy/pandas dtype name such as 'Int16'.
+
+    Returns:
+        pd.Series: The converted column.
+    """
+    if kind == CATEGORY:
+        return column if isinstance(column.dtype, pd.CategoricalDtype) else column.astype('category')
+
+    if kind == TEXT:
+        dtype = text_dtype()
+        return column if column.dtype == dtype else column.astype(dtype)
+
+    if kind == BOOLEAN:
+        if column.dtype == 'boolean':
+            return column
+        return column.map(lambda value: BOOLEAN_VALUES.get(value, pd.NA)).astype('boolean')
+
+    if kind == DATETIME:
+        return pd.to_datetime(column, errors='coerce').astype(DATETIME)
+
+    dtype = pd.api.types.pandas_dtype(kind)
+    if column.dtype == dtype:
+        return column
+    values = pd.to_numeric(column, errors='coerce')
+    # Out of range counts become missing instead of wrapping around
+    limits = np.iinfo(getattr(dtype, 'numpy_dtype', dtype))
+    values = values.where((values >= limits.min) & (values <= limits.max))
+    return values.astype(dtype)
+
+def enforce_schema(df: pd.DataFrame, schema: dict = None, one_hot_columns: list = None) -> pd.DataFrame:
+    """
+    Convert the columns of a job DataFrame to their compact schema dtypes.
+
+    Columns missing from the DataFrame are skipped and columns missing from the schema are left
+    untouched, so the same schema can be enforced after every stage of the pipeline.
+
+    Args:
+        df (pd.DataFrame): The job DataFrame.
+        schema (dict, optional): Column names mapped to their kind. Defaults to JOB_SCHEMA.
+        one_hot_columns (list, optional): One-hot columns stored as ONE_HOT_DTYPE. Defaults to None.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the same columns and values in their compact dtypes.
+    """
+    schema = dict(JOB_SCHEMA if schema is None else schema)
+    for column in one_hot_columns or []:
+        schema[column] = ONE_HOT_DTYPE
+
+    conversions = {column: enforce_column(df[column], kind) for column, kind in schema.items() if column in df.columns}
+    if not conversions:
+        return df
+    return df.assign(**conversions)
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the memory used by each column of a DataFrame before and after enforcing the schema.
+
+    Args:
+        before (pd.DataFrame): The DataFrame with its original dtypes.
+        after (pd.DataFrame): The same DataFrame with its compact dtypes.
+
+    Returns:
+        pd.DataFrame: One row per column plus a 'Total' row, with the dtype and bytes before and after
+            and the share of memory saved.
+    """
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'bytes_before': before.memory_usage(index=False, deep=True),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_after': after.memory_usage(index=False, deep=True),
+    })
+    report.loc['Total'] = ['', report['bytes_before'].sum(), '', report['bytes_after'].sum()]
+    report[['bytes_before', 'bytes_after']] = report[['bytes_before', 'bytes_after']].astype('int64')
+    saved = 1 - report['bytes_after'] / report['bytes_before'].where(report['bytes_before'] > 0)
+    report['saved_pct'] = (100 * saved).round(1)
+    return report
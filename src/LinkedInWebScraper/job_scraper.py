@@ -1,41 +1,51 @@
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlparse
 import pandas as pd
+import itertools
+import threading
 import math
 
 from Utils.logger import Logger
 from LinkedInWebScraper.job_scraper_config import JobScraperConfig
-from LinkedInWebScraper.utils import fetch_until_success
+from LinkedInWebScraper.utils import HttpFetcher, get_default_fetcher
+from LinkedInWebScraper.response_cache import ResponseCache
+from LinkedInWebScraper.search_watermark import SearchWatermark, SearchWatermarkStore
+from LinkedInWebScraper.job_parsers import get_job_parser
 from Utils.constants import TIME_POSTED_OPTION, REMOTE_OPTION
 
 
 class JobScraper:
-    def __init__(self, config: JobScraperConfig, logger:Logger):
+    def __init__(self, config: JobScraperConfig, logger:Logger, fetcher: HttpFetcher = None):
         self.config = config
         self.logger = logger
+        self.fetcher = fetcher if fetcher is not None else get_default_fetcher()
+        self.parser = get_job_parser(self.config.parser_backend, self.logger)
+        self.response_cache = None
+        self.open_response_cache()
         self.jobs = []
+        self.streamed_job_ids = []
+        self.watermark_store = SearchWatermarkStore(self.config.watermark_file) if self.config.watermark_file else None
+        self.watermark_run_time = None
+        self.listed_dates = {}
+        self._host_semaphores = {}
+        self._host_semaphores_lock = threading.Lock()
 
     def scrape_jobs(self) -> pd.DataFrame:
         """Scrape jobs from LinkedIn across multiple pages."""
         try:
             self.logger.log.info(f"Starting job scraping with config: {self.config}")
-            total_jobs = self.fetch_total_jobs()
-            if total_jobs == 0:
+            if self.watermark_store is not None:
+                found_jobs = self.scrape_pages_until_watermark()
+            else:
+                found_jobs = self.scrape_all_pages()
+
+            if not found_jobs:
                 self.logger.log.warning("No jobs found for the given search criteria.")
                 return pd.DataFrame()
 
-            total_pages = math.ceil(total_jobs / 10)
-            self.logger.log.info(f"Found {total_jobs} jobs. Scraping {total_pages} pages.")
-
-            for i in range(0, total_jobs, 10):
-                current_page = i // 10 + 1
-                target_url = self.generate_paginated_url(i)
-                response = fetch_until_success(target_url, self.logger)
-
-                if response:
-                    self.logger.log.info(f"Parsing data for page {current_page}/{total_pages}.")
-                    self.parse_job_data(response.content)
-                else:
-                    self.logger.log.error(f"Failed to fetch data for page {current_page}.")
+            self.log_fetch_metrics()
 
             df = pd.DataFrame(self.jobs)
             df = df[df['Url'] != 'N/A']
@@ -48,16 +58,227 @@ class JobScraper:
         except Exception as e:
             self.logger.log.error(f"An error occurred during scraping: {e}")
 
+    def scrape_all_pages(self) -> bool:
+        """
+        Fetch and parse every page of the search. Returns False if the search has no jobs.
+
+        The total number of jobs is read from the first page itself, so no separate count
+        request is made.
+        """
+        first_response = self.fetch(self.generate_paginated_url(0))
+        if not first_response:
+            self.logger.log.error("Failed to fetch the first page of results.")
+            return False
+
+        total_jobs = self.parse_total_jobs(first_response.text)
+        if total_jobs == 0:
+            return False
+
+        total_pages = math.ceil(total_jobs / 10)
+        self.logger.log.info(f"Found {total_jobs} jobs. Scraping {total_pages} pages.")
+
+        starts = range(10, total_jobs, 10)
+        if self.config.async_pages:
+            later_responses = self.fetch_pages_concurrently(starts)
+        else:
+            later_responses = (self.fetch(self.generate_paginated_url(i)) for i in starts)
+
+        responses = itertools.chain([first_response], later_responses)
+        for current_page, response in enumerate(responses, start=1):
+            if response:
+                self.logger.log.info(f"Parsing data for page {current_page}/{total_pages}.")
+                self.parse_job_data(response.content)
+            else:
+                self.logger.log.error(f"Failed to fetch data for page {current_page}.")
+
+        return True
+
+    def scrape_pages_until_watermark(self) -> bool:
+        """
+        Fetch and parse pages until one contains only postings already covered by the search watermark.
+
+        The total number of jobs is read from the first page itself, so no separate count
+        request is made. Pagination stops at the first page that has no job cards, or whose
+        cards are all either known JobIDs or listed before the last run.
+
+        Returns:
+            bool: False if the search has no jobs, True otherwise.
+        """
+        watermark = self.watermark_store.get(self.generate_main_url())
+        self.watermark_run_time = datetime.now()
+
+        first_response = self.fetch(self.generate_paginated_url(0))
+        if not first_response:
+            self.logger.log.error("Failed to fetch the first page of results.")
+            return False
+
+        total_jobs = self.parse_total_jobs(first_response.text)
+        if total_jobs == 0:
+            return False
+
+        total_pages = math.ceil(total_jobs / 10)
+        self.logger.log.info(f"Found {total_jobs} jobs. Scraping up to {total_pages} pages until the watermark is reached.")
+
+        responses = itertools.chain([first_response], self.iter_page_responses(range(10, total_jobs, 10)))
+        for current_page, response in enumerate(responses, start=1):
+            if not response:
+                self.logger.log.error(f"Failed to fetch data for page {current_page}.")
+                continue
+
+            self.logger.log.info(f"Parsing data for page {current_page}/{total_pages}.")
+            page_jobs = self.parse_job_data(response.content)
+
+            if self.is_exhausted_page(page_jobs, watermark):
+                self.logger.log.info(f"Page {current_page} holds no new postings. Stopping pagination early, "
+                                     f"skipping {total_pages - current_page} pages.")
+                break
+
+        return True
+
+    def iter_jobs(self, batch_size: int = 25):
+        """
+        Scrape the search pages lazily, yielding the parsed job cards in small batches.
+
+        Pages are fetched one window at a time (`max_pages_in_flight` in async mode) and each
+        batch is yielded as soon as enough cards are parsed, so memory is bounded by the batch
+        size instead of the search size. Only the JobIDs are kept for the search watermark.
+
+        Args:
+            batch_size (int, optional): Maximum number of job cards per batch. Defaults to 25.
+
+        Yields:
+            pd.DataFrame: The job cards of a batch, with the same columns as `scrape_jobs`.
+        """
+        self.logger.log.info(f"Starting streaming job scraping with config: {self.config}")
+        batch_size = max(1, batch_size)
+        buffer = []
+        scraped_count = 0
+
+        for page_jobs in self.iter_pages():
+            cards = [job for job in page_jobs if job['Url'] != 'N/A']
+            self.streamed_job_ids.extend(self.job_id_from_url(job['Url']) for job in cards)
+            self.jobs.clear()
+            self.listed_dates.clear()
+            buffer.extend(cards)
+
+            while len(buffer) >= batch_size:
+                scraped_count += batch_size
+                yield pd.DataFrame(buffer[:batch_size])
+                buffer = buffer[batch_size:]
+
+        if buffer:
+            scraped_count += len(buffer)
+            yield pd.DataFrame(buffer)
+
+        self.log_fetch_metrics()
+        self.logger.log.info(f"Streamed {scraped_count} jobs for the {self.config.remote} positions.")
+
+    def iter_pages(self):
+        """
+        Fetch and parse the search pages in order, yielding the job cards of each page.
+
+        The total number of jobs is read from the first page. When a search watermark is
+        configured, pagination stops at the first page holding no new postings.
+
+        Yields:
+            list: The job dictionaries parsed from one page.
+        """
+        watermark = None
+        if self.watermark_store is not None:
+            watermark = self.watermark_store.get(self.generate_main_url())
+            self.watermark_run_time = datetime.now()
+
+        first_response = self.fetch(self.generate_paginated_url(0))
+        if not first_response:
+            self.logger.log.error("Failed to fetch the first page of results.")
+            return
+
+        total_jobs = self.parse_total_jobs(first_response.text)
+        if total_jobs == 0:
+            self.logger.log.warning("No jobs found for the given search criteria.")
+            return
+
+        total_pages = math.ceil(total_jobs / 10)
+        self.logger.log.info(f"Found {total_jobs} jobs. Streaming up to {total_pages} pages.")
+
+        responses = itertools.chain([first_response], self.iter_page_responses(range(10, total_jobs, 10)))
+        for current_page, response in enumerate(responses, start=1):
+            if not response:
+                self.logger.log.error(f"Failed to fetch data for page {current_page}.")
+                continue
+
+            self.logger.log.info(f"Parsing data for page {current_page}/{total_pages}.")
+            page_jobs = self.parse_job_data(response.content)
+            exhausted = watermark is not None and self.is_exhausted_page(page_jobs, watermark)
+            yield page_jobs
+
+            if exhausted:
+                self.logger.log.info(f"Page {current_page} holds no new postings. Stopping pagination early, "
+                                     f"skipping {total_pages - current_page} pages.")
+                return
+
+    def iter_page_responses(self, starts):
+        """Yield the page responses in order, fetching `max_pages_in_flight` pages at a time when async_pages is enabled."""
+        window = max(1, self.config.max_pages_in_flight) if self.config.async_pages else 1
+        for offset in range(0, len(starts), window):
+            batch = starts[offset:offset + window]
+            if window > 1:
+                yield from self.fetch_pages_concurrently(batch)
+            else:
+                yield self.fetch(self.generate_paginated_url(batch[0]))
+
+    def is_exhausted_page(self, page_jobs: list, watermark: SearchWatermark) -> bool:
+        """Returns whether a page has no job cards, or only cards that are known or older than the watermark."""
+        cards = [job for job in page_jobs if job['Url'] != 'N/A']
+        if not cards:
+            return True
+        return all(watermark.is_known(self.job_id_from_url(job['Url'])) or
+                   watermark.is_older(self.listed_dates.get(job['Url']))
+                   for job in cards)
+
+    def update_watermark(self):
+        """Record the JobIDs seen by this run in the search watermark. Call once the run has succeeded."""
+        if self.watermark_store is None or self.watermark_run_time is None:
+            return
+
+        job_ids = self.streamed_job_ids + [self.job_id_from_url(job['Url']) for job in self.jobs if job['Url'] != 'N/A']
+        self.watermark_store.update(self.generate_main_url(), job_ids, self.watermark_run_time)
+        self.logger.log.info(f"Updated the search watermark with {len(job_ids)} JobIDs.")
+
+    @staticmethod
+    def job_id_from_url(url: str) -> str:
+        """Extract the JobID from a job URL, the same way JobDataCleaner does."""
+        return url.split('?position')[0][-10:]
+
+    def fetch_pages_concurrently(self, starts) -> list:
+        """
+        Fetch the paginated search results concurrently.
+
+        At most `config.max_pages_in_flight` requests are in flight at once. The pages are
+        fetched by a thread pool whose `map` returns the responses in the same order as
+        `starts`, so parsing keeps the page order. No event loop is involved, so this also
+        works when called from a running one (Jupyter, async applications).
+
+        Args:
+            starts (iterable): The `start` offsets of the pages to fetch.
+
+        Returns:
+            list: The responses (or None for failed pages) in page order.
+        """
+        max_in_flight = max(1, self.config.max_pages_in_flight)
+        urls = [self.generate_paginated_url(start) for start in starts]
+
+        self.logger.log.info(f"Fetching {len(urls)} pages with up to {max_in_flight} requests in flight.")
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            return list(executor.map(self.fetch, urls))
+
     def fetch_total_jobs(self):
         """Fetch and return the total number of jobs available for the search criteria."""
         try:
             url = self.generate_main_url()
-            response = fetch_until_success(url, self.logger)
+            response = self.fetch(url)
             if response:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_count_element = soup.find('span', {'class': 'results-context-header__job-count'})
-                total_jobs = int(job_count_element.text.strip().replace(',', '')) if job_count_element else 0
-                return total_jobs
+                return self.parse_total_jobs(response.text)
             else:
                 self.logger.log.error("Failed to fetch the total number of jobs.")
                 return 0
@@ -65,9 +286,13 @@ class JobScraper:
             self.logger.log.error(f"Error fetching total jobs: {e}")
             return 0
 
+    def parse_total_jobs(self, html_content) -> int:
+        """Parse the total number of jobs from the results header of a search page."""
+        return self.parser.parse_total_jobs(html_content)
+
     def generate_main_url(self):
         """Generate the main LinkedIn job search URL with the specified filters."""
-        base_url = 'https://www.linkedin.com/jobs/search/'
+        base_url = f'{self.config.base_url}/jobs/search/'
         url_friendly_position = self.config.position.replace(" ", "%20")
         query_params = f'?keywords={url_friendly_position}&location={self.config.location}'
 
@@ -87,111 +312,124 @@ class JobScraper:
         return f"{self.generate_main_url()}&start={start}"
 
     def parse_job_data(self, html_content):
-        """Parse the job data from the HTML content and add it to the jobs list."""
+        """Parse the job data from the HTML content, add it to the jobs list and return the jobs of this page."""
+        page_jobs = []
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            job_listings = soup.find_all('li')
-
-            for job in job_listings:
-                try:
-                    job_info = self.extract_job_info(job)
-                    if job_info:
-                        self.jobs.append(job_info)
-                except Exception as e:
-                    self.logger.log.error(f"Error processing job listing: {e}")
-                    continue
+            for job_info in self.parser.parse_job_cards(html_content):
+                listed_date = job_info.pop('ListedDate')
+                job_info['Remote'] = self.config.remote
+                if self.watermark_store is not None:
+                    self.listed_dates[job_info['Url']] = listed_date
+                page_jobs.append(job_info)
         except Exception as e:
             self.logger.log.error(f"Error parsing job data: {e}")
 
-    def extract_job_info(self, job):
-        """Extract job information from a single job listing."""
-        try:
-            info = job.find('div', class_="base-search-card__info")
-            title = info.find('h3', class_="base-search-card__title").text.strip() if info else 'N/A'
-            company = info.find('h4', class_="base-search-card__subtitle").text.strip() if info else 'N/A'
-
-            metadata = job.find('div', class_="base-search-card__metadata")
-            location_element = metadata.find('span', class_="job-search-card__location") if metadata else None
-            location_job = location_element.text.strip() if location_element else 'N/A'
-
-            joburl_element = job.find('a', class_="base-card__full-link")
-            joburl = joburl_element['href'] if joburl_element else 'N/A'
-
-            return {
-                'Location': location_job,
-                'Title': title,
-                'Company': company,
-                'Url': joburl,
-                'Remote': self.config.remote
-            }
-        except Exception as e:
-            self.logger.log.error(f"Error extracting job info: {e}")
-            return None
+        self.jobs.extend(page_jobs)
+        return page_jobs
 
     def fetch_job_details(self, df_jobs:pd.DataFrame):
         """Fetch detailed job information for each job posting."""
         df_jobs.reset_index(drop=True, inplace=True)
         self.logger.log.info(f"Fetching job description for {df_jobs.shape[0]} postings")
-        extracted_data = []
-
-        for i in range(df_jobs.shape[0]):
-            jobid = str(df_jobs['JobID'][i])
-            target_url = self.get_jobid_information(jobid)
-            response = fetch_until_success(target_url, self.logger)
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Initialize values as 'N/A'
-            seniority_level = 'N/A'
-            employment_type = 'N/A'
-            job_function = 'N/A'
-            industries = 'N/A'
-            
-            # Find job criteria list
-            criteria_list = soup.find('ul', class_='description__job-criteria-list')
-            if criteria_list:
-                criteria_items = criteria_list.find_all('li', class_='description__job-criteria-item')
-                for item in criteria_items:
-                    if 'Seniority level' in item.get_text():
-                        seniority_level = item.find('span', class_='description__job-criteria-text').get_text(strip=True)
-                    elif 'Employment type' in item.get_text():
-                        employment_type = item.find('span', class_='description__job-criteria-text').get_text(strip=True)
-                    elif 'Job function' in item.get_text():
-                        job_function = item.find('span', class_='description__job-criteria-text').get_text(strip=True)
-                    elif 'Industries' in item.get_text():
-                        industries = item.find('span', class_='description__job-criteria-text').get_text(strip=True)
-            
-            # Extract additional job information
-            num_applicants_tag = soup.find('figcaption', class_='num-applicants__caption') or \
-                                 soup.find('span', class_='num-applicants__caption topcard__flavor--metadata topcard__flavor--bullet')
-            num_applicants = num_applicants_tag.get_text(strip=True) if num_applicants_tag else 'N/A'
-            
-            posted_time = soup.find('span', class_='posted-time-ago__text')
-            posted_time = posted_time.get_text(strip=True) if posted_time else 'N/A'
-            
-            description_tag = soup.find('div', class_='show-more-less-html__markup')
-            description = description_tag.get_text(separator=' ', strip=True) if description_tag else 'N/A'
-            
-            # Append the extracted data
-            extracted_data.append({
-                'SeniorityLevel': seniority_level,
-                'EmploymentType': employment_type,
-                'JobFunction': job_function,
-                'Industries': industries,
-                'PostedTime': posted_time,
-                'NumApplicants': num_applicants,
-                'Description': description
-            })
-        
+        job_ids = [str(jobid) for jobid in df_jobs['JobID']]
+
+        workers = max(1, self.config.detail_workers or 1)
+        if workers > 1 and len(job_ids) > 1:
+            extracted_data = self.fetch_job_details_concurrently(job_ids, workers)
+        else:
+            extracted_data = [self.fetch_single_job_details(jobid) for jobid in job_ids]
+
         # Convert the extracted data into a DataFrame
         self.logger.log.info(f"Finished fetching job descriptions for {len(extracted_data)} jobs.")
+        self.log_fetch_metrics()
         extracted_df = pd.DataFrame(extracted_data)
 
         # Merge the job details with the original DataFrame
         return pd.concat([df_jobs, extracted_df], axis=1)
 
+    def fetch_job_details_concurrently(self, job_ids:list, workers:int) -> list:
+        """
+        Fetch and parse the job postings with a pool of worker threads.
+
+        Each worker fetches and parses one posting as soon as it is free. The parsed rows
+        are stored at the position of their JobID, so the returned list keeps the order of
+        `job_ids` and stays aligned with the original DataFrame.
+
+        Args:
+            job_ids (list): The JobIDs to fetch, in DataFrame order.
+            workers (int): Number of worker threads.
+
+        Returns:
+            list: The extracted job details, one dictionary per JobID in the original order.
+        """
+        self.logger.log.info(f"Fetching job details with {workers} workers.")
+        extracted_data = [None] * len(job_ids)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.fetch_single_job_details, jobid): position
+                       for position, jobid in enumerate(job_ids)}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                extracted_data[futures[future]] = future.result()
+                if completed % 50 == 0:
+                    self.logger.log.info(f"Fetched {completed}/{len(job_ids)} job postings.")
+
+        return extracted_data
+
+    def fetch_single_job_details(self, jobid:str) -> dict:
+        """Fetch a single job posting and extract its details."""
+        target_url = self.get_jobid_information(jobid)
+        response = self.fetch(target_url)
+
+        if not response:
+            self.logger.log.error(f"Failed to fetch details for job {jobid}.")
+            return self.parse_job_details(b'')
+
+        return self.parse_job_details(response.content)
+
+    def parse_job_details(self, html_content) -> dict:
+        """Parse the details of a job posting from its HTML content."""
+        return self.parser.parse_job_details(html_content)
+
+    def fetch(self, url):
+        """Fetch a URL, holding one of the per-host request slots while the request is in flight."""
+        with self.host_slot(url):
+            return self.fetcher.fetch_until_success(url, self.logger, cache=self.response_cache)
+
+    def open_response_cache(self):
+        """Open the configured response cache, unless it is already open."""
+        if self.config.response_cache_file and self.response_cache is None:
+            self.response_cache = ResponseCache(self.config.response_cache_file, self.config.response_cache_max_mb)
+
+    def close_response_cache(self):
+        """Close the response cache connection. The next run opens it again."""
+        if self.response_cache is not None:
+            self.response_cache.close()
+            self.response_cache = None
+
+    def log_fetch_metrics(self):
+        """Log the rate limiter state and, when enabled, the response cache counters."""
+        self.fetcher.log_metrics(self.logger)
+        if self.response_cache is not None:
+            self.response_cache.log_stats(self.logger)
+
+    @contextmanager
+    def host_slot(self, url):
+        """Limit the number of concurrent requests per host to `config.max_requests_per_host`."""
+        if not self.config.max_requests_per_host:
+            yield
+            return
+
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.config.max_requests_per_host)
+            semaphore = self._host_semaphores[host]
+
+        with semaphore:
+            yield
+
     def get_jobid_information(self, jobid):
         """Generate the URL to fetch detailed job posting data based on job ID."""
-        base_url = 'https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/'
+        base_url = f'{self.config.base_url}/jobs-guest/jobs/api/jobPosting/'
         return base_url + jobid
  
\ No newline at end of file
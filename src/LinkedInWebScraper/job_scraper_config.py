@@ -9,11 +9,82 @@ class JobScraperConfig:
         time_posted (str): The time frame in which the job was posted. Defaults to 'DAY'
         remote (str, optional): The remote work preference. Defaults to 'ALL'.
         distance (int, optional): The distance for the job search. Defaults to 10.
+        async_pages (bool, optional): Fetch the paginated search results concurrently with a thread pool. Defaults to False.
+        max_pages_in_flight (int, optional): Maximum number of search pages requested at the same time
+            when async_pages is enabled. Defaults to 5.
+        detail_workers (int, optional): Number of worker threads fetching job posting details. Defaults to 1 (sequential).
+        max_requests_per_host (int, optional): Maximum number of concurrent requests sent to a single host.
+            Defaults to None (only bounded by the number of workers).
+        response_cache_file (str, optional): Path of an on-disk HTTP response cache. Defaults to None (no cache).
+        response_cache_max_mb (int, optional): Maximum size of the response cache in megabytes. Defaults to 256.
+        incremental (bool, optional): Skip detail fetching and enrichment for JobIDs already stored. Defaults to False.
+        known_jobs_file (str, optional): CSV file holding the already stored jobs, used by incremental mode. Defaults to None.
+        watermark_file (str, optional): JSON file of per-search watermarks. When set, pagination stops at the first
+            page holding only known or older postings. Defaults to None.
+        dedupe_index_file (str, optional): SQLite index of the postings already processed, shared by every run,
+            city and remote type. Seen JobIDs and listings are skipped before their details are fetched.
+            Defaults to None (no index).
+        dedupe_max_age_days (int, optional): Days after which a posting in the dedupe index counts as new again.
+            Defaults to 30.
+        near_duplicate_index_file (str, optional): SQLite MinHash/LSH index of the enriched descriptions. Postings
+            whose description nearly duplicates an enriched one reuse its enrichment instead of calling OpenAI.
+            Defaults to None (every posting is enriched).
+        near_duplicate_threshold (float, optional): Minimum estimated Jaccard similarity of the description shingles
+            for two postings to count as near-duplicates. Defaults to 0.9.
+        near_duplicate_max_age_days (int, optional): Days after which an enrichment in the near-duplicate index is
+            no longer reused. Defaults to 30.
+        openai_max_in_flight (int, optional): Maximum number of OpenAI enrichment requests in flight at the same time.
+            Defaults to 1 (sequential).
+        openai_requests_per_minute (int, optional): Maximum OpenAI requests per minute. Defaults to None (unlimited).
+        openai_tokens_per_minute (int, optional): Maximum estimated OpenAI tokens per minute. Defaults to None (unlimited).
+        completion_cache_file (str, optional): SQLite cache of the OpenAI completions keyed by description, prompt
+            version and model. Defaults to None (no cache).
+        completion_cache_max_mb (int, optional): Maximum size of the completion cache in megabytes. Defaults to 64.
+        openai_batch_state_file (str, optional): JSON state file of the OpenAI Batch API mode. When set, the descriptions
+            are enriched through batches that later runs resume, instead of synchronous requests. Defaults to None.
+        openai_batch_poll_interval (float, optional): Seconds between two polls of the pending batches. Defaults to 30.
+        openai_batch_max_wait (float, optional): Seconds a run waits for its batches. Jobs still pending afterwards are
+            left out and merged by a later run. Defaults to 3600.
+        openai_pack_requests (bool, optional): Send several job descriptions per OpenAI request, sized from the measured
+            token counts. Defaults to False.
+        openai_pack_token_budget (int, optional): Maximum estimated prompt plus completion tokens of a packed request.
+            Defaults to 12000.
+        openai_max_pack_size (int, optional): Maximum number of job descriptions per packed request. Defaults to 20.
+        trim_descriptions (bool, optional): Strip boilerplate sentences recurring across postings from the job descriptions
+            before enrichment. Defaults to False.
+        description_index_file (str, optional): SQLite index of the sentence counts, shared by every run. Defaults to None
+            (sentences are counted within the run only).
+        boilerplate_min_postings (int, optional): Distinct postings containing a sentence before it is stripped. Defaults to 5.
+        description_max_tokens (int, optional): Maximum tokens of a trimmed job description. Defaults to None (no cap).
+        parser_backend (str, optional): HTML parser backend, 'bs4' or 'lxml' (requires lxml). Defaults to 'bs4'.
+        base_url (str, optional): Scheme and host every request is sent to, e.g. a local replay server.
+            Defaults to 'https://www.linkedin.com'.
+        cleaner_backend (str, optional): DataFrame backend of the cleaning steps, 'pandas' or 'polars'
+            (requires polars). Defaults to 'pandas'.
+        location_cache_file (str, optional): JSON file persisting the fuzzy location matches between runs.
+            Defaults to None (matches are only cached in memory).
+        memory_report (bool, optional): Log the bytes used by each column before and after the compact job
+            schema is enforced at every stage. Defaults to False.
 
     Returns:
         str: A formatted string representing the JobScraperConfig object with its attributes.
     '''
-    def __init__(self, position: str, location: str, openai_enabled: bool = False, time_posted: str = 'DAY', remote: str = 'ALL', distance: int = 10, advanced_config: JobScraperAdvancedConfig = None):
+    def __init__(self, position: str, location: str, openai_enabled: bool = False, time_posted: str = 'DAY', remote: str = 'ALL', distance: int = 10, advanced_config: JobScraperAdvancedConfig = None,
+                 async_pages: bool = False, max_pages_in_flight: int = 5, detail_workers: int = 1, max_requests_per_host: int = None,
+                 response_cache_file: str = None, response_cache_max_mb: int = 256,
+                 incremental: bool = False, known_jobs_file: str = None,
+                 watermark_file: str = None, dedupe_index_file: str = None, dedupe_max_age_days: int = 30,
+                 near_duplicate_index_file: str = None, near_duplicate_threshold: float = 0.9,
+                 near_duplicate_max_age_days: int = 30,
+                 openai_max_in_flight: int = 1, openai_requests_per_minute: int = None, openai_tokens_per_minute: int = None,
+                 completion_cache_file: str = None, completion_cache_max_mb: int = 64,
+                 openai_batch_state_file: str = None, openai_batch_poll_interval: float = 30, openai_batch_max_wait: float = 3600,
+                 openai_pack_requests: bool = False, openai_pack_token_budget: int = 12000, openai_max_pack_size: int = 20,
+                 trim_descriptions: bool = False, description_index_file: str = None, boilerplate_min_postings: int = 5,
+                 description_max_tokens: int = None,
+                 parser_backend: str = 'bs4',
+                 base_url: str = 'https://www.linkedin.com', cleaner_backend: str = 'pandas', location_cache_file: str = None,
+                 memory_report: bool = False):
         self.position = position
         self.location = location
         self.openai_enabled = openai_enabled
@@ -21,9 +92,54 @@ class JobScraperConfig:
         self.remote = remote
         self.distance = distance
         self.advanced_config = advanced_config
+        self.async_pages = async_pages
+        self.max_pages_in_flight = max_pages_in_flight
+        self.detail_workers = detail_workers
+        self.max_requests_per_host = max_requests_per_host
+        self.response_cache_file = response_cache_file
+        self.response_cache_max_mb = response_cache_max_mb
+        self.incremental = incremental
+        self.known_jobs_file = known_jobs_file
+        self.watermark_file = watermark_file
+        self.dedupe_index_file = dedupe_index_file
+        self.dedupe_max_age_days = dedupe_max_age_days
+        self.near_duplicate_index_file = near_duplicate_index_file
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.near_duplicate_max_age_days = near_duplicate_max_age_days
+        self.openai_max_in_flight = openai_max_in_flight
+        self.openai_requests_per_minute = openai_requests_per_minute
+        self.openai_tokens_per_minute = openai_tokens_per_minute
+        self.completion_cache_file = completion_cache_file
+        self.completion_cache_max_mb = completion_cache_max_mb
+        self.openai_batch_state_file = openai_batch_state_file
+        self.openai_batch_poll_interval = openai_batch_poll_interval
+        self.openai_batch_max_wait = openai_batch_max_wait
+        self.openai_pack_requests = openai_pack_requests
+        self.openai_pack_token_budget = openai_pack_token_budget
+        self.openai_max_pack_size = openai_max_pack_size
+        self.trim_descriptions = trim_descriptions
+        self.description_index_file = description_index_file
+        self.boilerplate_min_postings = boilerplate_min_postings
+        self.description_max_tokens = description_max_tokens
+        self.parser_backend = parser_backend
+        self.base_url = base_url.rstrip('/')
+        self.cleaner_backend = cleaner_backend
+        self.location_cache_file = location_cache_file
+        self.memory_report = memory_report
 
     def __str__(self):
         """String representation of the configuration."""
         return (f"JobScraperConfig(position={self.position}, location={self.location}, openai_enabled={self.openai_enabled}"
-                f", time_posted={self.time_posted}, remote={self.remote}, distance={self.distance})")
-
+                f", time_posted={self.time_posted}, remote={self.remote}, distance={self.distance}"
+                f", async_pages={self.async_pages}, max_pages_in_flight={self.max_pages_in_flight}"
+                f", detail_workers={self.detail_workers}, max_requests_per_host={self.max_requests_per_host}"
+                f", response_cache_file={self.response_cache_file}, incremental={self.incremental}"
+                f", watermark_file={self.watermark_file}, dedupe_index_file={self.dedupe_index_file}"
+                f", near_duplicate_index_file={self.near_duplicate_index_file}"
+                f", openai_max_in_flight={self.openai_max_in_flight}, openai_requests_per_minute={self.openai_requests_per_minute}"
+                f", openai_tokens_per_minute={self.openai_tokens_per_minute}, completion_cache_file={self.completion_cache_file}"
+                f", openai_batch_state_file={self.openai_batch_state_file}, openai_pack_requests={self.openai_pack_requests}"
+                f", trim_descriptions={self.trim_descriptions}, description_max_tokens={self.description_max_tokens}"
+                f", parser_backend={self.parser_backend}"
+                f", base_url={self.base_url}, cleaner_backend={self.cleaner_backend}"
+                f", location_cache_file={self.location_cache_file}, memory_report={self.memory_report})")
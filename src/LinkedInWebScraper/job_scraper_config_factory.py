@@ -2,14 +2,17 @@ from LinkedInWebScraper.job_scraper_config import JobScraperConfig
 
 class JobScraperConfigFactory:
     @staticmethod
-    def create(position: str, location: str, openai_enabled: bool, time_posted: str, remote: str) -> JobScraperConfig:
+    def create(position: str, location: str, openai_enabled: bool, time_posted: str, remote: str, **options) -> JobScraperConfig:
         """
         Factory method to create a JobScraperConfig.
+
+        Any additional keyword options are passed through to JobScraperConfig.
         """
         return JobScraperConfig(
             position=position,
             location=location,
             openai_enabled=openai_enabled,
             time_posted=time_posted,
-            remote=remote
+            remote=remote,
+            **options
         )
@@ -1,22 +1,65 @@
 import re
+import numpy as np
 import pandas as pd
 
 from Utils.logger import Logger
 from Utils.constants import DATA_SCIENCE_KEYWORDS
 
+def build_keyword_pattern(keywords: list) -> str:
+    """
+    Build one regex matching any of the keywords as a whole word.
+
+    The escaped keywords are merged into a trie, so shared prefixes are tested once and a
+    title is scanned in a single pass however long the keyword list is.
+
+    Args:
+        keywords (list): Lower-case keywords.
+
+    Returns:
+        str: The pattern, wrapped in word boundaries.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_pattern(node):
+        alternatives = []
+        optional = '' in node
+        for char in sorted(char for char in node if char):
+            alternatives.append(re.escape(char) + to_pattern(node[char]))
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and not optional:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')' + ('?' if optional else '')
+
+    return rf'\b{to_pattern(trie)}\b' if keywords else r'(?!)'
+
 class JobTitleClassifier:
-    def __init__(self, logger: Logger, position: str, keywords: list = None):
+    # Decisions per title, shared by every classifier compiled from the same keywords
+    _shared_memos = {}
+    MAX_MEMO_SIZE = 200000
+
+    def __init__(self, logger: Logger, position: str, keywords: list = None, memoize: bool = True):
         """
         Initialize the classifier with a list of keywords.
 
         Args:
             keywords (list): A list of keywords to classify job titles.
                              If None, a default list for data science-related jobs is used.
+            memoize (bool, optional): Remember the decision of each distinct title, so titles repeated
+                                      across batches, cities and runs in the same process are matched once.
+                                      Defaults to True.
         """
         self.logger = logger
         self.position = position
+        self.memoize = memoize
         if keywords is not None:
             self.keywords = [keyword.lower() for keyword in keywords]
+            self.pattern = re.compile(build_keyword_pattern(self.keywords))
             self.logger.log.info(f"Initialized JobTitleClassifier with keywords: {self.keywords} for {self.position}")
         else:
             self.logger.log.info(f'No keywords were given. Running without classifying job titles.')
@@ -37,18 +80,56 @@ class JobTitleClassifier:
 
         self.logger.log.info(f"Starting classification of {len(df_jobs)} {self.position} job titles.")
 
-        df_jobs['DS_Related'] = df_jobs['Title'].apply(self._classify_single_title)
+        is_related = self.classify_titles(df_jobs['Title'])
 
-        related_jobs_count = df_jobs['DS_Related'].sum()
+        related_jobs_count = int(is_related.sum())
         self.logger.log.info(f"Classified {related_jobs_count} jobs as related to {self.position}.")
 
-        df_jobs = df_jobs.loc[df_jobs['DS_Related'] == 1].copy()
-        df_jobs.drop(columns=['DS_Related'], inplace=True)
+        df_jobs = df_jobs.loc[is_related].copy()
 
         self.logger.log.info(f"Returning DataFrame with {len(df_jobs)} {self.position} related jobs.")
 
         return df_jobs
 
+    def classify_titles(self, titles: pd.Series) -> pd.Series:
+        """
+        Classify a column of job titles.
+
+        Each distinct title is matched once with `str.contains`; with memoization enabled, titles
+        classified earlier are not matched again.
+
+        Args:
+            titles (pd.Series): Job titles.
+
+        Returns:
+            pd.Series: Boolean Series, True for the titles containing any of the keywords.
+        """
+        codes, unique_titles = pd.factorize(titles)
+        unique_titles = np.asarray(unique_titles, dtype=object)
+
+        if self.memoize:
+            memo = self._shared_memos.setdefault(self.pattern.pattern, {})
+            decisions = [memo.get(title) for title in unique_titles]
+            unknown = [position for position, decision in enumerate(decisions) if decision is None]
+            if unknown:
+                unknown_titles = unique_titles[unknown]
+                new_decisions = self.match_titles(unknown_titles)
+                for position, decision in zip(unknown, new_decisions):
+                    decisions[position] = decision
+                if len(memo) + len(unknown) > self.MAX_MEMO_SIZE:
+                    memo.clear()
+                memo.update(zip(unknown_titles, new_decisions))
+        else:
+            decisions = self.match_titles(unique_titles)
+
+        # Titles missing from the column (code -1) are never related
+        decisions = np.append(np.asarray(decisions, dtype=bool), False)
+        return pd.Series(decisions[codes], index=titles.index)
+
+    def match_titles(self, titles) -> list:
+        """Returns, for each title, whether it contains any of the keywords."""
+        return pd.Series(titles, dtype=object).str.lower().str.contains(self.pattern).tolist()
+
     def _classify_single_title(self, title):
         """
         Classify a single job title by checking if it contains any of the keywords.
@@ -59,12 +140,4 @@ class JobTitleClassifier:
         Returns:
             int: 1 if the title contains any of the keywords, 0 otherwise.
         """
-        title_lower = title.lower()
-
-        for keyword in self.keywords:
-            if re.search(rf'\b{keyword}\b', title_lower):
-                self.logger.log.debug(f"Title '{title}' matches keyword '{keyword}'")
-                return 1
-
-        self.logger.log.debug(f"Title '{title}' does not match any keywords.")
-        return 0
+        return 1 if self.pattern.search(title.lower()) else 0
@@ -1,30 +1,78 @@
 import pandas as pd
 
+from LinkedInWebScraper.batch_enrichment import BatchEnricher
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.dedupe_index import DedupeIndex
+from LinkedInWebScraper.description_trimmer import DescriptionTrimmer
 from LinkedInWebScraper.job_scraper import JobScraper
 from LinkedInWebScraper.job_scraper_config import JobScraperConfig
-from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+from LinkedInWebScraper.job_data_cleaner import get_job_data_cleaner
 from LinkedInWebScraper.job_title_classifier import JobTitleClassifier
 from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.job_schema import enforce_schema, memory_report
+from LinkedInWebScraper.near_duplicate_index import NearDuplicateIndex
+from LinkedInWebScraper.request_packer import RequestPacker
+from LinkedInWebScraper.utils import HttpFetcher
 from OpenAIHandler.openai_handler import OpenAIHandler
 from Utils.logger import Logger
+from Utils.file_manager import FileManager
 
 from Utils.constants import LOCATION_MAPPING, DATA_SCIENCE_KEYWORDS, TECH_STACK_CATEGORIES
 
 class LinkedInJobScraper:
-    def __init__(self, logger: Logger, config: JobScraperConfig):
+    def __init__(self, logger: Logger, config: JobScraperConfig, fetcher: HttpFetcher = None, openai_client=None):
         self.config = config
         self.logger = logger
 
-        self.job_scraper = JobScraper(config=self.config, logger=self.logger)
-        self.job_data_cleaner = JobDataCleaner(self.logger)
+        self.job_scraper = JobScraper(config=self.config, logger=self.logger, fetcher=fetcher)
+        self.job_data_cleaner = get_job_data_cleaner(self.config.cleaner_backend, self.logger,
+                                                     location_cache_file=self.config.location_cache_file)
 
         self.initialize_advanced_config()
+        self.skipped_known_jobs = 0
+        self.skipped_seen_jobs = 0
+        self.run_start_time = None
+
+        self.dedupe_index = None
+        if self.config.dedupe_index_file:
+            self.dedupe_index = DedupeIndex(self.config.dedupe_index_file, self.config.dedupe_max_age_days)
  
         self.job_title_classifier = JobTitleClassifier(self.logger, self.config.position, self.KEYWORDS)
 
         if self.config.openai_enabled:
-            openai_handler = OpenAIHandler(self.logger)
-            self.description_processor = JobDescriptionProcessor(openai_handler, self.logger)
+            openai_handler = OpenAIHandler(self.logger, client=openai_client)
+            near_duplicate_index = None
+            if self.config.near_duplicate_index_file:
+                near_duplicate_index = NearDuplicateIndex(self.config.near_duplicate_index_file,
+                                                          threshold=self.config.near_duplicate_threshold,
+                                                          max_age_days=self.config.near_duplicate_max_age_days)
+            completion_cache = None
+            if self.config.completion_cache_file:
+                completion_cache = CompletionCache(self.config.completion_cache_file, self.config.completion_cache_max_mb)
+            batch_enricher = None
+            if self.config.openai_batch_state_file:
+                batch_enricher = BatchEnricher(openai_handler, self.logger, self.config.openai_batch_state_file,
+                                               poll_interval=self.config.openai_batch_poll_interval,
+                                               max_wait=self.config.openai_batch_max_wait)
+            packer = None
+            if self.config.openai_pack_requests:
+                packer = RequestPacker(self.config.openai_pack_token_budget, self.config.openai_max_pack_size)
+            trimmer = None
+            if self.config.trim_descriptions:
+                trimmer = DescriptionTrimmer(self.config.description_index_file or ':memory:',
+                                             min_postings=self.config.boilerplate_min_postings,
+                                             max_tokens=self.config.description_max_tokens,
+                                             model=openai_handler.model, logger=self.logger)
+            self.description_processor = JobDescriptionProcessor(
+                openai_handler, self.logger, near_duplicate_index,
+                max_in_flight=self.config.openai_max_in_flight,
+                requests_per_minute=self.config.openai_requests_per_minute,
+                tokens_per_minute=self.config.openai_tokens_per_minute,
+                completion_cache=completion_cache,
+                batch_enricher=batch_enricher,
+                packer=packer,
+                trimmer=trimmer
+            )
 
     def initialize_advanced_config(self):
         """
@@ -46,6 +94,9 @@ class LinkedInJobScraper:
         """Main function to run the LinkedIn job scraping process."""
         try:
             self.logger.log.info(f'Running scraping job for {self.config.remote} {self.config.position} positions.')
+            self.run_start_time = pd.Timestamp.now()
+            self.reset_waiting_jobs()
+            self.job_scraper.open_response_cache()
             scraped_jobs = self.scrape_jobs()
 
             if scraped_jobs.empty:
@@ -54,6 +105,20 @@ class LinkedInJobScraper:
 
             cleaned_jobs = self.clean_jobs(scraped_jobs)
 
+            if self.config.incremental:
+                cleaned_jobs = self.filter_known_jobs(cleaned_jobs)
+                if cleaned_jobs.empty:
+                    self.logger.log.info(f"No new {self.config.remote} {self.config.position} jobs since the last run.")
+                    self.update_watermark()
+                    return pd.DataFrame()
+
+            if self.dedupe_index is not None:
+                cleaned_jobs = self.filter_seen_jobs(cleaned_jobs)
+                if cleaned_jobs.empty:
+                    self.logger.log.info(f"All {self.config.remote} {self.config.position} jobs were processed by earlier runs.")
+                    self.update_watermark()
+                    return pd.DataFrame()
+
             if self.KEYWORDS != None:
                 classified_jobs = self.classify_jobs(cleaned_jobs)
             else:
@@ -61,6 +126,7 @@ class LinkedInJobScraper:
 
             if classified_jobs.empty:
                 self.logger.log.warning(f"No jobs remain after title classification.")
+                self.update_watermark()
                 return pd.DataFrame()
             
             jobs_with_details = self.fetch_job_details(classified_jobs)
@@ -70,14 +136,121 @@ class LinkedInJobScraper:
             if self.config.openai_enabled:      
                 enriched_jobs = self.enrich_jobs_with_descriptions(cleaned_jobs_with_details)
                 final_jobs = self.final_processing(enriched_jobs)
+                if not final_jobs.empty:
+                    self.record_seen_jobs(final_jobs)
+                    self.update_watermark()
                 return final_jobs
             else:
                 self.logger.log.info(f'The OpenAI Enabled feature is  {self.config.openai_enabled}. Returning jobs with details only. ')
-                return jobs_with_details
+                if not jobs_with_details.empty:
+                    self.record_seen_jobs(jobs_with_details)
+                    self.update_watermark()
+                return self.apply_schema(jobs_with_details, 'detail fetching')
 
         except Exception as e:
             self.logger.log.exception(f"An error occurred during the scraping process: {e}")
             return pd.DataFrame()
+        finally:
+            self.job_scraper.close_response_cache()
+
+    def stream(self, batch_size: int = 25):
+        """
+        Run the scraping process as a generator, yielding the processed jobs in small batches.
+
+        Each batch of scraped cards goes through cleaning, title classification, the detail
+        fetch and (when enabled) the OpenAI enrichment before the next pages are fetched, so
+        a sink can write results as soon as the first batch is ready and memory stays bounded
+        by the batch size. Duplicates are removed across batches as well as within them.
+
+        Args:
+            batch_size (int, optional): Maximum number of scraped job cards per batch. Defaults to 25.
+
+        Yields:
+            pd.DataFrame: The processed jobs of a batch, with the same columns as `run`.
+        """
+        self.logger.log.info(f'Streaming scraping job for {self.config.remote} {self.config.position} positions '
+                             f'in batches of {batch_size}.')
+        self.run_start_time = pd.Timestamp.now()
+        self.reset_waiting_jobs()
+        known_job_ids = self.load_known_job_ids() if self.config.incremental else None
+        seen_job_ids = set()
+        seen_postings = set()
+        streamed_count = 0
+        self.job_scraper.open_response_cache()
+
+        try:
+            for scraped_batch in self.job_scraper.iter_jobs(batch_size):
+                cleaned_batch = self.clean_jobs(scraped_batch)
+                if cleaned_batch.empty:
+                    continue
+
+                # Drop the postings already yielded by a previous batch
+                posting_keys = list(zip(cleaned_batch['Location'], cleaned_batch['Title'], cleaned_batch['Company']))
+                is_seen = cleaned_batch['JobID'].isin(seen_job_ids) | pd.Series(
+                    [key in seen_postings for key in posting_keys], index=cleaned_batch.index)
+                seen_job_ids.update(cleaned_batch['JobID'])
+                seen_postings.update(posting_keys)
+                cleaned_batch = cleaned_batch.loc[~is_seen].reset_index(drop=True)
+
+                if known_job_ids is not None:
+                    cleaned_batch = self.filter_known_jobs(cleaned_batch, known_job_ids)
+
+                if self.dedupe_index is not None and not cleaned_batch.empty:
+                    cleaned_batch = self.filter_seen_jobs(cleaned_batch)
+
+                processed_batch = self.process_batch(cleaned_batch)
+                if processed_batch.empty:
+                    continue
+
+                self.record_seen_jobs(processed_batch)
+
+                streamed_count += len(processed_batch)
+                self.logger.log.info(f"Streaming a batch of {len(processed_batch)} jobs ({streamed_count} so far).")
+                yield processed_batch
+
+        except Exception as e:
+            self.logger.log.exception(f"An error occurred during the streaming scraping process: {e}")
+            return
+        finally:
+            self.job_scraper.close_response_cache()
+
+        self.update_watermark()
+        self.logger.log.info(f"Finished streaming {streamed_count} {self.config.remote} {self.config.position} jobs.")
+
+    def reset_waiting_jobs(self):
+        """Forget the postings left waiting for their OpenAI batch by a previous run."""
+        if self.config.openai_enabled:
+            self.description_processor.waiting_job_ids.clear()
+
+    def update_watermark(self):
+        """
+        Move the search watermark forward, unless postings of this run are still waiting for their OpenAI batch.
+
+        The watermark would stop the next run's pagination before the waiting postings, so their batch
+        results would never be merged. It is left unchanged until a run enriches them.
+        """
+        if self.config.openai_enabled and self.description_processor.waiting_job_ids:
+            self.logger.log.info(f"Keeping the search watermark: {len(self.description_processor.waiting_job_ids)} jobs "
+                                 f"are still waiting for their OpenAI batch.")
+            return
+        self.job_scraper.update_watermark()
+
+    def process_batch(self, cleaned_jobs: pd.DataFrame) -> pd.DataFrame:
+        """Classify a batch of cleaned jobs, fetch their details and enrich them when OpenAI is enabled."""
+        if cleaned_jobs.empty:
+            return cleaned_jobs
+
+        classified_jobs = self.classify_jobs(cleaned_jobs) if self.KEYWORDS != None else cleaned_jobs
+        if classified_jobs.empty:
+            return classified_jobs
+
+        jobs_with_details = self.fetch_job_details(classified_jobs)
+        cleaned_jobs_with_details = self.clean_job_details(jobs_with_details)
+
+        if self.config.openai_enabled:
+            enriched_jobs = self.enrich_jobs_with_descriptions(cleaned_jobs_with_details)
+            return self.final_processing(enriched_jobs)
+        return self.apply_schema(jobs_with_details, 'detail fetching')
 
     def scrape_jobs(self) -> pd.DataFrame:
         """Scrape jobs from LinkedIn using JobScraper."""
@@ -96,11 +269,61 @@ class LinkedInJobScraper:
             cleaned_jobs = self.job_data_cleaner.clean_jobs_dataframe(scraped_jobs, self.LOCATION_MAPPING)
             if cleaned_jobs.empty:
                 self.logger.log.warning(f"No jobs remain after cleaning for {self.config.remote} {self.config.position}.")
-            return cleaned_jobs
+            return self.apply_schema(cleaned_jobs, 'cleaning')
         except Exception as e:
             self.logger.log.exception(f"Failed to clean jobs data: {e}")
             return pd.DataFrame()
 
+    def load_known_job_ids(self):
+        """Load the JobIDs stored in the known jobs file, or None if they cannot be loaded."""
+        if not self.config.known_jobs_file:
+            self.logger.log.warning("Incremental mode is enabled but no known_jobs_file was configured.")
+            return None
+
+        try:
+            return FileManager(self.logger, self.config).load_known_job_ids(self.config.known_jobs_file)
+        except Exception as e:
+            self.logger.log.exception(f"Failed to load known JobIDs from {self.config.known_jobs_file}: {e}")
+            return None
+
+    def filter_known_jobs(self, cleaned_jobs: pd.DataFrame, known_job_ids: set = None) -> pd.DataFrame:
+        """Drop the jobs whose JobID is already stored, so their details and enrichment are not fetched again."""
+        if known_job_ids is None:
+            known_job_ids = self.load_known_job_ids()
+            if known_job_ids is None:
+                return cleaned_jobs
+
+        is_known = cleaned_jobs['JobID'].astype(str).isin(known_job_ids)
+        skipped_count = int(is_known.sum())
+        self.skipped_known_jobs += skipped_count
+        self.logger.log.info(f"Incremental mode: {skipped_count} of {len(cleaned_jobs)} jobs are already stored in "
+                             f"{self.config.known_jobs_file}. Skipping {skipped_count} detail fetches.")
+
+        return cleaned_jobs.loc[~is_known].reset_index(drop=True)
+
+    def filter_seen_jobs(self, cleaned_jobs: pd.DataFrame) -> pd.DataFrame:
+        """Drop the jobs whose JobID or listing is in the dedupe index, so their details are not fetched again."""
+        try:
+            is_seen = self.dedupe_index.seen_mask(cleaned_jobs)
+        except Exception as e:
+            self.logger.log.exception(f"Failed to look up jobs in the dedupe index {self.config.dedupe_index_file}: {e}")
+            return cleaned_jobs
+
+        skipped_count = int(is_seen.sum())
+        self.skipped_seen_jobs += skipped_count
+        self.logger.log.info(f"Dedupe index: {skipped_count} of {len(cleaned_jobs)} jobs were processed by earlier runs. "
+                             f"Skipping {skipped_count} detail fetches.")
+        return cleaned_jobs.loc[~is_seen].reset_index(drop=True)
+
+    def record_seen_jobs(self, processed_jobs: pd.DataFrame):
+        """Record processed jobs in the dedupe index, if one is configured."""
+        if self.dedupe_index is None or processed_jobs.empty:
+            return
+        try:
+            self.dedupe_index.add(processed_jobs)
+        except Exception as e:
+            self.logger.log.exception(f"Failed to record jobs in the dedupe index {self.config.dedupe_index_file}: {e}")
+
     def classify_jobs(self, cleaned_jobs: pd.DataFrame) -> pd.DataFrame:
         """Classify job titles using JobTitleClassifier."""
         try:  
@@ -123,8 +346,8 @@ class LinkedInJobScraper:
 
     def clean_job_details(self,jobs_with_details:pd.DataFrame ) ->pd.DataFrame:
         try:
-            cleaned_jobs_with_details = self.job_data_cleaner.clean_extracted_job_data(jobs_with_details)
-            return cleaned_jobs_with_details
+            cleaned_jobs_with_details = self.job_data_cleaner.clean_extracted_job_data(jobs_with_details, self.run_start_time)
+            return self.apply_schema(cleaned_jobs_with_details, 'detail cleaning')
         except Exception as e:
             self.logger.log.exception(f"Failed to clean extracted job data: {e}")
             return pd.DataFrame()
@@ -142,7 +365,34 @@ class LinkedInJobScraper:
         """Perform final processing on the enriched job data."""
         try:
             final_jobs = self.job_data_cleaner.process_enriched_job_data(enriched_jobs,self.SKILLS_CATEGORIES)
-            return final_jobs
+            one_hot_columns = list(self.SKILLS_CATEGORIES) + ['Other'] if self.SKILLS_CATEGORIES != None else None
+            return self.apply_schema(final_jobs, 'final processing', one_hot_columns)
         except Exception as e:
             self.logger.log.exception(f"Failed during final job data processing: {e}")
             return pd.DataFrame()
+
+    def apply_schema(self, df_jobs: pd.DataFrame, stage: str, one_hot_columns: list = None) -> pd.DataFrame:
+        """
+        Convert the output of a pipeline stage to the compact job schema.
+
+        When the memory_report option is enabled, the bytes used by each column before and after
+        the conversion are logged.
+
+        Args:
+            df_jobs (pd.DataFrame): The jobs produced by the stage.
+            stage (str): Name of the stage, used in the log messages.
+            one_hot_columns (list, optional): Tech stack category columns to store as one-hot flags. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The jobs with their compact dtypes.
+        """
+        if df_jobs.empty:
+            return df_jobs
+
+        compact_jobs = enforce_schema(df_jobs, one_hot_columns=one_hot_columns)
+        if self.config.memory_report:
+            report = memory_report(df_jobs, compact_jobs)
+            total = report.loc['Total']
+            self.logger.log.info(f"Memory after {stage}: {total['bytes_before']:,} bytes -> {total['bytes_after']:,} bytes "
+                                 f"({total['saved_pct']}% saved).\n{report.to_string()}")
+        return compact_jobs
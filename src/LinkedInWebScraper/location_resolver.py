@@ -0,0 +1,95 @@
+import difflib
+import hashlib
+import json
+import os
+import threading
+import unicodedata
+
+def fold_location(text: str) -> str:
+    """Fold a location for matching: strip accents, casefold and collapse whitespace."""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+class LocationResolver:
+    """
+    Resolves scraped locations to the areas of a location mapping.
+
+    The mapping keys are folded once (accents stripped, casefolded, whitespace collapsed), so
+    spelling variants such as 'San Nicolas de los Garza' resolve without duplicate keys. A city
+    missing from the folded index falls back to the closest key whose difflib similarity reaches
+    `fuzzy_cutoff`. Fuzzy results, misses included, are memoized and, when a cache file is given,
+    persisted as JSON so later runs skip the fuzzy search. The cache is tied to a fingerprint of
+    the mapping and discarded when the mapping changes.
+
+    Args:
+        location_mapping (dict): City names mapped to their area.
+        cache_file (str, optional): JSON file persisting the fuzzy matches. Defaults to None (in memory only).
+        fuzzy_cutoff (float, optional): Minimum similarity ratio, between 0 and 1, of a fuzzy match.
+            None disables fuzzy matching. Defaults to 0.88.
+    """
+
+    def __init__(self, location_mapping: dict, cache_file: str = None, fuzzy_cutoff: float = 0.88):
+        self.location_mapping = location_mapping
+        self.cache_file = cache_file
+        self.fuzzy_cutoff = fuzzy_cutoff
+
+        self.index = {}
+        for city, area in location_mapping.items():
+            self.index.setdefault(fold_location(city), area)
+        self._keys = list(self.index)
+
+        self.fingerprint = hashlib.sha256(
+            json.dumps(sorted(location_mapping.items()), ensure_ascii=False).encode('utf-8')).hexdigest()
+        self._fuzzy_matches = self._load_cache()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> dict:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('fingerprint') != self.fingerprint or cache.get('fuzzy_cutoff') != self.fuzzy_cutoff:
+            return {}
+        return cache.get('matches', {})
+
+    def save(self):
+        """Write the fuzzy matches to the cache file if new ones were found since the last save."""
+        if not self.cache_file or not self._dirty:
+            return
+        with self._lock:
+            cache = {'fingerprint': self.fingerprint, 'fuzzy_cutoff': self.fuzzy_cutoff, 'matches': self._fuzzy_matches}
+            temp_path = f'{self.cache_file}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(cache, file, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.cache_file)
+            self._dirty = False
+
+    def resolve_city(self, city: str):
+        """Returns the area of a city name, or None if it matches no mapping key."""
+        key = fold_location(city)
+        area = self.index.get(key)
+        if area is not None or not key or self.fuzzy_cutoff is None:
+            return area
+
+        if key in self._fuzzy_matches:
+            return self._fuzzy_matches[key]
+
+        matches = difflib.get_close_matches(key, self._keys, n=1, cutoff=self.fuzzy_cutoff)
+        area = self.index[matches[0]] if matches else None
+        with self._lock:
+            self._fuzzy_matches[key] = area
+            self._dirty = True
+        return area
+
+    def resolve(self, location: str):
+        """Returns the area of a scraped location such as 'Monterrey, Nuevo León, Mexico', or None."""
+        return self.resolve_city(str(location).split(',', 1)[0])
+
+    def resolve_all(self, locations) -> list:
+        """Resolve each of the given locations, which should be distinct, returning None for the misses."""
+        return [self.resolve(location) for location in locations]
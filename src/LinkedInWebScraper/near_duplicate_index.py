@@ -0,0 +1,183 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+# Fixed seed so signatures stay comparable across runs
+MINHASH_SEED = 20240501
+
+class NearDuplicateIndex:
+    """
+    A persistent MinHash/LSH index of enriched job descriptions.
+
+    A description is reduced to its set of word shingles, and the shingle set to a MinHash
+    signature of `num_perm` values, each the minimum of one multiply-shift hash over the
+    shingles. Signatures are split into `bands`; two descriptions sharing any band become
+    candidates, and a candidate matches when the share of equal signature values, an estimate
+    of the Jaccard similarity of the shingle sets, reaches `threshold`. Signatures, band keys
+    and the enrichment of every stored posting live in SQLite, so reposts are recognised
+    across runs. A posting is stored once per JobID and signature, and entries older than
+    `max_age_days` no longer match and are purged when the index is opened.
+
+    Args:
+        path (str): Path of the SQLite index file.
+        threshold (float, optional): Minimum estimated Jaccard similarity of a match. Defaults to 0.9.
+        num_perm (int, optional): Number of MinHash values per signature. Defaults to 128.
+        bands (int, optional): Number of LSH bands, which must divide num_perm. Defaults to 16.
+        shingle_size (int, optional): Number of words per shingle. Defaults to 5.
+        max_age_days (int or float, optional): Days after which a stored enrichment is no longer reused.
+            Defaults to None (entries never expire).
+    """
+
+    def __init__(self, path: str, threshold: float = 0.9, num_perm: int = 128, bands: int = 16, shingle_size: int = 5,
+                 max_age_days: float = None):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands}).")
+
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_age_days = max_age_days
+
+        rng = np.random.default_rng(MINHASH_SEED)
+        # Odd multipliers and random offsets of the multiply-shift hash family
+        self._multipliers = rng.integers(1, 2 ** 63, size=(num_perm, 1), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._offsets = rng.integers(0, 2 ** 63, size=(num_perm, 1), dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "id INTEGER PRIMARY KEY, job_id TEXT, signature BLOB NOT NULL, enrichment TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE TABLE IF NOT EXISTS bands (band_key INTEGER NOT NULL, posting_id INTEGER NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS bands_band_key ON bands (band_key)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS bands_posting_id ON bands (posting_id)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS postings_job_id ON postings (job_id)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS postings_stored_at ON postings (stored_at)")
+        self._connection.commit()
+        self.purge_expired()
+
+    def _cutoff(self) -> float:
+        """Returns the timestamp before which entries are expired."""
+        return time.time() - self.max_age_days * 86400 if self.max_age_days is not None else float('-inf')
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Returns the distinct 32-bit hashes of the word shingles of a text, empty if it is too short."""
+        words = re.findall(r'\w+', str(text).casefold())
+        if len(words) < self.shingle_size:
+            return np.empty(0, dtype=np.uint64)
+        hashes = {zlib.crc32(' '.join(words[start:start + self.shingle_size]).encode('utf-8'))
+                  for start in range(len(words) - self.shingle_size + 1)}
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def signature(self, text: str):
+        """Returns the MinHash signature of a text as a uint32 array, or None if the text has no shingles."""
+        shingles = self.shingles(text)
+        if not len(shingles):
+            return None
+        # Unsigned overflow wraps around, which is what the multiply-shift hash relies on
+        with np.errstate(over='ignore'):
+            hashes = (self._multipliers * shingles[np.newaxis, :] + self._offsets) >> np.uint64(32)
+        return hashes.min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> list:
+        """Returns the LSH key of each band of a signature."""
+        return [int.from_bytes(hashlib.blake2b(bytes([band]) + signature[band * self.rows:(band + 1) * self.rows].tobytes(),
+                                               digest_size=8).digest(), 'big', signed=True)
+                for band in range(self.bands)]
+
+    def find(self, text: str):
+        """
+        Look up the stored posting most similar to a description.
+
+        Returns:
+            tuple or None: (enrichment dict, job_id, similarity) of the best match reaching the threshold, or None.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        band_keys = self.band_keys(signature)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, job_id, signature, enrichment FROM postings WHERE stored_at >= ? AND id IN "
+                f"(SELECT posting_id FROM bands WHERE band_key IN ({', '.join('?' * len(band_keys))}))",
+                (self._cutoff(), *band_keys)
+            ).fetchall()
+
+        best = None
+        for _, job_id, stored_signature, enrichment in rows:
+            similarity = float(np.mean(np.frombuffer(stored_signature, dtype=np.uint32) == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[2]):
+                best = (json.loads(enrichment), job_id, similarity)
+        return best
+
+    def add(self, job_id: str, text: str, enrichment: dict):
+        """
+        Store the enrichment of a posting under the signature of its description. Too short texts are skipped.
+
+        A posting already stored under the same JobID or the same signature is replaced, so adding it
+        again on every run only renews its entry.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return
+
+        job_id = str(job_id)
+        signature_bytes = signature.tobytes()
+        band_keys = self.band_keys(signature)
+        with self._lock:
+            # An identical signature shares every band, so probing the first band finds it through the band index
+            existing = self._connection.execute(
+                "SELECT id, signature FROM postings WHERE job_id = ? UNION "
+                "SELECT id, signature FROM postings WHERE signature = ? AND id IN (SELECT posting_id FROM bands WHERE band_key = ?)",
+                (job_id, signature_bytes, band_keys[0])
+            ).fetchall()
+
+            if len(existing) == 1 and existing[0][1] == signature_bytes:
+                self._connection.execute("UPDATE postings SET job_id = ?, enrichment = ?, stored_at = ? WHERE id = ?",
+                                         (job_id, json.dumps(enrichment), time.time(), existing[0][0]))
+            else:
+                self._delete([posting_id for posting_id, _ in existing])
+                posting_id = self._connection.execute(
+                    "INSERT INTO postings (job_id, signature, enrichment, stored_at) VALUES (?, ?, ?, ?)",
+                    (job_id, signature_bytes, json.dumps(enrichment), time.time())
+                ).lastrowid
+                self._connection.executemany("INSERT INTO bands (band_key, posting_id) VALUES (?, ?)",
+                                             [(band_key, posting_id) for band_key in band_keys])
+            self._connection.commit()
+
+    def _delete(self, posting_ids: list):
+        """Delete postings and their band rows. The caller holds the lock and commits."""
+        self._connection.executemany("DELETE FROM bands WHERE posting_id = ?", [(posting_id,) for posting_id in posting_ids])
+        self._connection.executemany("DELETE FROM postings WHERE id = ?", [(posting_id,) for posting_id in posting_ids])
+
+    def purge_expired(self) -> int:
+        """Delete the expired postings and their band rows, and return how many postings were deleted."""
+        if self.max_age_days is None:
+            return 0
+        with self._lock:
+            cutoff = self._cutoff()
+            self._connection.execute("DELETE FROM bands WHERE posting_id IN (SELECT id FROM postings WHERE stored_at < ?)",
+                                     (cutoff,))
+            deleted = self._connection.execute("DELETE FROM postings WHERE stored_at < ?", (cutoff,)).rowcount
+            self._connection.commit()
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
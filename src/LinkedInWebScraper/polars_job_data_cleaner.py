@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError:  # polars is an optional dependency
+    pl = None
+
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+
+class PolarsJobDataCleaner(JobDataCleaner):
+    """
+    JobDataCleaner running the cleaning, detail normalization and enrichment post-processing on Polars.
+
+    The string work of each master method runs as Polars expressions, which execute multi-threaded
+    over Arrow columns. Only the columns a step reads are copied into Polars, and the results are
+    written back into the pandas DataFrame, so the output has the same columns, index and dtypes as
+    the pandas backend. Location and tech stack matching reuse the pandas backend's resolver and
+    categorizer, which already work on the distinct values only.
+
+    Args:
+        logger (Logger): Logger instance.
+        location_cache_file (str, optional): JSON file persisting the fuzzy location matches. Defaults to None.
+    """
+
+    ROW = '__row__'
+
+    def __init__(self, logger, location_cache_file: str = None):
+        if pl is None:
+            raise ImportError("The 'polars' cleaner backend requires the polars package. Install it with `pip install polars`.")
+        super().__init__(logger, location_cache_file)
+
+    @staticmethod
+    def to_polars(df: pd.DataFrame, columns: list) -> 'pl.DataFrame':
+        """Copy the given columns of a pandas DataFrame into a Polars DataFrame of strings, with nulls for missing values."""
+        series = []
+        for column in columns:
+            values = df[column].to_numpy(dtype=object, na_value=None)
+            try:
+                series.append(pl.Series(column, values, dtype=pl.Utf8))
+            except TypeError:
+                # Columns mixing strings with other values are converted value by value
+                series.append(pl.Series(column, [None if value is None else str(value) for value in values], dtype=pl.Utf8))
+        return pl.DataFrame(series)
+
+    def clean_jobs_dataframe(self, df, location_mapping) -> pd.DataFrame:
+        """Main method to clean and preprocess the job DataFrame."""
+        self.logger.log.info("Starting data cleaning process with the polars backend.")
+        original_count = df.shape[0]
+        frame = self.to_polars(df, ['Location', 'Url', 'Title', 'Company']).with_row_index(self.ROW)
+
+        if location_mapping != None:
+            resolver = self.get_location_resolver(location_mapping)
+            unique_locations = frame.get_column('Location').drop_nulls().unique(maintain_order=True).to_list()
+            areas = dict(zip(unique_locations, resolver.resolve_all(unique_locations)))
+            resolver.save()
+            self.logger.log.info(f"Initial unique locations: {len(unique_locations)}")
+
+            frame = frame.with_columns(pl.col('Location').replace_strict(areas, default=None, return_dtype=pl.Utf8))
+            frame = frame.filter(pl.col('Location').is_not_null())
+            self.logger.log.info(f"Found {original_count - frame.height} 'Other' locations. Dropping them.")
+            # The pandas backend takes its categories from the rows kept at this point
+            location_categories = sorted(frame.get_column('Location').unique().to_list())
+
+        self.logger.log.info("Processing URLs and extracting JobIDs.")
+        frame = frame.with_columns(pl.col('Url').str.split('?position').list.first())
+        frame = frame.with_columns(pl.col('Url').str.slice(-10).alias('JobID'))
+
+        located_count = frame.height
+        frame = frame.filter(pl.col('JobID').str.contains(r'^\d{10}$'))
+        self.logger.log.info(f"Removed {located_count - frame.height} rows with invalid JobIDs. {frame.height} records remaining.")
+
+        valid_count = frame.height
+        frame = frame.unique(subset=['JobID'], keep='first', maintain_order=True)
+        self.logger.log.info(f"Found {valid_count - frame.height} duplicate JobIDs. Removing duplicates.")
+
+        unique_count = frame.height
+        frame = frame.unique(subset=['Location', 'Title', 'Company'], keep='first', maintain_order=True)
+        self.logger.log.info(f"Removed {unique_count - frame.height} duplicate rows based on Location, Title, and Company.")
+
+        # Pick the surviving rows from the pandas DataFrame and write back the columns Polars changed
+        df = df.iloc[frame.get_column(self.ROW).to_numpy()].reset_index(drop=True)
+        if location_mapping != None:
+            df['Location'] = pd.Categorical(frame.get_column('Location').to_list(), categories=location_categories)
+        df['Url'] = pd.Series(frame.get_column('Url').to_list(), dtype=df['Url'].dtype)
+        df['JobID'] = pd.Series(frame.get_column('JobID').to_list(), dtype=df['Url'].dtype)
+
+        self.logger.log.info("Data cleaning process completed.")
+        return df
+
+    def clean_extracted_job_data(self, df_jobs, reference_time=None):
+        """
+        Master function to clean and process extracted enriched job data.
+
+        Args:
+            df_jobs (pd.DataFrame): The jobs with their fetched details.
+            reference_time (pd.Timestamp, optional): Moment the posted times are relative to, shared by every
+                batch of a run. Defaults to now.
+        """
+        self.logger.log.info("Cleaning the extracted job details with the polars backend.")
+        frame = self.to_polars(df_jobs, ['NumApplicants', 'SeniorityLevel', 'JobFunction', 'PostedTime'])
+
+        num_applicants = pl.col('NumApplicants').str.extract(r'(\d+)', 1).cast(pl.Int64, strict=False)
+        not_applicable = pl.col('SeniorityLevel').str.contains('Not Applicable', literal=True)
+        job_functions = (pl.col('JobFunction').replace(self.JOB_FUNCTION_REPLACEMENTS)
+                         .str.replace_all(' and ', ', ', literal=True)
+                         .str.split(', ').list.head(3))
+
+        posted_pattern = rf"^\D*?(?:(\d+)\D*?)?({'|'.join(self.POSTED_TIME_UNIT_DAYS)})"
+        posted_unit_days = pl.col('PostedTime').str.extract(posted_pattern, 2).replace_strict(
+            self.POSTED_TIME_UNIT_DAYS, default=None, return_dtype=pl.Int64)
+        posted_amount = pl.col('PostedTime').str.extract(posted_pattern, 1).cast(pl.Int64, strict=False).fill_null(1)
+
+        frame = frame.select(
+            pl.when(num_applicants <= np.iinfo(np.int16).max).then(num_applicants).alias('NumApplicants'),
+            pl.when(not_applicable).then(pl.lit('N/A')).otherwise(pl.col('SeniorityLevel')).alias('SeniorityLevel'),
+            *[job_functions.list.get(position, null_on_oob=True).fill_null('N/A').alias(f'JobFunction{position + 1}')
+              for position in range(3)],
+            (posted_amount * posted_unit_days).alias('PostedDays'),
+        )
+
+        self.logger.log.info("Writing the normalized job details back.")
+        df_jobs['NumApplicants'] = pd.Series(frame.get_column('NumApplicants').to_numpy(), index=df_jobs.index).astype('Int16')
+
+        seniority_levels = pd.Series(frame.get_column('SeniorityLevel').to_list(), index=df_jobs.index, dtype=object)
+        seniority_levels = seniority_levels.where(seniority_levels.isin(self.SENIORITY_LEVELS))
+        df_jobs['SeniorityLevel'] = pd.Categorical(seniority_levels, categories=self.SENIORITY_LEVELS)
+
+        df_jobs = self.standardize_employment_type(df_jobs)
+
+        job_function_columns = ['JobFunction1', 'JobFunction2', 'JobFunction3']
+        job_function_categories = sorted(set().union(*(frame.get_column(column).unique().to_list()
+                                                       for column in job_function_columns)))
+        for column in job_function_columns:
+            df_jobs[column] = pd.Categorical(frame.get_column(column).to_list(), categories=job_function_categories)
+        df_jobs.drop(columns=['JobFunction'], inplace=True)
+
+        reference_time = pd.Timestamp.now() if reference_time is None else pd.Timestamp(reference_time)
+        posted_days = pd.Series(frame.get_column('PostedDays').to_numpy(), index=df_jobs.index, dtype=float)
+        df_jobs['PostedTime'] = (reference_time - pd.to_timedelta(posted_days, unit='D')).astype('datetime64[ns]')
+        df_jobs.rename(columns={'PostedTime': 'DatePosted'}, inplace=True)
+
+        return self.reorder_columns(df_jobs)
+
+    def process_enriched_job_data(self, df_jobs: pd.DataFrame, tech_stack_categories: dict = None):
+        """
+        Master function to process job data:
+        - Extract minimum years of experience (MinYoE)
+        - Categorize study level (MinLevelStudies)
+        - Categorize tech stack based on predefined categories
+
+        Args:
+            df_jobs (pd.DataFrame): DataFrame containing job information.
+            tech_stack_categories (dict): Dictionary of tech stack categories.
+
+        Returns:
+            pd.DataFrame: DataFrame with processed job data.
+        """
+        self.logger.log.info("Starting job data processing with the polars backend.")
+        frame = self.to_polars(df_jobs, ['YoE', 'MinLevelStudies'])
+
+        years = pl.col('YoE')
+        no_years = (years.is_null() | years.str.contains('N/A', literal=True)
+                    | years.str.contains('Professional software development experience required', literal=True))
+        min_years = years.str.extract_all(r'\d+').list.eval(pl.element().cast(pl.Int64, strict=False)).list.min()
+
+        level = pl.col('MinLevelStudies').str.to_lowercase()
+
+        def mentions(keywords):
+            return pl.any_horizontal([level.str.contains(keyword, literal=True) for keyword in keywords])
+
+        frame = frame.select(
+            pl.when(no_years).then(None).otherwise(min_years).alias('MinYoE'),
+            pl.when(mentions(['student', 'undergraduate'])).then(pl.lit('Undergraduate Student'))
+            .when(mentions(['bachelor', 'bs', 'b.sc', "bachelor's"])).then(pl.lit('Bachelor'))
+            .when(mentions(['master', 'ms', 'm.sc', "master's"])).then(pl.lit('Masters'))
+            .when(mentions(['phd'])).then(pl.lit('PhD'))
+            .otherwise(pl.lit('N/A')).alias('MinLevelStudies'),
+        )
+
+        # Same inference as the pandas backend's `apply`: int64 when every job has years, else ints mixed with 'N/A'
+        df_jobs['MinYoE'] = pd.Series(['N/A' if value is None else value for value in frame.get_column('MinYoE').to_list()],
+                                      index=df_jobs.index)
+        df_jobs['MinLevelStudies'] = pd.Series(frame.get_column('MinLevelStudies').to_list(), index=df_jobs.index)
+
+        if tech_stack_categories != None:
+            df_jobs = self.categorize_tech_stack(df_jobs, tech_stack_categories)
+
+        self.logger.log.info("Completed job data processing.")
+        return df_jobs
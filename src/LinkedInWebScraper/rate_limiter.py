@@ -0,0 +1,249 @@
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Status codes LinkedIn uses to signal that requests are being throttled
+THROTTLE_STATUS_CODES = (429, 999)
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously at `rate` tokens per second.
+
+    The bucket is not synchronized on its own; callers hold their own lock around it.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float, optional): Maximum number of stored tokens. Defaults to max(1, rate).
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float = None):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_available(self, amount: float = 1.0) -> float:
+        """Seconds to wait before `amount` tokens can be consumed (0 if available now)."""
+        self.refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate) if self.rate > 0 else math.inf
+
+    def consume(self, amount: float = 1.0) -> bool:
+        """Consume `amount` tokens if available, returning whether it succeeded."""
+        if self.time_until_available(amount) > 0:
+            return False
+        self.tokens -= min(amount, self.capacity)
+        return True
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping the tokens accumulated so far."""
+        self.refill()
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = min(self.tokens, self.capacity)
+
+class RequestBudget:
+    """
+    Per-minute request and token budgets shared by the threads calling a metered API.
+
+    Each budget is a token bucket holding one minute of allowance and refilled continuously,
+    so short bursts are allowed while the average stays within the limits. A call acquires one
+    request and its estimated tokens from both buckets at once, waiting until both have enough.
+
+    Args:
+        requests_per_minute (float, optional): Maximum requests per minute. Defaults to None (unlimited).
+        tokens_per_minute (float, optional): Maximum tokens per minute. Defaults to None (unlimited).
+    """
+
+    def __init__(self, requests_per_minute: float = None, tokens_per_minute: float = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute / 60.0, requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def acquire(self, tokens: float = 0.0):
+        """Block until one more request using `tokens` tokens fits in both budgets, then consume them."""
+        while True:
+            with self._lock:
+                wait = max(self._requests.time_until_available(1.0) if self._requests else 0.0,
+                           self._tokens.time_until_available(tokens) if self._tokens and tokens else 0.0)
+                if wait <= 0:
+                    if self._requests:
+                        self._requests.consume(1.0)
+                    if self._tokens and tokens:
+                        self._tokens.consume(tokens)
+                    return
+                self.waited += wait
+            time.sleep(wait)
+
+class _HostState:
+    """Rate, concurrency window and counters tracked for a single host."""
+
+    def __init__(self, rate: float, concurrency: float):
+        self.bucket = TokenBucket(rate)
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+
+class AdaptiveRateLimiter:
+    """
+    A per-host token-bucket limiter with AIMD (additive increase, multiplicative decrease) control.
+
+    Every request acquires a slot for its host, which waits for both a token and a free place in
+    the host's concurrency window. Each 200 response grows the request rate and the window
+    additively, while throttling responses (429/999) or a `Retry-After` header cut them
+    multiplicatively. This converges on the highest throughput the host tolerates without
+    manual tuning.
+
+    Args:
+        initial_rate (float, optional): Initial requests per second per host. Defaults to 5.
+        min_rate (float, optional): Lower bound of the request rate. Defaults to 0.2.
+        max_rate (float, optional): Upper bound of the request rate. Defaults to 50.
+        increase_step (float, optional): Requests per second added after each successful response. Defaults to 0.1.
+        decrease_factor (float, optional): Factor applied to the rate and window on throttling. Defaults to 0.5.
+        initial_concurrency (int, optional): Initial number of concurrent requests per host. Defaults to 4.
+        max_concurrency (int, optional): Upper bound of concurrent requests per host. Defaults to 32.
+    """
+
+    def __init__(self, initial_rate: float = 5.0, min_rate: float = 0.2, max_rate: float = 50.0,
+                 increase_step: float = 0.1, decrease_factor: float = 0.5,
+                 initial_concurrency: int = 4, max_concurrency: int = 32):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self._hosts = {}
+        self._condition = threading.Condition()
+
+    def _state(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.initial_rate, self.initial_concurrency)
+        return self._hosts[host]
+
+    def acquire(self, url: str) -> str:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            str: The host, to be passed back to `release`.
+        """
+        host = urlparse(url).netloc
+        with self._condition:
+            state = self._state(host)
+            while True:
+                now = time.monotonic()
+                if state.blocked_until > now:
+                    self._condition.wait(state.blocked_until - now)
+                elif state.in_flight >= max(1, int(state.concurrency)):
+                    self._condition.wait()
+                elif not state.bucket.consume():
+                    self._condition.wait(state.bucket.time_until_available())
+                else:
+                    state.in_flight += 1
+                    state.requests += 1
+                    return host
+
+    def release(self, host: str, status_code: int = None, retry_after=None):
+        """
+        Release a slot acquired for the host and adapt its rate to the response.
+
+        Args:
+            host (str): The host returned by `acquire`.
+            status_code (int, optional): Status code of the response, None if the request failed.
+            retry_after (str, optional): Value of the `Retry-After` response header.
+        """
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+
+            if status_code in THROTTLE_STATUS_CODES or (status_code == 503 and retry_after):
+                state.throttled += 1
+                state.bucket.set_rate(max(self.min_rate, state.bucket.rate * self.decrease_factor))
+                state.concurrency = max(1.0, state.concurrency * self.decrease_factor)
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+            elif status_code == 200:
+                state.bucket.set_rate(min(self.max_rate, state.bucket.rate + self.increase_step))
+                state.concurrency = min(self.max_concurrency, state.concurrency + 1.0 / state.concurrency)
+
+            self._condition.notify_all()
+
+    def get_rate(self, host: str) -> float:
+        """Returns the current request rate (requests per second) allowed for the host."""
+        with self._condition:
+            return self._state(host).bucket.rate
+
+    def metrics(self) -> dict:
+        """
+        Returns a snapshot of the limiter state per host.
+
+        Returns:
+            dict: For each host, its current rate, concurrency window, in-flight requests,
+                  total requests and throttled responses.
+        """
+        with self._condition:
+            return {
+                host: {
+                    'rate': round(state.bucket.rate, 2),
+                    'concurrency': round(state.concurrency, 2),
+                    'in_flight': state.in_flight,
+                    'requests': state.requests,
+                    'throttled': state.throttled
+                }
+                for host, state in self._hosts.items()
+            }
+
+def parse_retry_after(value) -> float:
+    """
+    Parse a `Retry-After` header value into a number of seconds.
+
+    Args:
+        value (str): Either a number of seconds or an HTTP date.
+
+    Returns:
+        float or None: Seconds to wait, or None if the value is missing or invalid.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+def get_default_rate_limiter() -> AdaptiveRateLimiter:
+    """Returns the process-wide AdaptiveRateLimiter shared by all fetchers."""
+    global _default_rate_limiter
+    with _default_rate_limiter_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = AdaptiveRateLimiter()
+        return _default_rate_limiter
@@ -0,0 +1,425 @@
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from LinkedInWebScraper.response_cache import ResponseCache
+
+class FixtureArchive:
+    """
+    HTTP responses and OpenAI completions captured for offline replay.
+
+    Responses are keyed by their normalized path and query, so an archive recorded against
+    LinkedIn can be served from any host. Completions are keyed by a hash of the messages
+    sent to the model. The archive is stored as gzip-compressed JSON.
+
+    Args:
+        responses (dict, optional): Normalized request path mapped to {'status_code', 'body'}.
+        completions (dict, optional): Message hash mapped to the completion content.
+    """
+
+    def __init__(self, responses: dict = None, completions: dict = None):
+        self.responses = responses if responses is not None else {}
+        self.completions = completions if completions is not None else {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for_url(url: str) -> str:
+        """Returns the host-independent key of a URL: its normalized path and query."""
+        parts = urlsplit(ResponseCache.normalize_url(url))
+        return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    @staticmethod
+    def key_for_messages(messages: list) -> str:
+        """Returns the key of a chat completion request."""
+        return hashlib.sha256(json.dumps(messages, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def add_response(self, url: str, status_code: int, body: bytes):
+        """Record the status code and body returned for a URL."""
+        with self._lock:
+            self.responses[self.key_for_url(url)] = {
+                'status_code': status_code,
+                'body': body.decode('utf-8', errors='replace')
+            }
+
+    def get_response(self, url: str):
+        """Returns the recorded (status_code, body) of a URL, or None if it was not recorded."""
+        entry = self.responses.get(self.key_for_url(url))
+        if entry is None:
+            return None
+        return entry['status_code'], entry['body'].encode('utf-8')
+
+    def add_completion(self, messages: list, content: str):
+        """Record the completion content returned for a list of messages."""
+        with self._lock:
+            self.completions[self.key_for_messages(messages)] = content
+
+    def get_completion(self, messages: list):
+        """Returns the recorded completion content for the messages, or None."""
+        return self.completions.get(self.key_for_messages(messages))
+
+    def save(self, path: str):
+        """Write the archive to a gzip-compressed JSON file."""
+        with self._lock:
+            payload = {'responses': self.responses, 'completions': self.completions}
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump(payload, file)
+
+    @classmethod
+    def load(cls, path: str) -> 'FixtureArchive':
+        """Read an archive written by `save`."""
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            payload = json.load(file)
+        return cls(payload.get('responses', {}), payload.get('completions', {}))
+
+class RecordingFetcher:
+    """
+    Wraps an HttpFetcher and records every successful response into a FixtureArchive.
+
+    Args:
+        fetcher (HttpFetcher): The fetcher sending the real requests.
+        archive (FixtureArchive): The archive the responses are recorded into.
+    """
+
+    def __init__(self, fetcher, archive: FixtureArchive):
+        self.fetcher = fetcher
+        self.archive = archive
+
+    def fetch_until_success(self, url, logger=None, cache=None, **kwargs):
+        response = self.fetcher.fetch_until_success(url, logger, cache=cache, **kwargs)
+        if response is not None:
+            self.archive.add_response(url, response.status_code, response.content)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.fetcher, name)
+
+def _chat_client(create) -> SimpleNamespace:
+    """Build an object exposing `chat.completions.create` like the OpenAI client."""
+    return SimpleNamespace(completions=SimpleNamespace(create=create))
+
+class RecordingOpenAIClient:
+    """
+    Wraps an OpenAI client and records every chat completion into a FixtureArchive.
+
+    Args:
+        client (OpenAI): The client sending the real requests.
+        archive (FixtureArchive): The archive the completions are recorded into.
+    """
+
+    def __init__(self, client, archive: FixtureArchive):
+        self.client = client
+        self.archive = archive
+        self.chat = _chat_client(self._create)
+
+    def _create(self, messages, **kwargs):
+        completion = self.client.chat.completions.create(messages=messages, **kwargs)
+        self.archive.add_completion(messages, completion.choices[0].message.content)
+        return completion
+
+class FakeOpenAIError(RuntimeError):
+    """Raised by FakeOpenAIClient to simulate a failed API call."""
+
+class FakeOpenAIClient:
+    """
+    An offline stand-in for the OpenAI client that replays recorded completions.
+
+    Completions missing from the archive are answered with a deterministic synthetic result
+    built from the job description, so a pipeline can run without any recorded completion.
+    The `files` and `batches` endpoints of the Batch API are simulated in memory: a batch
+    completes once it has been retrieved `batch_polls` times, so a single client instance acts
+    as a batch service that outlives the processors polling it.
+
+    Args:
+        archive (FixtureArchive, optional): Recorded completions. Defaults to an empty archive.
+        latency (float, optional): Seconds each call takes. Defaults to 0.
+        error_rate (float, optional): Probability that a call, or a batch request, fails. Defaults to 0.
+        seed (int, optional): Seed of the error generator, for reproducible runs.
+        batch_polls (int, optional): Retrievals after which a batch completes. Defaults to 1.
+        entry_error_rate (float, optional): Probability that an entry of a packed completion is left out. Defaults to 0.
+    """
+
+    def __init__(self, archive: FixtureArchive = None, latency: float = 0.0, error_rate: float = 0.0, seed: int = None,
+                 batch_polls: int = 1, entry_error_rate: float = 0.0):
+        self.archive = archive if archive is not None else FixtureArchive()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.batch_polls = batch_polls
+        self.entry_error_rate = entry_error_rate
+        self.calls = 0
+        self.batch_requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._files = {}
+        self._batches = {}
+        self.chat = _chat_client(self._create)
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create(self, messages, **kwargs):
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            raise FakeOpenAIError("Simulated OpenAI API error.")
+        return self._completion(messages)
+
+    def _completion(self, messages) -> SimpleNamespace:
+        content = self.archive.get_completion(messages)
+        if content is None and PACKED_PROMPT_MARKER in messages[-1]['content']:
+            with self._lock:
+                content = json.dumps(synthetic_packed_completion(messages[-1]['content'], self._random, self.entry_error_rate))
+        elif content is None:
+            content = json.dumps(synthetic_completion(messages[-1]['content']))
+
+        prompt_tokens = sum(len(message['content']) for message in messages) // 4
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=len(content) // 4)
+        )
+
+    def _create_file(self, file, purpose: str):
+        content = file.read()
+        with self._lock:
+            file_id = f"file-{len(self._files) + 1}"
+            self._files[file_id] = content.decode('utf-8') if isinstance(content, bytes) else content
+        return SimpleNamespace(id=file_id, purpose=purpose)
+
+    def _file_content(self, file_id: str):
+        return SimpleNamespace(text=self._files[file_id])
+
+    def _create_batch(self, input_file_id: str, endpoint: str, completion_window: str, metadata: dict = None):
+        with self._lock:
+            batch_id = f"batch-{len(self._batches) + 1}"
+            self._batches[batch_id] = {'input_file_id': input_file_id, 'status': 'validating', 'polls': 0,
+                                       'output_file_id': None, 'error_file_id': None, 'metadata': metadata}
+        return self._retrieve_batch(batch_id, poll=False)
+
+    def _retrieve_batch(self, batch_id: str, poll: bool = True):
+        with self._lock:
+            batch = self._batches[batch_id]
+            if poll and batch['status'] != 'completed':
+                batch['polls'] += 1
+                batch['status'] = 'in_progress'
+                if batch['polls'] >= self.batch_polls:
+                    self._run_batch(batch)
+            return SimpleNamespace(id=batch_id, status=batch['status'], output_file_id=batch['output_file_id'],
+                                   error_file_id=batch['error_file_id'], metadata=batch['metadata'])
+
+    def _run_batch(self, batch: dict):
+        """Answer every request of a batch and write its output and error files. Called with the lock held."""
+        outputs, errors = [], []
+        for line in self._files[batch['input_file_id']].splitlines():
+            request = json.loads(line)
+            self.batch_requests += 1
+            if self._random.random() < self.error_rate:
+                errors.append({'custom_id': request['custom_id'], 'response': {'status_code': 500, 'body': {}},
+                               'error': {'message': 'Simulated OpenAI API error.'}})
+                continue
+            content = self._completion(request['body']['messages']).choices[0].message.content
+            outputs.append({'custom_id': request['custom_id'], 'error': None, 'response': {
+                'status_code': 200, 'body': {'choices': [{'message': {'role': 'assistant', 'content': content}}]}}})
+
+        for records, key in ((outputs, 'output_file_id'), (errors, 'error_file_id')):
+            if records:
+                file_id = f"file-{len(self._files) + 1}"
+                self._files[file_id] = '\n'.join(json.dumps(record) for record in records)
+                batch[key] = file_id
+        batch['status'] = 'completed'
+
+# Skills recognized by the synthetic completions
+SYNTHETIC_SKILLS = ['Python', 'SQL', 'R', 'Spark', 'AWS', 'Azure', 'Tableau', 'Power BI', 'TensorFlow', 'PyTorch']
+
+def synthetic_completion(prompt: str) -> dict:
+    """Build a plausible enrichment result from the skills and years mentioned in the prompt."""
+    description = prompt.rsplit('Now process this new job description:', 1)[-1].strip().strip('"')
+    years = [word for word in description.split() if word.rstrip('+').isdigit()]
+    return {
+        'Description': description[:300],
+        'TechStack': [skill for skill in SYNTHETIC_SKILLS if re.search(rf'\b{re.escape(skill)}\b', description)] or ['N/A'],
+        'YoE': f"{years[0].rstrip('+')}+ years" if years else 'N/A',
+        'MinLevelStudies': "Bachelor's degree" if 'degree' in description else 'N/A',
+        'English': 'English' in description
+    }
+
+# Sentence introducing the job descriptions of a packed prompt
+PACKED_PROMPT_MARKER = 'Now process each of the following job descriptions'
+
+def synthetic_packed_completion(prompt: str, rng: random.Random = None, entry_error_rate: float = 0.0) -> dict:
+    """Build the keyed result of a packed prompt, leaving out each entry with probability `entry_error_rate`."""
+    listing = prompt.split(PACKED_PROMPT_MARKER, 1)[1].split('\n', 1)[1]
+    postings, _ = json.JSONDecoder().raw_decode(listing.strip())
+    jobs = []
+    for posting in postings:
+        if entry_error_rate and (rng or random).random() < entry_error_rate:
+            continue
+        result = synthetic_completion(f"Now process this new job description:\n\"{posting['Description']}\"")
+        jobs.append({'JobID': posting['JobID'], **result})
+    return {'Jobs': jobs}
+
+class ReplayServer:
+    """
+    A local HTTP server replaying the responses of a FixtureArchive.
+
+    Point `JobScraperConfig.base_url` at `server.url` to run the scraper against it. Unknown
+    paths answer 404; a fraction `error_rate` of the requests answer `error_status` instead of
+    the recorded response, to exercise the retry and rate limiting paths.
+
+    Args:
+        archive (FixtureArchive): The recorded responses.
+        latency (float, optional): Seconds added to each response. Defaults to 0.
+        error_rate (float, optional): Probability that a request fails. Defaults to 0.
+        error_status (int, optional): Status code of the simulated failures. Defaults to 429.
+        seed (int, optional): Seed of the error generator, for reproducible runs.
+        port (int, optional): Port to listen on. Defaults to a free port.
+    """
+
+    def __init__(self, archive: FixtureArchive, latency: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 429, seed: int = None, port: int = 0):
+        self.archive = archive
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class ReplayRequestHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status_code, body = server.respond(self.path)
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ReplayRequestHandler
+
+    def respond(self, path: str):
+        """Returns the (status_code, body) served for a request path."""
+        with self._lock:
+            self.requests_served += 1
+            failed = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return self.error_status, b''
+
+        recorded = self.archive.get_response(path)
+        return recorded if recorded is not None else (404, b'')
+
+    def start(self) -> 'ReplayServer':
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+# Building blocks of the synthetic corpus
+SYNTHETIC_TITLES = ['Data Scientist', 'Senior Data Scientist', 'Machine Learning Engineer', 'Data Analyst',
+                    'Data Engineer', 'Analytics Engineer', 'BI Developer', 'AI Engineer']
+SYNTHETIC_COMPANIES = ['Banorte', 'Softtek', 'FEMSA', 'Grupo Bimbo', 'Ternium', 'Rappi', 'Kavak', 'Oracle']
+SYNTHETIC_CITIES = ['Monterrey', 'San Pedro Garza García', 'San Nicolás de los Garza', 'Guadalupe', 'Apodaca']
+SYNTHETIC_SENIORITY = ['Entry level', 'Mid-Senior level', 'Associate', 'Not Applicable', 'Internship']
+SYNTHETIC_FUNCTIONS = ['Engineering and Information Technology', 'Research and Design', 'Analyst', 'Information Technology']
+SYNTHETIC_POSTED = ['2 hours ago', '1 day ago', '3 days ago', '1 week ago', '2 weeks ago', '1 month ago']
+SYNTHETIC_APPLICANTS = ['Be among the first 25 applicants', '37 applicants', '112 applicants', 'Over 200 applicants']
+
+def _synthetic_card(job_id: int, rng: random.Random) -> str:
+    title = rng.choice(SYNTHETIC_TITLES)
+    return (f'<li><div class="base-card base-search-card job-search-card">'
+            f'<a class="base-card__full-link" href="https://mx.linkedin.com/jobs/view/{title.lower().replace(" ", "-")}-{job_id}'
+            f'?position=1&amp;pageNum=0"></a>'
+            f'<div class="base-search-card__info"><h3 class="base-search-card__title">{title}</h3>'
+            f'<h4 class="base-search-card__subtitle"><a href="#">{rng.choice(SYNTHETIC_COMPANIES)}</a></h4>'
+            f'<div class="base-search-card__metadata">'
+            f'<span class="job-search-card__location">{rng.choice(SYNTHETIC_CITIES)}, Nuevo León, Mexico</span>'
+            f'<time class="job-search-card__listdate" datetime="2024-09-15">1 day ago</time></div></div></div></li>')
+
+def _synthetic_posting(job_id: int, rng: random.Random) -> str:
+    skills = rng.sample(SYNTHETIC_SKILLS, 4)
+    criteria = [('Seniority level', rng.choice(SYNTHETIC_SENIORITY)), ('Employment type', 'Full-time'),
+                ('Job function', rng.choice(SYNTHETIC_FUNCTIONS)), ('Industries', 'Software Development')]
+    criteria_items = ''.join(
+        f'<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">{header}</h3>'
+        f'<span class="description__job-criteria-text">{value}</span></li>' for header, value in criteria)
+    return (f'<section><span class="posted-time-ago__text">{rng.choice(SYNTHETIC_POSTED)}</span>'
+            f'<figcaption class="num-applicants__caption">{rng.choice(SYNTHETIC_APPLICANTS)}</figcaption>'
+            f'<div class="show-more-less-html__markup"><p>Posting {job_id}. Join our analytics team to build models '
+            f'that drive business decisions.</p><ul><li>{rng.randint(1, 6)}+ years of experience with '
+            f'{", ".join(skills)}.</li><li>Bachelor\'s degree in a quantitative field.</li>'
+            f'<li>Advanced English.</li></ul></div>'
+            f'<ul class="description__job-criteria-list">{criteria_items}</ul></section>')
+
+def build_synthetic_archive(num_jobs: int = 200, position: str = 'Data Scientist', location: str = 'Monterrey',
+                            remote_types: tuple = ('REMOTE', 'HYBRID', 'ON-SITE'), time_posted: str = 'DAY',
+                            seed: int = 0) -> FixtureArchive:
+    """
+    Build a synthetic FixtureArchive shaped like real LinkedIn responses.
+
+    For each remote type it holds the search pages of `num_jobs` postings and the posting page
+    of each of them, under the URLs JobScraper requests for the same position and location.
+
+    Returns:
+        FixtureArchive: The generated archive.
+    """
+    from LinkedInWebScraper.job_scraper import JobScraper
+    from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+
+    rng = random.Random(seed)
+    archive = FixtureArchive()
+
+    for remote_index, remote in enumerate(remote_types):
+        config = JobScraperConfig(position, location, time_posted=time_posted, remote=remote)
+        scraper = JobScraper(config, logger=None, fetcher=archive)
+        first_id = 4100000000 + remote_index * 1000000
+        header = f'<span class="results-context-header__job-count">{num_jobs:,}</span><ul>'
+
+        for start in range(0, num_jobs, 10):
+            job_ids = range(first_id + start, first_id + min(start + 10, num_jobs))
+            page = header + ''.join(_synthetic_card(job_id, rng) for job_id in job_ids) + '</ul>'
+            archive.add_response(scraper.generate_paginated_url(start), 200, page.encode('utf-8'))
+            if start == 0:
+                archive.add_response(scraper.generate_main_url(), 200, page.encode('utf-8'))
+            for job_id in job_ids:
+                archive.add_response(scraper.get_jobid_information(str(job_id)), 200,
+                                     _synthetic_posting(job_id, rng).encode('utf-8'))
+
+    return archive
@@ -0,0 +1,85 @@
+import threading
+
+class RequestPacker:
+    """
+    Chooses how many job descriptions are packed into each OpenAI request.
+
+    A request holds the fixed prompt once plus one entry per description, and its response one
+    result per description. The packer estimates both from two rates measured on the responses,
+    prompt tokens per character and completion tokens per description, smoothed with an
+    exponential moving average. Each pack takes descriptions in order while the estimated prompt
+    and completion tokens stay within `token_budget`, so short descriptions share a request with
+    many others and long ones with few.
+
+    Args:
+        token_budget (int, optional): Maximum estimated prompt plus completion tokens of a request. Defaults to 12000.
+        max_pack_size (int, optional): Maximum number of descriptions per request. Defaults to 20.
+        fixed_chars (int, optional): Characters of the prompt without any description. Defaults to 0.
+        tokens_per_char (float, optional): Initial prompt tokens per character. Defaults to 0.25.
+        completion_tokens (float, optional): Initial completion tokens per description. Defaults to 300.
+        smoothing (float, optional): Weight of each new measurement in the moving averages. Defaults to 0.3.
+    """
+
+    def __init__(self, token_budget: int = 12000, max_pack_size: int = 20, fixed_chars: int = 0,
+                 tokens_per_char: float = 0.25, completion_tokens: float = 300, smoothing: float = 0.3):
+        self.token_budget = token_budget
+        self.max_pack_size = max_pack_size
+        self.fixed_chars = fixed_chars
+        self.tokens_per_char = tokens_per_char
+        self.completion_tokens = completion_tokens
+        self.smoothing = smoothing
+        self.packs = 0
+        self.packed = 0
+        self._lock = threading.Lock()
+
+    def estimate_tokens(self, chars: int, count: int) -> float:
+        """Estimate the tokens of a request holding `count` descriptions whose entries total `chars` characters."""
+        return (self.fixed_chars + chars) * self.tokens_per_char + count * self.completion_tokens
+
+    def next_pack_size(self, entry_chars: list) -> int:
+        """
+        Returns how many of the leading entries fit in the next request.
+
+        Args:
+            entry_chars (list): Characters of the remaining entries, in order.
+
+        Returns:
+            int: The pack size, at least 1 when entries remain even if a single one exceeds the budget.
+        """
+        with self._lock:
+            size, chars = 0, 0
+            while size < min(len(entry_chars), self.max_pack_size):
+                if size and self.estimate_tokens(chars + entry_chars[size], size + 1) > self.token_budget:
+                    break
+                chars += entry_chars[size]
+                size += 1
+            if size:
+                self.packs += 1
+                self.packed += size
+            return size
+
+    def record(self, prompt_chars: int, prompt_tokens: int, completion_tokens: int, answered: int):
+        """
+        Update the measured rates with the token usage of a response.
+
+        Args:
+            prompt_chars (int): Characters of the messages sent.
+            prompt_tokens (int): Prompt tokens reported for the request.
+            completion_tokens (int): Completion tokens reported for the response.
+            answered (int): Descriptions with a valid result in the response.
+        """
+        with self._lock:
+            if prompt_chars > 0:
+                self.tokens_per_char += self.smoothing * (prompt_tokens / prompt_chars - self.tokens_per_char)
+            if answered > 0:
+                self.completion_tokens += self.smoothing * (completion_tokens / answered - self.completion_tokens)
+
+    def stats(self) -> dict:
+        """Returns the requests packed so far, their mean size and the current rates."""
+        with self._lock:
+            return {
+                'packs': self.packs,
+                'mean_pack_size': round(self.packed / self.packs, 2) if self.packs else 0.0,
+                'tokens_per_char': round(self.tokens_per_char, 4),
+                'completion_tokens': round(self.completion_tokens, 1)
+            }
@@ -0,0 +1,161 @@
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click and never change the returned page
+IGNORED_QUERY_PARAMS = {'position', 'pageNum', 'refId', 'trackingId', 'trk'}
+
+# Time to live per URL class, matched in order against the normalized URL
+DEFAULT_TTL_RULES = [
+    ('/jobs-guest/jobs/api/jobPosting/', 7 * 24 * 3600),
+    ('/jobs/search', 3600),
+]
+
+class CachedResponse:
+    """
+    A minimal stand-in for `requests.Response` served from the response cache.
+
+    Args:
+        url (str): The requested URL.
+        content (bytes): The response body.
+        encoding (str, optional): Encoding used to decode the body. Defaults to 'utf-8'.
+    """
+
+    status_code = 200
+
+    def __init__(self, url: str, content: bytes, encoding: str = 'utf-8'):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.headers = {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+class ResponseCache:
+    """
+    A persistent, size-bounded cache of successful HTTP responses stored in SQLite.
+
+    Bodies are stored zlib-compressed and keyed by normalized URL. Each entry expires after
+    the TTL of its URL class (short for search pages, long for job postings), and the least
+    recently used entries are evicted once the cache grows beyond `max_size_mb`.
+
+    Args:
+        path (str): Path of the SQLite cache file.
+        max_size_mb (int or float, optional): Maximum size of the compressed bodies. Defaults to 256.
+        ttl_rules (list, optional): (URL substring, seconds) pairs. Defaults to DEFAULT_TTL_RULES.
+        default_ttl (int, optional): TTL in seconds for URLs matching no rule. Defaults to 3600.
+    """
+
+    def __init__(self, path: str, max_size_mb: float = 256, ttl_rules: list = None, default_ttl: int = 3600):
+        self.path = path
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.ttl_rules = ttl_rules if ttl_rules is not None else DEFAULT_TTL_RULES
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, encoding TEXT, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._connection.commit()
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalize a URL so equivalent requests share a cache entry."""
+        parts = urlsplit(url)
+        query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if key not in IGNORED_QUERY_PARAMS)
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+    def ttl_for(self, url: str) -> int:
+        """Returns the time to live in seconds of the URL class the URL belongs to."""
+        for pattern, ttl in self.ttl_rules:
+            if pattern in url:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str):
+        """
+        Look up a fresh cached response for the URL.
+
+        Returns:
+            CachedResponse or None: The cached response, or None on a miss or expired entry.
+        """
+        key = self.normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, encoding, stored_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[2] > self.ttl_for(key):
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, key))
+            self._connection.commit()
+            self.hits += 1
+
+        return CachedResponse(url, zlib.decompress(row[0]), row[1] or 'utf-8')
+
+    def put(self, url: str, response):
+        """Store the body of a successful response, evicting old entries if the cache is full."""
+        key = self.normalize_url(url)
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM responses WHERE url = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (url, body, encoding, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, getattr(response, 'encoding', None), now, now, len(body))
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """Delete the least recently used entries until the cache is back under its size limit."""
+        if self._size <= self.max_size:
+            return
+
+        target = int(self.max_size * 0.9)
+        # Delete the least recently used entries whose cumulative size frees enough space, without loading the table
+        self._connection.execute(
+            "DELETE FROM responses WHERE url IN (SELECT url FROM ("
+            "SELECT url, SUM(size) OVER (ORDER BY accessed_at, url) - size AS freed_before FROM responses"
+            ") WHERE freed_before < ?)",
+            (self._size - target,)
+        )
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def stats(self) -> dict:
+        """Returns the hit and miss counters of this cache instance."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'size_bytes': self._size
+        }
+
+    def log_stats(self, logger):
+        """Log the cache hit and miss counters."""
+        stats = self.stats()
+        logger.log.info(f"Response cache: {stats['hits']} hits, {stats['misses']} misses "
+                        f"(hit rate {stats['hit_rate']:.1%}, {stats['size_bytes'] / 1024 / 1024:.1f} MB stored).")
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+class SearchWatermark:
+    """
+    The state remembered for a single search between runs.
+
+    Attributes:
+        job_ids (set): JobIDs seen in the most recent runs of the search.
+        last_run (datetime): Start time of the last successful run, None if the search never ran.
+    """
+
+    def __init__(self, job_ids: set = None, last_run: datetime = None):
+        self.job_ids = job_ids if job_ids is not None else set()
+        self.last_run = last_run
+
+    def is_known(self, job_id: str) -> bool:
+        """Returns whether the JobID was already seen by a previous run."""
+        return job_id in self.job_ids
+
+    def is_older(self, listed_date: str) -> bool:
+        """Returns whether a listing date (YYYY-MM-DD) is older than the day of the last run."""
+        if self.last_run is None or not listed_date:
+            return False
+        return listed_date < self.last_run.strftime('%Y-%m-%d')
+
+class SearchWatermarkStore:
+    """
+    A JSON file holding one SearchWatermark per search URL.
+
+    Args:
+        path (str): Path of the JSON file.
+        max_job_ids (int, optional): Number of most recent JobIDs kept per search. Defaults to 5000.
+    """
+
+    def __init__(self, path: str, max_job_ids: int = 5000):
+        self.path = path
+        self.max_job_ids = max_job_ids
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def get(self, search_key: str) -> SearchWatermark:
+        """Returns the watermark of a search, empty if the search never ran."""
+        with self._lock:
+            entry = self._load().get(search_key)
+        if not entry:
+            return SearchWatermark()
+        last_run = datetime.fromisoformat(entry['last_run']) if entry.get('last_run') else None
+        return SearchWatermark(set(entry.get('job_ids', [])), last_run)
+
+    def update(self, search_key: str, job_ids: list, run_time: datetime):
+        """
+        Record the JobIDs seen by a run and move the search watermark to the run start time.
+
+        Args:
+            search_key (str): The search identifier, usually its URL.
+            job_ids (list): JobIDs seen in this run, most recent first.
+            run_time (datetime): Start time of the run.
+        """
+        with self._lock:
+            watermarks = self._load()
+            previous_ids = watermarks.get(search_key, {}).get('job_ids', [])
+            merged_ids = list(dict.fromkeys(list(job_ids) + previous_ids))[:self.max_job_ids]
+            watermarks[search_key] = {'job_ids': merged_ids, 'last_run': run_time.isoformat()}
+
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump(watermarks, file)
+            os.replace(temporary_path, self.path)
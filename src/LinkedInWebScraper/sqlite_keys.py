@@ -0,0 +1,30 @@
+import hashlib
+import sqlite3
+
+# SQLite limits the number of parameters of a single statement
+LOOKUP_CHUNK_SIZE = 500
+
+def hash_key(text: str) -> int:
+    """Returns the signed 64-bit hash of a text, stored as an INTEGER PRIMARY KEY."""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+def select_keys(connection: sqlite3.Connection, query: str, keys, params: tuple = ()) -> set:
+    """
+    Run a key lookup in chunks of `LOOKUP_CHUNK_SIZE` keys and return the keys it selects.
+
+    Args:
+        connection (sqlite3.Connection): The connection to query. The caller holds its lock.
+        query (str): A query selecting a single key column, with a `{placeholders}` field inside `key IN (...)`.
+        keys (iterable): The keys to look up.
+        params (tuple, optional): Parameters bound before the keys. Defaults to ().
+
+    Returns:
+        set: The keys selected by the query.
+    """
+    keys = list(set(keys))
+    found = set()
+    for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[start:start + LOOKUP_CHUNK_SIZE]
+        rows = connection.execute(query.format(placeholders=', '.join('?' * len(chunk))), (*params, *chunk)).fetchall()
+        found.update(row[0] for row in rows)
+    return found
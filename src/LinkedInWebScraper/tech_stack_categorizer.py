@@ -0,0 +1,85 @@
+import re
+import numpy as np
+import pandas as pd
+
+class TechStackCategorizer:
+    """
+    Maps comma-separated tech stacks to one-hot skill categories.
+
+    All category items are compiled once into a single regex. The alternation sits inside a
+    lookahead, so it is tried at every position of an element, and it lists the longest items
+    first, so each position reports its longest matching item. Every shorter item matching at
+    the same position is a prefix of that one, so each item carries the categories of all the
+    items it starts with. A category is set when one of its items is a substring of an element
+    of the tech stack, exactly as with the original per-item `in` checks.
+
+    Args:
+        tech_stack_categories (dict): Category names mapped to their list of items.
+    """
+
+    def __init__(self, tech_stack_categories: dict):
+        self.categories = list(tech_stack_categories)
+        self.columns = self.categories + ['Other']
+
+        item_masks = {}
+        for bit, items in enumerate(tech_stack_categories.values()):
+            for item in items:
+                item_masks[item] = item_masks.get(item, 0) | (1 << bit)
+
+        items = sorted(item_masks, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + '|'.join(re.escape(item) for item in items) + '))') if items else None
+
+        # Categories of each item plus those of every item it has as a prefix
+        self._match_masks = {}
+        for item in items:
+            mask = 0
+            for prefix in items:
+                if item.startswith(prefix):
+                    mask |= item_masks[prefix]
+            self._match_masks[item] = mask
+
+        self._element_masks = {}
+
+    def element_mask(self, element: str) -> int:
+        """Returns the bitmask of the categories whose items occur in a single tech stack element."""
+        mask = self._element_masks.get(element)
+        if mask is None:
+            mask = 0
+            if self._pattern is not None:
+                for match in self._pattern.finditer(element):
+                    mask |= self._match_masks[match.group(1)]
+            self._element_masks[element] = mask
+        return mask
+
+    def tech_stack_mask(self, tech_stack) -> int:
+        """Returns the bitmask of the categories found in a comma-separated tech stack."""
+        mask = 0
+        for element in str(tech_stack).split(','):
+            mask |= self.element_mask(element.strip())
+        return mask
+
+    def categorize(self, tech_stacks: pd.Series) -> np.ndarray:
+        """
+        Build the one-hot category matrix of a column of tech stacks.
+
+        Each distinct tech stack is matched once. Rows with no category get a 1 in 'Other'.
+
+        Args:
+            tech_stacks (pd.Series): Comma-separated tech stacks.
+
+        Returns:
+            np.ndarray: An int64 matrix with one row per tech stack and one column per entry of `columns`.
+        """
+        codes, unique_tech_stacks = pd.factorize(tech_stacks.fillna(''))
+
+        unique_matrix = np.zeros((len(unique_tech_stacks), len(self.columns)), dtype=np.int64)
+        for row, tech_stack in enumerate(unique_tech_stacks):
+            mask = self.tech_stack_mask(tech_stack)
+            if not mask:
+                unique_matrix[row, -1] = 1
+            while mask:
+                lowest_bit = mask & -mask
+                unique_matrix[row, lowest_bit.bit_length() - 1] = 1
+                mask ^= lowest_bit
+
+        return unique_matrix[codes]
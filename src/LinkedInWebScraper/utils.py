@@ -1,59 +1,166 @@
 import requests
+import threading
 import time
 import random
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from Utils.logger import Logger
 from Utils.constants import USER_AGENT_HEADERS
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter, get_default_rate_limiter
+from LinkedInWebScraper.response_cache import ResponseCache
 
 def get_random_header():
     """Returns a random user-agent header from the list."""
     return random.choice(USER_AGENT_HEADERS)
 
-def fetch_until_success(url, logger=None, max_retries=5, backoff_time=1):
+class HttpFetcher:
+    """
+    A reusable HTTP fetcher that owns a pooled, keep-alive `requests.Session`.
+
+    Sharing one fetcher between scrapers lets every search page and job posting reuse the
+    open TCP/TLS connections instead of paying a new handshake per request. Compressed
+    responses (gzip/deflate, and brotli when the `brotli` package is installed) are
+    requested and decoded transparently.
+
+    Every request goes through an AdaptiveRateLimiter, which paces requests per host and
+    backs off globally when the host starts throttling.
+
+    Args:
+        logger (Logger, optional): Logger instance used when a call does not provide one.
+        pool_size (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+        timeout (int or float, optional): Timeout in seconds for each request. Defaults to 10.
+        rate_limiter (AdaptiveRateLimiter, optional): Per-host limiter. Defaults to the process-wide limiter.
+    """
+
+    def __init__(self, logger=None, pool_size=10, timeout=10, rate_limiter: AdaptiveRateLimiter = None):
+        self.logger = logger
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_default_rate_limiter()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+
+    def fetch_until_success(self, url, logger=None, max_retries=5, backoff_time=1, cache: ResponseCache = None):
+        """
+        Attempts to fetch jobs from a URL until success or maximum retries are reached.
+
+        Args:
+            url (str): The URL to fetch jobs from.
+            logger (Logger, optional): Logger instance. Defaults to the fetcher logger or a new logger.
+            max_retries (int, optional): Maximum number of retries before giving up. Defaults to 5.
+            backoff_time (int or float, optional): Initial backoff time in seconds between retries. Defaults to 1 second.
+            cache (ResponseCache, optional): Response cache consulted before, and filled after, the request.
+
+        Returns:
+            Response or None: Returns the response object if successful, otherwise None.
+        """
+
+        # Fall back to the fetcher logger, or create a default one
+        logger = logger or self.logger
+        if logger is None:
+            logger = Logger('fetch_jobs.log')
+
+        if cache is not None:
+            cached_response = cache.get(url)
+            if cached_response is not None:
+                logger.log.debug(f"Serving {url} from the response cache")
+                return cached_response
+
+        retries = 0
+
+        while retries < max_retries:
+            try:
+                # Log the attempt
+                logger.log.debug(f"Attempting to fetch data from {url} (Attempt {retries + 1}/{max_retries})")
+
+                # Send the request with a random user-agent header over the pooled session
+                response = self._rate_limited_get(url)
+
+                # If the request is successful, return the response
+                if response.status_code == 200:
+                    logger.log.debug(f"Successfully fetched data from {url}")
+                    if cache is not None:
+                        cache.put(url, response)
+                    return response
+
+                # Log unsuccessful response
+                logger.log.debug(f"Received status code {response.status_code} from {url}")
+
+            except requests.exceptions.RequestException as e:
+                logger.log.debug(f"Request error: {e}. Retrying... (Attempt {retries + 1}/{max_retries})")
+
+            # Increment retry count
+            retries += 1
+
+            # Implement exponential backoff
+            time.sleep(backoff_time)
+            backoff_time = min(backoff_time * 2, 60)  # Cap backoff at 60 seconds
+
+        # Log that maximum retries were reached
+        logger.log.debug(f"Max retries reached. Unable to fetch jobs from {url}")
+        return None
+
+    def _rate_limited_get(self, url):
+        """Send a GET request once the rate limiter allows it, reporting the outcome back to it."""
+        host = self.rate_limiter.acquire(url)
+        status_code = None
+        retry_after = None
+        try:
+            response = self.session.get(url, headers=get_random_header(), timeout=self.timeout)
+            status_code = response.status_code
+            retry_after = response.headers.get('Retry-After')
+            return response
+        finally:
+            self.rate_limiter.release(host, status_code, retry_after)
+
+    def log_metrics(self, logger=None):
+        """Log the current rate limiter state for every host contacted so far."""
+        logger = logger or self.logger
+        if logger is None:
+            return
+        for host, metrics in self.rate_limiter.metrics().items():
+            logger.log.info(f"Rate limiter for {host}: {metrics['rate']} req/s, concurrency {metrics['concurrency']}, "
+                            f"{metrics['requests']} requests, {metrics['throttled']} throttled.")
+
+    def close(self):
+        """Close the session and release the pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+def get_default_fetcher():
+    """Returns the process-wide HttpFetcher, creating it on first use."""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+        return _default_fetcher
+
+def fetch_until_success(url, logger=None, max_retries=5, backoff_time=1, cache: ResponseCache = None):
     """
     Attempts to fetch jobs from a URL until success or maximum retries are reached.
 
+    Thin compatibility wrapper around `HttpFetcher.fetch_until_success` using the shared default fetcher.
+
     Args:
         url (str): The URL to fetch jobs from.
         logger (Logger, optional): Logger instance. Defaults to creating a new logger.
         max_retries (int, optional): Maximum number of retries before giving up. Defaults to 5.
         backoff_time (int or float, optional): Initial backoff time in seconds between retries. Defaults to 1 second.
+        cache (ResponseCache, optional): Response cache consulted before, and filled after, the request.
 
     Returns:
         Response or None: Returns the response object if successful, otherwise None.
     """
-
-    # Create a default logger if none is provided
-    if logger is None:
-        logger = Logger('fetch_jobs.log')
-
-    retries = 0
-
-    while retries < max_retries:
-        try:
-            # Log the attempt
-            logger.log.debug(f"Attempting to fetch data from {url} (Attempt {retries + 1}/{max_retries})")
-
-            # Send the request with a random user-agent header
-            response = requests.get(url, headers=get_random_header(), timeout=10)
-            
-            # If the request is successful, return the response
-            if response.status_code == 200:
-                logger.log.debug(f"Successfully fetched data from {url}")
-                return response
-            
-            # Log unsuccessful response
-            logger.log.debug(f"Received status code {response.status_code} from {url}")
-        
-        except requests.exceptions.RequestException as e:
-            logger.log.debug(f"Request error: {e}. Retrying... (Attempt {retries + 1}/{max_retries})")
-
-        # Increment retry count
-        retries += 1
-
-        # Implement exponential backoff
-        time.sleep(backoff_time)
-        backoff_time = min(backoff_time * 2, 60)  # Cap backoff at 60 seconds
-    
-    # Log that maximum retries were reached
-    logger.log.debug(f"Max retries reached. Unable to fetch jobs from {url}")
-    return None
\ No newline at end of file
+    return get_default_fetcher().fetch_until_success(url, logger, max_retries=max_retries, backoff_time=backoff_time, cache=cache)
@@ -1,9 +1,58 @@
 from Utils.logger import Logger
+import hashlib
 import os
 import json
 from openai import OpenAI
 from dotenv import load_dotenv
 
+# Model used for the chat completions unless another one is configured
+DEFAULT_MODEL = "gpt-4o-mini"
+
+SYSTEM_PROMPT = """You are an assistant that extracts structured data from job descriptions in JSON format. Please ensure the output matches the following keys: Description, TechStack, YoE, MinLevelStudies, and English. The English key should be a boolean (True/False) that indicates whether the position requires English language proficiency, if the initial job description is in English, assume English as a requirement. If the information is in a language other than English, translate it and use English in the description you parse to the JSON. Do not add information about the company in the Description, only include relevant information about the job. Add all relevant information about the techstack, including all languages and hard skills. Return only the JSON object as the output, without anything else before or after it."""
+
+FEW_SHOT_EXAMPLE = """Here's an example of how I want the job description processed:
+        Job Description:
+        "The main challenge for the Artificial Intelligence Developer is to develop and implement advanced AI solutions that optimize educational and administrative processes. This position requires the ability to apply cutting-edge AI technologies to enhance learning quality, automate administrative processes, and support data-driven decision-making, driving innovation and efficiency in the institution."
+
+        Output:
+        {{
+        "Description": "The main challenge for the Artificial Intelligence Developer is to develop and implement advanced AI solutions that optimize processes, improve learning quality, and support decision-making through data-driven technologies.",
+        "TechStack": ["Python", "R", "SQL", "NoSQL", "Agile Methodologies"],
+        "YoE": "N/A",
+        "MinLevelStudies": "N/A",
+        "English": True
+        }}
+"""
+
+USER_PROMPT_TEMPLATE = FEW_SHOT_EXAMPLE + """
+    Now process this new job description:
+    "{description}"
+    """
+
+PACKED_USER_PROMPT_TEMPLATE = FEW_SHOT_EXAMPLE + """
+    Now process each of the following job descriptions, given as a JSON array of objects with a JobID and a Description:
+    {postings}
+
+    Return a JSON object with a single key "Jobs" holding an array with one object per job description, in the same order.
+    Each object must have the JobID of its job description and the keys Description, TechStack, YoE, MinLevelStudies and English.
+    """
+
+# Keys every parsed enrichment holds
+ENRICHMENT_KEYS = ('Description', 'TechStack', 'YoE', 'MinLevelStudies', 'English')
+
+# Endpoint of the requests sent through the Batch API
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch statuses after which the batch no longer changes
+BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+def _prompt_version(user_prompt_template: str) -> str:
+    return hashlib.sha256(f"{SYSTEM_PROMPT}\x1f{user_prompt_template}".encode('utf-8')).hexdigest()[:12]
+
+# Version stamps of the prompts, derived from their text so any edit to them changes the stamp
+PROMPT_VERSION = _prompt_version(USER_PROMPT_TEMPLATE)
+PACKED_PROMPT_VERSION = _prompt_version(PACKED_USER_PROMPT_TEMPLATE)
+
 class OpenAIHandler:
     """
     A class for handling interactions with OpenAI services.
@@ -11,20 +60,40 @@ class OpenAIHandler:
     Attributes:
         logger (Logger) (Optional): The logger object for logging messages.
         client (OpenAI): The OpenAI client for API interactions.
+        model (str): The model used for the chat completions.
+        prompt_version (str): Version stamp of the prompt built by `create_messages`.
+        packed_prompt_version (str): Version stamp of the prompt built by `create_packed_messages`.
 
     Methods:
         create_messages: Creates a list of messages for processing job descriptions.
         generate_chat_completion: Generates chat completions using the OpenAI client and returns the parsed result.
+        create_packed_messages: Creates a list of messages processing several job descriptions in one request.
+        generate_packed_completion: Generates a packed chat completion and splits the result per JobID.
+        create_batch_request: Builds one line of a Batch API input file.
+        submit_batch: Uploads a JSONL batch file and creates a batch from it.
+        retrieve_batch: Returns the current state of a batch.
+        download_batch_results: Returns the parsed results and errors of a finished batch.
     """
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, client=None, model: str = DEFAULT_MODEL):
         """
         Initialize the OpenAIHandler with a logger instance and configure the OpenAI client 
         by loading the API key from environment variables.
-        
+
+        Args:
+            logger (Logger, optional): The logger object for logging messages.
+            client (optional): A preconfigured client exposing `chat.completions.create`, such as
+                an offline replay client. Defaults to a new OpenAI client.
+            model (str, optional): The model used for the chat completions. Defaults to DEFAULT_MODEL.
         """
         self.logger = logger if logger is not None else Logger("openai.log")
+        self.model = model
+        self.prompt_version = PROMPT_VERSION
+        self.packed_prompt_version = PACKED_PROMPT_VERSION
         self.logger.log.info("Initializing OpenAI Handler")
-        self._configure_openai()
+        if client is not None:
+            self.client = client
+        else:
+            self._configure_openai()
 
 
     def _configure_openai(self):
@@ -59,26 +128,11 @@ class OpenAIHandler:
         return [
             {
                 "role": "system",
-                "content": """You are an assistant that extracts structured data from job descriptions in JSON format. Please ensure the output matches the following keys: Description, TechStack, YoE, MinLevelStudies, and English. The English key should be a boolean (True/False) that indicates whether the position requires English language proficiency, if the initial job description is in English, assume English as a requirement. If the information is in a language other than English, translate it and use English in the description you parse to the JSON. Do not add information about the company in the Description, only include relevant information about the job. Add all relevant information about the techstack, including all languages and hard skills. Return only the JSON object as the output, without anything else before or after it."""
+                "content": SYSTEM_PROMPT
             },
             {
                 "role": "user",
-                "content": f"""Here's an example of how I want the job description processed:
-        Job Description:
-        "The main challenge for the Artificial Intelligence Developer is to develop and implement advanced AI solutions that optimize educational and administrative processes. This position requires the ability to apply cutting-edge AI technologies to enhance learning quality, automate administrative processes, and support data-driven decision-making, driving innovation and efficiency in the institution."
-
-        Output:
-        {{
-        "Description": "The main challenge for the Artificial Intelligence Developer is to develop and implement advanced AI solutions that optimize processes, improve learning quality, and support decision-making through data-driven technologies.",
-        "TechStack": ["Python", "R", "SQL", "NoSQL", "Agile Methodologies"],
-        "YoE": "N/A",
-        "MinLevelStudies": "N/A",
-        "English": True
-        }}
-
-    Now process this new job description:
-    "{description}"
-    """
+                "content": USER_PROMPT_TEMPLATE.format(description=description)
             }
         ]
 
@@ -99,7 +153,7 @@ class OpenAIHandler:
         try:
             completion = self.client.chat.completions.create(
                 messages=messages,
-                model="gpt-4o-mini",
+                model=self.model,
                 response_format={"type": "json_object"},
             )
             result = completion.choices[0].message.content
@@ -109,4 +163,166 @@ class OpenAIHandler:
         
         except Exception as e:
             self.logger.log.error(f"Unexpected error: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def create_packed_messages(self, postings: dict) -> list:
+        '''
+        Creates a list of messages processing several job descriptions in one request, so the system
+        prompt and the example are sent once for all of them.
+
+        Parameters:
+            postings (dict): JobIDs mapped to their job description.
+
+        Returns:
+            list: A list containing system and user messages asking for one keyed result per job description.
+        '''
+        packed_postings = json.dumps([{"JobID": str(job_id), "Description": str(description)}
+                                      for job_id, description in postings.items()], ensure_ascii=False)
+        return [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": PACKED_USER_PROMPT_TEMPLATE.format(postings=packed_postings)
+            }
+        ]
+
+    def generate_packed_completion(self, messages: list, job_ids: list) -> tuple:
+        '''
+        Generates a chat completion for messages built by `create_packed_messages` and splits it per JobID.
+
+        Parameters:
+            messages (list): The packed messages.
+            job_ids (list): The JobIDs packed in the messages.
+
+        Returns:
+            tuple: (results, failed, usage) where results maps each JobID to its parsed fields, failed lists
+                the JobIDs missing or invalid in the response, and usage is (prompt_tokens, completion_tokens)
+                or None when the client does not report it.
+
+        Raises:
+            Exception: If an unexpected error occurs during the chat completion generation process.
+        '''
+        try:
+            completion = self.client.chat.completions.create(
+                messages=messages,
+                model=self.model,
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            self.logger.log.error(f"Unexpected error: {e}")
+            raise
+
+        usage = getattr(completion, 'usage', None)
+        if usage is not None:
+            usage = (usage.prompt_tokens, usage.completion_tokens)
+        results, failed = self.parse_packed_response(completion.choices[0].message.content, job_ids)
+        return results, failed, usage
+
+    @staticmethod
+    def parse_packed_response(content: str, job_ids: list) -> tuple:
+        '''
+        Splits a packed response back per JobID, validating each entry on its own.
+
+        Parameters:
+            content (str): The JSON content of the completion.
+            job_ids (list): The JobIDs packed in the request.
+
+        Returns:
+            tuple: (results, failed) where results maps each JobID to its parsed fields and failed lists the
+                JobIDs whose entry is missing or lacks one of ENRICHMENT_KEYS.
+        '''
+        job_ids = [str(job_id) for job_id in job_ids]
+        try:
+            entries = json.loads(content).get("Jobs")
+        except (AttributeError, TypeError, ValueError):
+            entries = None
+
+        results = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or not all(key in entry for key in ENRICHMENT_KEYS):
+                continue
+            job_id = str(entry.get("JobID"))
+            if job_id in job_ids and job_id not in results:
+                results[job_id] = {key: entry[key] for key in ENRICHMENT_KEYS}
+
+        return results, [job_id for job_id in job_ids if job_id not in results]
+
+    def create_batch_request(self, custom_id: str, messages: list) -> dict:
+        '''
+        Builds one line of a Batch API input file, the batch counterpart of `generate_chat_completion`.
+
+        Parameters:
+            custom_id (str): Identifier echoed back with the result, such as the JobID.
+            messages (list): A list of messages for chat completion generation.
+
+        Returns:
+            dict: The request, to be serialized as one JSON line.
+        '''
+        return {
+            "custom_id": str(custom_id),
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": self.model,
+                "messages": messages,
+                "response_format": {"type": "json_object"},
+            },
+        }
+
+    def submit_batch(self, batch_file: str, metadata: dict = None) -> str:
+        '''
+        Uploads a JSONL batch file and creates a batch processing it within 24 hours.
+
+        Parameters:
+            batch_file (str): Path of the JSONL file of requests built by `create_batch_request`.
+            metadata (dict, optional): Metadata attached to the batch.
+
+        Returns:
+            str: The batch ID.
+        '''
+        with open(batch_file, 'rb') as file:
+            input_file = self.client.files.create(file=file, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+            metadata=metadata,
+        )
+        self.logger.log.info(f"Submitted OpenAI batch {batch.id} from {batch_file}.")
+        return batch.id
+
+    def retrieve_batch(self, batch_id: str):
+        '''Returns the current state of a batch, whose `status` is final once in BATCH_TERMINAL_STATUSES.'''
+        return self.client.batches.retrieve(batch_id)
+
+    def download_batch_results(self, batch) -> tuple:
+        '''
+        Downloads the output and error files of a finished batch.
+
+        Parameters:
+            batch: The batch returned by `retrieve_batch`.
+
+        Returns:
+            tuple: (results, errors), both keyed by custom ID. Results are the parsed JSON completions,
+                errors describe the requests that failed or returned invalid JSON.
+        '''
+        results, errors = {}, {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get('response') or {}
+                if response.get('status_code') != 200:
+                    errors[record['custom_id']] = record.get('error') or f"HTTP {response.get('status_code')}"
+                    continue
+                try:
+                    results[record['custom_id']] = json.loads(response['body']['choices'][0]['message']['content'])
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    errors[record['custom_id']] = f"Invalid completion: {e}"
+        return results, errors
@@ -54,6 +54,65 @@ class FileManager:
         else:
             self.logger.log.info(f"No new jobs to append to {file_name}.")
 
+    def stream_jobs_to_csv(self, batches, file_name=None):
+        """
+        Append batches of jobs to a CSV file as they arrive, without holding them all in memory.
+
+        Batches whose JobIDs are already stored in the file are skipped. The header is written
+        only when the file is created, and later batches follow the column order of the file.
+
+        Args:
+            batches (iterable): DataFrames of jobs, e.g. from `LinkedInJobScraper.stream`.
+            file_name (str, optional): Target CSV file. Defaults to `generate_file_name()`.
+
+        Returns:
+            int: Number of jobs written.
+        """
+        if file_name is None:
+            file_name = self.generate_file_name()
+
+        if self.has_header(file_name):
+            known_job_ids = self.load_known_job_ids(file_name)
+            columns = list(pd.read_csv(file_name, nrows=0).columns)
+        else:
+            known_job_ids = set()
+            columns = None
+        written_count = 0
+
+        for df in batches:
+            if df is None or df.empty:
+                continue
+
+            df = self.clean_job_ids(df)
+            df = df[~df['JobID'].isin(known_job_ids)]
+            if df.empty:
+                continue
+
+            if columns is None:
+                df.to_csv(file_name, index=False)
+                columns = list(df.columns)
+            else:
+                df.reindex(columns=columns).to_csv(file_name, mode='a', header=False, index=False)
+
+            known_job_ids.update(df['JobID'])
+            written_count += len(df)
+            self.logger.log.info(f"Wrote a batch of {len(df)} jobs to {file_name} ({written_count} so far).")
+
+        self.logger.log.info(f"Streamed {written_count} new jobs to {file_name}.")
+        return written_count
+
+    def has_header(self, file_name):
+        """Returns whether a file exists and is not empty."""
+        return os.path.exists(file_name) and os.path.getsize(file_name) > 0
+
+    def load_known_job_ids(self, file_name):
+        """Load the set of JobIDs already stored in a CSV file, reading only the JobID column."""
+        if not file_name or not os.path.exists(file_name):
+            return set()
+
+        known_job_ids = pd.read_csv(file_name, usecols=['JobID'], dtype={'JobID': str})['JobID']
+        return set(known_job_ids.dropna().str.strip())
+
     def save_new_jobs_to_csv(self, df, file_name):
         """Save new jobs to a CSV file."""
         df.to_csv(file_name, index=False)
@@ -0,0 +1,188 @@
+import json
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.batch_enrichment import BatchEnricher
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import FakeOpenAIClient, ReplayServer, build_synthetic_archive
+from LinkedInWebScraper.utils import HttpFetcher
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+@pytest.fixture
+def df_jobs():
+    return pd.DataFrame({
+        'JobID': ['4000000001', '4000000002', '4000000003'],
+        'Description': ['Data Scientist with 3+ years of Python and SQL.',
+                        'ML Engineer with 5 years of PyTorch and AWS, English required.',
+                        'Data Analyst with Tableau and a degree in statistics.'],
+    })
+
+
+def batch_processor(logger, client, state_file, **kwargs):
+    handler = OpenAIHandler(logger, client=client)
+    enricher = BatchEnricher(handler, logger, str(state_file), poll_interval=0, **kwargs)
+    return JobDescriptionProcessor(handler, logger, batch_enricher=enricher)
+
+
+class TestOpenAIHandlerBatch:
+
+    def test_batch_request_matches_chat_completion(self, logger):
+        handler = OpenAIHandler(logger, client=FakeOpenAIClient())
+        messages = handler.create_messages('Data Scientist with Python.')
+
+        request = handler.create_batch_request(4000000001, messages)
+
+        assert request['custom_id'] == '4000000001'
+        assert request['url'] == '/v1/chat/completions'
+        assert request['body'] == {'model': handler.model, 'messages': messages, 'response_format': {'type': 'json_object'}}
+
+    def test_download_separates_results_and_errors(self, logger, tmp_path):
+        client = FakeOpenAIClient(error_rate=0.5, seed=3)
+        handler = OpenAIHandler(logger, client=client)
+        batch_file = tmp_path / 'batch.jsonl'
+        batch_file.write_text('\n'.join(json.dumps(handler.create_batch_request(job_id, handler.create_messages('Python')))
+                                        for job_id in range(20)))
+
+        batch = handler.retrieve_batch(handler.submit_batch(str(batch_file)))
+        results, errors = handler.download_batch_results(batch)
+
+        assert batch.status == 'completed'
+        assert len(results) + len(errors) == 20
+        assert results and errors
+        assert set(results).isdisjoint(errors)
+
+
+class TestBatchEnrichment:
+
+    def test_matches_synchronous_enrichment(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient()
+        batched = batch_processor(logger, client, tmp_path / 'batch.json').process_job_descriptions(df_jobs.copy())
+        synchronous = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(df_jobs.copy())
+
+        assert client.calls == 0 and client.batch_requests == 3
+        pd.testing.assert_frame_equal(batched, synchronous)
+        # Finished batches leave neither state nor request files behind
+        assert json.loads((tmp_path / 'batch.json').read_text()) == {'batches': {}, 'results': {}}
+        assert not list(tmp_path.glob('*.jsonl'))
+
+    def test_resumes_pending_batch_after_restart(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient(batch_polls=3)
+        state_file = tmp_path / 'batch.json'
+
+        first = batch_processor(logger, client, state_file, max_wait=0).process_job_descriptions(df_jobs.copy())
+        assert first.empty
+        assert list(json.loads(state_file.read_text())['batches']) == ['batch-1']
+
+        # A new process polls the batch recorded in the state file instead of submitting another one
+        second = batch_processor(logger, client, state_file, max_wait=10).process_job_descriptions(df_jobs.copy())
+        assert second['JobID'].tolist() == df_jobs['JobID'].tolist()
+        assert client.batch_requests == 3 and len(client._batches) == 1
+
+    def test_merges_results_by_job_id(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient(batch_polls=2)
+        state_file = tmp_path / 'batch.json'
+        batch_processor(logger, client, state_file, max_wait=0).process_job_descriptions(df_jobs.head(2).copy())
+
+        # The rerun scrapes the postings in another order along with a new one
+        rerun = df_jobs.iloc[[2, 1, 0]].reset_index(drop=True)
+        result = batch_processor(logger, client, state_file, max_wait=10).process_job_descriptions(rerun.copy())
+
+        expected = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(rerun.copy())
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(client._batches) == 2
+
+    def test_failed_requests_are_submitted_again(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient(error_rate=1.0)
+        state_file = tmp_path / 'batch.json'
+
+        assert batch_processor(logger, client, state_file).process_job_descriptions(df_jobs.copy()).empty
+
+        client.error_rate = 0.0
+        result = batch_processor(logger, client, state_file).process_job_descriptions(df_jobs.copy())
+        assert len(result) == 3 and len(client._batches) == 2
+
+    def test_prompt_change_discards_pending_batch(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient(batch_polls=2)
+        state_file = tmp_path / 'batch.json'
+        batch_processor(logger, client, state_file, max_wait=0).process_job_descriptions(df_jobs.copy())
+
+        processor = batch_processor(logger, client, state_file, max_wait=10)
+        processor.openai_handler.prompt_version = 'newer-prompt'
+
+        assert processor.process_job_descriptions(df_jobs.copy()).empty
+        assert len(client._batches) == 1
+        assert json.loads(state_file.read_text())['results'] == {}
+
+    def test_completion_cache_skips_the_batch(self, logger, df_jobs, tmp_path):
+        client = FakeOpenAIClient()
+        cache = CompletionCache(str(tmp_path / 'completions.sqlite'))
+        processor = batch_processor(logger, client, tmp_path / 'batch.json')
+        processor.completion_cache = cache
+
+        processor.process_job_descriptions(df_jobs.copy())
+        processor.process_job_descriptions(df_jobs.copy())
+
+        assert client.batch_requests == 3 and len(client._batches) == 1
+        assert cache.stats()['hits'] == 3
+
+
+def test_pipeline_runs_in_batch_mode(logger, tmp_path):
+    """The full pipeline enriches through the Batch API and resumes the batch on the next run."""
+    archive = build_synthetic_archive(num_jobs=25, remote_types=('REMOTE',))
+    openai_client = FakeOpenAIClient(archive, batch_polls=2)
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        def run(max_wait):
+            config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                      base_url=server.url, openai_batch_state_file=str(tmp_path / 'batch.json'),
+                                      openai_batch_poll_interval=0, openai_batch_max_wait=max_wait)
+            return LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=openai_client).run()
+
+        pending = run(max_wait=0)
+        jobs = run(max_wait=10)
+
+    assert pending.empty
+    assert not jobs.empty
+    assert openai_client.calls == 0
+    assert openai_client.batch_requests == len(jobs)
+    assert {'TechStack', 'MinYoE', 'DatePosted'} <= set(jobs.columns)
+
+
+def test_watermark_waits_for_pending_batches(logger, tmp_path):
+    """Postings left out while their batch is pending or failed are not hidden from the next run by the watermark."""
+    archive = build_synthetic_archive(num_jobs=25, remote_types=('REMOTE',))
+    openai_client = FakeOpenAIClient(archive, error_rate=0.5, seed=1)
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+    watermark_file = tmp_path / 'watermarks.json'
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        def run():
+            config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                      base_url=server.url, watermark_file=str(watermark_file),
+                                      openai_batch_state_file=str(tmp_path / 'batch.json'),
+                                      openai_batch_poll_interval=0, openai_batch_max_wait=10)
+            return LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=openai_client).run()
+
+        partial = run()
+        assert not partial.empty
+        assert not watermark_file.exists()
+
+        openai_client.error_rate = 0.0
+        complete = run()
+
+    assert set(partial['JobID']) < set(complete['JobID'])
+    assert watermark_file.exists()
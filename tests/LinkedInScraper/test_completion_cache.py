@@ -0,0 +1,130 @@
+import os
+import time
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.completion_cache_cli import main
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.replay import FakeOpenAIClient
+from OpenAIHandler.openai_handler import OpenAIHandler, PACKED_PROMPT_VERSION, PROMPT_VERSION
+
+DESCRIPTION = "We are looking for a Data Scientist with 3+ years of experience in Python and SQL."
+ENRICHMENT = {'Description': 'Data Scientist role.', 'TechStack': ['Python', 'SQL'], 'YoE': '3+ years',
+              'MinLevelStudies': 'N/A', 'English': True}
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CompletionCache(os.path.join(tmp_path, 'completions.sqlite'))
+    yield cache
+    cache.close()
+
+
+class TestCompletionCache:
+
+    def test_hit_and_miss_counters(self, cache):
+        assert cache.get(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini') is None
+        cache.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+
+        assert cache.get(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini') == ENRICHMENT
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_key_normalizes_whitespace_and_unicode_form(self):
+        a = CompletionCache.key("  Cient\u00edfico de   Datos\n", PROMPT_VERSION, 'gpt-4o-mini')
+        b = CompletionCache.key("Cienti\u0301fico de Datos", PROMPT_VERSION, 'gpt-4o-mini')
+        assert a == b
+
+    def test_prompt_version_and_model_are_part_of_the_key(self, cache):
+        cache.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+
+        assert cache.get(DESCRIPTION, 'older-prompt', 'gpt-4o-mini') is None
+        assert cache.get(DESCRIPTION, PROMPT_VERSION, 'gpt-4o') is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = os.path.join(tmp_path, 'completions.sqlite')
+        first = CompletionCache(path)
+        first.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+        first.close()
+
+        assert CompletionCache(path).get(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini') == ENRICHMENT
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = CompletionCache(os.path.join(tmp_path, 'completions.sqlite'), max_size_mb=0.0015)
+        for position in range(3):
+            cache.put(f'{DESCRIPTION} {position}', PROMPT_VERSION, 'gpt-4o-mini', {'Description': 'x' * 500})
+            time.sleep(0.01)
+        cache.get(f'{DESCRIPTION} 0', PROMPT_VERSION, 'gpt-4o-mini')
+        time.sleep(0.01)
+        cache.put(f'{DESCRIPTION} 3', PROMPT_VERSION, 'gpt-4o-mini', {'Description': 'x' * 500})
+
+        assert cache.get(f'{DESCRIPTION} 0', PROMPT_VERSION, 'gpt-4o-mini') is not None
+        assert cache.get(f'{DESCRIPTION} 1', PROMPT_VERSION, 'gpt-4o-mini') is None
+        assert cache.stats()['size_bytes'] <= cache.max_size
+
+    def test_invalidate(self, cache):
+        cache.put(DESCRIPTION, 'older-prompt', 'gpt-4o-mini', ENRICHMENT)
+        cache.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+        cache.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o', ENRICHMENT)
+
+        assert cache.invalidate(keep_prompt_versions=(PROMPT_VERSION,)) == 1
+        assert cache.invalidate(prompt_version=PROMPT_VERSION, model='gpt-4o') == 1
+        assert cache.versions() == [(PROMPT_VERSION, 'gpt-4o-mini', 1)]
+        assert cache.invalidate() == 1
+        assert len(cache) == 0 and cache.stats()['size_bytes'] == 0
+
+    def test_command_line_invalidates_stale_entries(self, tmp_path, capsys):
+        path = os.path.join(tmp_path, 'completions.sqlite')
+        cache = CompletionCache(path)
+        cache.put(DESCRIPTION, 'older-prompt', 'gpt-4o-mini', ENRICHMENT)
+        cache.put(DESCRIPTION, PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+        cache.put(DESCRIPTION, PACKED_PROMPT_VERSION, 'gpt-4o-mini', ENRICHMENT)
+        cache.close()
+
+        main(['stats', path])
+        output = capsys.readouterr().out
+        assert f'{PROMPT_VERSION} (current)' in output and f'{PACKED_PROMPT_VERSION} (current)' in output
+
+        # Packed completions are current as well and survive --stale
+        main(['invalidate', path, '--stale'])
+        assert 'Deleted 1 cached completions.' in capsys.readouterr().out
+        assert CompletionCache(path).versions() == sorted([(PROMPT_VERSION, 'gpt-4o-mini', 1),
+                                                           (PACKED_PROMPT_VERSION, 'gpt-4o-mini', 1)])
+
+
+def test_prompt_version_tracks_the_prompt(logger):
+    handler = OpenAIHandler(logger, client=FakeOpenAIClient())
+
+    assert handler.prompt_version == PROMPT_VERSION
+    assert len(PROMPT_VERSION) == 12
+
+
+def test_processor_serves_repeated_descriptions_from_the_cache(logger, cache):
+    client = FakeOpenAIClient()
+    df_jobs = pd.DataFrame({'JobID': ['4000000001', '4000000002'],
+                            'Description': [DESCRIPTION, f'Senior {DESCRIPTION}']})
+
+    first = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, completion_cache=cache) \
+        .process_job_descriptions(df_jobs.copy())
+    assert client.calls == 2
+
+    # A rerun, or the same postings under another remote filter, is answered by the cache
+    rerun = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, completion_cache=cache,
+                                    max_in_flight=2).process_job_descriptions(df_jobs.copy())
+    assert client.calls == 2
+    assert cache.stats()['hits'] == 2
+    pd.testing.assert_frame_equal(rerun, first)
+
+    # Another model does not reuse the completions of the first one
+    JobDescriptionProcessor(OpenAIHandler(logger, client=client, model='gpt-4o'), logger, completion_cache=cache) \
+        .process_job_descriptions(df_jobs.copy())
+    assert client.calls == 4
@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+from LinkedInWebScraper.dedupe_index import DedupeIndex
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def jobs(job_ids, titles=None, location='Monterrey Metropolitan Area'):
+    titles = titles or [f'Data Scientist {job_id}' for job_id in job_ids]
+    return pd.DataFrame({'JobID': job_ids, 'Title': titles, 'Company': 'Company A', 'Location': location})
+
+
+class TestDedupeIndex:
+
+    def test_seen_by_job_id_or_listing(self, tmp_path):
+        index = DedupeIndex(str(tmp_path / 'dedupe.sqlite'))
+        index.add(jobs(['4000000001', '4000000002']))
+
+        # A new JobID republishing the same listing counts as seen, as in remove_duplicates_by_columns
+        candidates = jobs(['4000000001', '4000000009', '4000000003'],
+                          titles=['Other title', 'Data Scientist 4000000002', 'Data Scientist 4000000003'])
+
+        assert index.seen_mask(candidates).tolist() == [True, True, False]
+        assert len(index) == 4
+
+    def test_persists_across_runs(self, tmp_path):
+        path = str(tmp_path / 'dedupe.sqlite')
+        DedupeIndex(path).add(jobs(['4000000001']))
+
+        assert DedupeIndex(path).seen_mask(jobs(['4000000001', '4000000002'])).tolist() == [True, False]
+
+    def test_expiry(self, tmp_path):
+        path = str(tmp_path / 'dedupe.sqlite')
+        with patch('time.time', return_value=1_000_000.0):
+            DedupeIndex(path, max_age_days=7).add(jobs(['4000000001']))
+
+        with patch('time.time', return_value=1_000_000.0 + 6 * 86400):
+            index = DedupeIndex(path, max_age_days=7)
+            assert index.seen_mask(jobs(['4000000001'])).tolist() == [True]
+            # Seeing a fresh posting again keeps its first seen date
+            index.add(jobs(['4000000001']))
+
+        with patch('time.time', return_value=1_000_000.0 + 8 * 86400):
+            index = DedupeIndex(path, max_age_days=7)
+            assert index.seen_mask(jobs(['4000000001'])).tolist() == [False]
+            assert len(index) == 0
+
+    def test_many_lookups(self, tmp_path):
+        index = DedupeIndex(str(tmp_path / 'dedupe.sqlite'))
+        job_ids = [str(4000000000 + i) for i in range(2000)]
+        index.add(jobs(job_ids[::2]))
+
+        assert index.seen_mask(jobs(job_ids)).tolist() == [i % 2 == 0 for i in range(2000)]
+
+
+def test_scraper_skips_jobs_seen_by_earlier_runs(logger, tmp_path):
+    """Jobs processed by an earlier run, for any remote type, never reach fetch_job_details."""
+    path = str(tmp_path / 'dedupe.sqlite')
+    DedupeIndex(path).add(jobs(['4000000001']))
+    cleaned_jobs = jobs(['4000000001', '4000000002', '4000000003'])
+    config = JobScraperConfig('Data Scientist', 'Monterrey', remote='HYBRID', dedupe_index_file=path)
+    scraper = LinkedInJobScraper(logger, config)
+
+    with patch.object(scraper, 'scrape_jobs', return_value=cleaned_jobs), \
+         patch.object(scraper, 'clean_jobs', return_value=cleaned_jobs), \
+         patch.object(scraper, 'fetch_job_details', side_effect=lambda df: df) as mock_fetch, \
+         patch.object(scraper, 'clean_job_details', side_effect=lambda df: df):
+        scraper.run()
+
+    assert mock_fetch.call_args[0][0]['JobID'].tolist() == ['4000000002', '4000000003']
+    assert scraper.skipped_seen_jobs == 1
+    assert DedupeIndex(path).seen_mask(cleaned_jobs).all()
@@ -0,0 +1,158 @@
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper import description_trimmer
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.description_trimmer import DescriptionTrimmer
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import FakeOpenAIClient, ReplayServer, build_synthetic_archive
+from LinkedInWebScraper.utils import HttpFetcher
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+ABOUT_US = "Acme Corp is a global leader in delivering innovative solutions to customers around the world."
+EEO = "We are an equal opportunity employer and value diversity at our company."
+REQUIREMENT = "Advanced English is required for this role and daily meetings with our global team members."
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def posting(number):
+    return f"{ABOUT_US} We need a Data Scientist for project {number}. {number % 5 + 1}+ years of Python. {REQUIREMENT} {EEO}"
+
+
+class TestDescriptionTrimmer:
+
+    def test_strips_boilerplate_shared_by_many_postings(self):
+        trimmer = DescriptionTrimmer(min_postings=3, encoding=None)
+        descriptions = [posting(number) for number in range(4)]
+
+        trimmed = trimmer.trim_descriptions([str(number) for number in range(4)], descriptions)
+
+        assert trimmed[0] == f"We need a Data Scientist for project 0. 1+ years of Python. {REQUIREMENT}"
+        stats = trimmer.stats()
+        assert stats['sentences_stripped'] == 8
+        assert stats['tokens_saved'] == stats['tokens_before'] - stats['tokens_after'] > 0
+
+    def test_keeps_rare_sentences(self):
+        trimmer = DescriptionTrimmer(min_postings=3, encoding=None)
+        descriptions = [posting(number) for number in range(2)]
+
+        assert trimmer.trim_descriptions(['1', '2'], descriptions) == descriptions
+        assert trimmer.stats()['tokens_saved'] == 0
+
+    def test_counts_each_posting_once(self, tmp_path):
+        path = str(tmp_path / 'sentences.sqlite')
+        for _ in range(3):
+            trimmer = DescriptionTrimmer(path, min_postings=3, encoding=None)
+            assert trimmer.trim_descriptions(['1', '2'], [posting(1), posting(2)]) == [posting(1), posting(2)]
+            trimmer.close()
+
+        # A third posting on a later run reaches the threshold shared across runs
+        trimmer = DescriptionTrimmer(path, min_postings=3, encoding=None)
+        assert ABOUT_US not in trimmer.trim_descriptions(['3'], [posting(3)])[0]
+        assert len(trimmer) == 3
+
+    def test_sentence_matching_ignores_case_and_spacing(self):
+        assert DescriptionTrimmer.sentence_key(ABOUT_US) == DescriptionTrimmer.sentence_key(f"  {ABOUT_US.upper()}")
+
+    def test_caps_descriptions_to_the_token_budget(self):
+        trimmer = DescriptionTrimmer(max_tokens=36, encoding=None)
+        description = posting(1)
+
+        trimmed = trimmer.trim_descriptions(['1'], [description])[0]
+
+        assert trimmed == f"{ABOUT_US} We need a Data Scientist for project 1."
+        assert trimmer.count_tokens(trimmed) <= 36
+        assert trimmer.stats()['truncated'] == 1
+
+        # A single sentence above the budget is cut
+        assert trimmer.trim_descriptions(['2'], ['word ' * 100])[0] == ('word ' * 100).strip()[:144]
+
+    def test_falls_back_to_the_estimate_when_the_encoding_cannot_load(self, logger, monkeypatch):
+        offline_tiktoken = MagicMock()
+        offline_tiktoken.encoding_for_model.side_effect = ConnectionError('cannot fetch the BPE file')
+        monkeypatch.setattr(description_trimmer, 'tiktoken', offline_tiktoken)
+
+        trimmer = DescriptionTrimmer(logger=logger)
+
+        assert trimmer.encoding is None
+        assert trimmer.count_tokens('x' * 40) == 10
+        logger.log.warning.assert_called_once()
+
+    def test_missing_descriptions_are_left_alone(self):
+        trimmer = DescriptionTrimmer(min_postings=1, encoding=None)
+        assert trimmer.trim_descriptions(['1', '2'], ['N/A', None]) == ['N/A', None]
+        assert trimmer.stats()['descriptions'] == 0
+
+
+class TestTrimmedEnrichment:
+
+    def test_sends_trimmed_descriptions_and_keeps_the_full_text(self, logger):
+        prompts = []
+        client = FakeOpenAIClient()
+        create = client._create
+        client.chat.completions.create = lambda messages, **kwargs: prompts.append(messages[-1]['content']) or create(messages, **kwargs)
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger,
+                                            trimmer=DescriptionTrimmer(min_postings=3, encoding=None))
+        df_jobs = pd.DataFrame({'JobID': [str(number) for number in range(5)],
+                                'Description': [posting(number) for number in range(5)]})
+
+        result = processor.process_job_descriptions(df_jobs.copy())
+
+        assert result['Description'].tolist() == df_jobs['Description'].tolist()
+        assert all(ABOUT_US not in prompt.rsplit('Now process', 1)[-1] for prompt in prompts)
+        assert result['YoE'].tolist() == [f"{number % 5 + 1}+ years" for number in range(5)]
+        assert result['English'].all()
+
+    def test_cache_hits_survive_sentences_crossing_the_threshold(self, logger, tmp_path):
+        prompts = []
+        client = FakeOpenAIClient()
+        create = client._create
+        client.chat.completions.create = lambda messages, **kwargs: prompts.append(messages[-1]['content']) or create(messages, **kwargs)
+        cache = CompletionCache(str(tmp_path / 'completions.sqlite'))
+
+        def run(numbers):
+            trimmer = DescriptionTrimmer(str(tmp_path / 'sentences.sqlite'), min_postings=3, encoding=None)
+            processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger,
+                                                completion_cache=cache, trimmer=trimmer)
+            df_jobs = pd.DataFrame({'JobID': [str(number) for number in numbers],
+                                    'Description': [posting(number) for number in numbers]})
+            processor.process_job_descriptions(df_jobs)
+            trimmer.close()
+
+        run([1, 2])
+        assert client.calls == 2 and all(ABOUT_US in prompt for prompt in prompts)
+
+        # The third posting makes the company blurb boilerplate, the first two still hit the cache
+        run([1, 2, 3])
+        assert client.calls == 3
+        assert ABOUT_US not in prompts[-1].rsplit('Now process', 1)[-1]
+        assert cache.stats()['hits'] == 2
+
+
+def test_pipeline_reports_tokens_saved(logger):
+    """Boilerplate shared by the synthetic postings is stripped without changing the extracted fields."""
+    archive = build_synthetic_archive(num_jobs=25, remote_types=('REMOTE',))
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        def run(**kwargs):
+            config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                      base_url=server.url, **kwargs)
+            scraper = LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=FakeOpenAIClient(archive))
+            return scraper, scraper.run()
+
+        scraper, trimmed = run(trim_descriptions=True, boilerplate_min_postings=3)
+        _, full = run()
+
+    assert scraper.description_processor.trimmer.stats()['tokens_saved'] > 0
+    pd.testing.assert_frame_equal(trimmed[['JobID', 'TechStack', 'YoE', 'MinLevelStudies', 'English']],
+                                  full[['JobID', 'TechStack', 'YoE', 'MinLevelStudies', 'English']])
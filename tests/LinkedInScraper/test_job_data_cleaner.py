@@ -0,0 +1,324 @@
+import random
+from datetime import datetime, timedelta
+import re
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+from LinkedInWebScraper.location_resolver import fold_location
+from Utils.constants import LOCATION_MAPPING, TECH_STACK_CATEGORIES
+
+
+FOLDED_LOCATION_MAPPING = {fold_location(city): area for city, area in LOCATION_MAPPING.items()}
+
+
+def reference_process_location_data(df):
+    """The original row-by-row implementation of JobDataCleaner.process_location_data, looking up folded cities."""
+    df['Location'] = df['Location'].apply(lambda x: x.split(',')[0])
+    df['Location'] = df['Location'].apply(lambda loc: FOLDED_LOCATION_MAPPING.get(fold_location(loc), 'Other'))
+    df = df[df['Location'] != 'Other']
+    df['Location'] = df['Location'].astype('category')
+    return df
+
+
+def reference_process_urls_and_job_ids(df):
+    """The original row-by-row implementation of JobDataCleaner.process_urls_and_job_ids."""
+    df['Url'] = df['Url'].apply(lambda url: url.split('?position')[0])
+    df['JobID'] = df['Url'].apply(lambda url: url[-10:])
+    return df
+
+
+def reference_filter_valid_job_ids(df):
+    """The original row-by-row implementation of JobDataCleaner.filter_valid_job_ids."""
+    df = df[df['JobID'].notna()]
+    return df[df['JobID'].apply(lambda x: re.fullmatch(r'\d{10}', str(x)) is not None)]
+
+
+def random_jobs(rows, seed=0):
+    """Build scraped jobs covering mapped, unmapped and malformed locations and URLs."""
+    rng = random.Random(seed)
+    cities = list(LOCATION_MAPPING) + ['Austin', 'Remote', 'Monterrey', 'Zapopan ', '']
+    suffixes = ['?position=1&pageNum=0', '?position=12', '', '?refId=abc', '?position=3?position=4']
+    ids = ['4012345678', '401234567', 'abcdefghij', '４０１２３４５６７８', '40123456789']
+    return pd.DataFrame({
+        'Location': [f"{rng.choice(cities)}{rng.choice(['', ', Nuevo León, Mexico', ',', ', Jalisco'])}" for _ in range(rows)],
+        'Title': [f'Title {rng.randint(0, 20)}' for _ in range(rows)],
+        'Url': [f"https://mx.linkedin.com/jobs/view/job-{rng.choice(ids)}{rng.choice(suffixes)}" for _ in range(rows)],
+    })
+
+
+@pytest.fixture
+def cleaner():
+    logger = MagicMock()
+    logger.log = MagicMock()
+    return JobDataCleaner(logger)
+
+
+class TestVectorizedCleaning:
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_process_location_data(self, cleaner, seed):
+        expected = reference_process_location_data(random_jobs(500, seed))
+        result = cleaner.process_location_data(random_jobs(500, seed))
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_process_urls_and_job_ids(self, cleaner, seed):
+        expected = reference_process_urls_and_job_ids(random_jobs(500, seed))
+        result = cleaner.process_urls_and_job_ids(random_jobs(500, seed))
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_filter_valid_job_ids(self, cleaner, seed):
+        df = reference_process_urls_and_job_ids(random_jobs(500, seed))
+        df.loc[::7, 'JobID'] = None
+
+        pd.testing.assert_frame_equal(cleaner.filter_valid_job_ids(df.copy()), reference_filter_valid_job_ids(df.copy()))
+
+    def test_clean_jobs_dataframe(self, cleaner):
+        df = random_jobs(1000).assign(Company='Company A')
+        expected = reference_filter_valid_job_ids(reference_process_urls_and_job_ids(reference_process_location_data(df.copy())))
+        expected = expected.drop_duplicates(subset='JobID', keep='first').reset_index(drop=True)
+        expected = expected.drop_duplicates(subset=['Location', 'Title', 'Company']).reset_index(drop=True)
+
+        result = cleaner.clean_jobs_dataframe(df, LOCATION_MAPPING)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_empty_dataframe(self, cleaner):
+        df = pd.DataFrame({'Location': pd.Series([], dtype=object), 'Url': pd.Series([], dtype=object)})
+
+        result = cleaner.filter_valid_job_ids(cleaner.process_urls_and_job_ids(cleaner.process_location_data(df)))
+
+        assert result.empty
+
+
+def reference_categorize_tech_stack(df_jobs, tech_stack_categories):
+    """The original iterrows implementation of JobDataCleaner.categorize_tech_stack."""
+    for category in tech_stack_categories:
+        df_jobs[category] = 0
+    df_jobs['Other'] = 0
+
+    for index, row in df_jobs.iterrows():
+        tech_stack_elements = [element.strip() for element in row['TechStack'].split(',')]
+        category_found = False
+        for category, items in tech_stack_categories.items():
+            for item in items:
+                if any(item in element for element in tech_stack_elements):
+                    df_jobs.at[index, category] = 1
+                    category_found = True
+        if not category_found:
+            df_jobs.at[index, 'Other'] = 1
+
+    return df_jobs
+
+
+class TestTechStackCategorizer:
+
+    def random_tech_stacks(self, rows, seed=0):
+        rng = random.Random(seed)
+        vocabulary = [item for items in TECH_STACK_CATEGORIES.values() for item in items]
+        vocabulary += ['Excel', 'Rust', 'Microsoft Azure Synapse', 'AWSome', 'C++', 'sql', 'N/A', '']
+        return pd.DataFrame({'TechStack': [', '.join(rng.sample(vocabulary, rng.randint(0, 6))) for _ in range(rows)]},
+                            index=range(10, 10 + rows))
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_matches_iterrows_reference(self, cleaner, seed):
+        df = self.random_tech_stacks(400, seed)
+
+        expected = reference_categorize_tech_stack(df.copy(), TECH_STACK_CATEGORIES)
+        result = cleaner.categorize_tech_stack(df.copy(), TECH_STACK_CATEGORIES)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_prefix_and_special_characters(self, cleaner):
+        categories = {'Cloud': ['AWS', 'AWS Redshift'], 'Warehouse': ['Redshift'], 'Languages': ['C#', 'C++', '.NET'],
+                      'Spans': ['SQL, Python']}
+        df = pd.DataFrame({'TechStack': ['AWS Redshift', 'C++, ASP.NET', 'SQL, Python', 'Redshift', '']})
+
+        expected = reference_categorize_tech_stack(df.copy(), categories)
+        result = cleaner.categorize_tech_stack(df.copy(), categories)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert result.loc[0, ['Cloud', 'Warehouse']].tolist() == [1, 1]
+        assert result['Spans'].sum() == 0
+        assert result.loc[2:4, 'Other'].tolist() == [1, 0, 1]
+
+
+def reference_convert_posted_time(df_jobs, today):
+    """The original per-row implementation of JobDataCleaner.convert_posted_time, with a fixed clock."""
+
+    def convert_posted_time(text):
+        if 'hour' in text:
+            return today
+        if 'day' in text:
+            days = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
+            return today - timedelta(days=days)
+        if 'week' in text:
+            weeks = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
+            return today - timedelta(days=weeks * 7)
+        if 'month' in text:
+            months = int(re.search(r'\d+', text).group()) if re.search(r'\d+', text) else 1
+            return today - timedelta(days=months * 30)
+        return 'N/A'
+
+    return df_jobs['PostedTime'].apply(convert_posted_time)
+
+
+class TestConvertPostedTime:
+
+    POSTED_TIMES = ['2 hours ago', '1 hour ago', '1 day ago', '6 days ago', '3 weeks ago', '1 week ago',
+                    'Reposted 2 weeks ago', '1 month ago', '11 months ago', 'a day ago', 'N/A', '30 minutes ago', '']
+
+    def test_matches_reference(self, cleaner):
+        today = datetime(2024, 5, 17, 9, 30)
+        df = pd.DataFrame({'PostedTime': self.POSTED_TIMES * 20})
+
+        expected = reference_convert_posted_time(df, today).replace('N/A', pd.NaT)
+        result = cleaner.convert_posted_time(df.copy(), reference_time=today)
+
+        assert 'PostedTime' not in result and result['DatePosted'].dtype == 'datetime64[ns]'
+        pd.testing.assert_series_equal(result['DatePosted'], pd.to_datetime(expected).astype('datetime64[ns]'),
+                                       check_names=False)
+
+    def test_single_reference_clock_and_nat(self, cleaner):
+        df = pd.DataFrame({'PostedTime': ['5 hours ago', '2 days ago', 'N/A', None]})
+
+        result = cleaner.convert_posted_time(df)['DatePosted']
+
+        assert result[1] == result[0] - pd.Timedelta(days=2)
+        assert result[2:].isna().all()
+
+
+class ReferenceDetailCleaner(JobDataCleaner):
+    """JobDataCleaner with the original per-row detail field normalization."""
+
+    def clean_num_applicants(self, df_jobs):
+        def extract_num_applicants(text):
+            match = re.search(r'\d+', text)
+            if match:
+                return int(match.group())
+            elif "Be among the first 25" in text:
+                return 25
+            elif "Over 200 applicants" in text:
+                return 200
+            return 'N/A'
+
+        df_jobs['NumApplicants'] = df_jobs['NumApplicants'].apply(extract_num_applicants)
+        return df_jobs
+
+    def clean_seniority_level(self, df_jobs):
+        df_jobs['SeniorityLevel'] = df_jobs['SeniorityLevel'].apply(lambda x: 'N/A' if 'Not Applicable' in x else x)
+        seniority_categories = ['Entry level', 'Mid-Senior level', 'Executive', 'N/A', 'Associate', 'Internship']
+        df_jobs['SeniorityLevel'] = pd.Categorical(df_jobs['SeniorityLevel'], categories=seniority_categories)
+        return df_jobs
+
+    def standardize_job_function(self, df_jobs):
+        def standardize_job_function(text):
+            if ' and ' in text:
+                text = text.replace(' and ', ', ')
+            job_functions = text.split(', ')
+            if len(job_functions) > 3:
+                job_functions = job_functions[:3]
+            return ', '.join(job_functions)
+
+        df_jobs['JobFunction'] = df_jobs['JobFunction'].replace({
+            'Research and Design': 'R&D',
+            'Design and Product Management': 'Product Management'
+        }, regex=False)
+        df_jobs['JobFunction'] = df_jobs['JobFunction'].apply(standardize_job_function)
+        return df_jobs
+
+    def split_job_functions(self, df_jobs):
+        def split_job_functions(text):
+            job_functions = text.split(', ')
+            return pd.Series([job_functions[i] if len(job_functions) > i else None for i in range(3)])
+
+        df_jobs[['JobFunction1', 'JobFunction2', 'JobFunction3']] = df_jobs['JobFunction'].apply(split_job_functions)
+        for column in ['JobFunction1', 'JobFunction2', 'JobFunction3']:
+            df_jobs[column] = df_jobs[column].fillna('N/A')
+        job_function_categories = list(set(
+            df_jobs['JobFunction1'].unique().tolist() +
+            df_jobs['JobFunction2'].unique().tolist() +
+            df_jobs['JobFunction3'].unique().tolist()
+        ))
+        for column in ['JobFunction1', 'JobFunction2', 'JobFunction3']:
+            df_jobs[column] = pd.Categorical(df_jobs[column], categories=job_function_categories)
+        df_jobs.drop(columns=['JobFunction'], inplace=True)
+        return df_jobs
+
+
+def random_job_details(rows, seed=0):
+    """Build enriched job details with the detail field texts LinkedIn shows."""
+    rng = random.Random(seed)
+    applicants = ['Be among the first 25 applicants', 'Over 200 applicants', '37 applicants', '112 applicants', 'N/A',
+                  '1 applicant']
+    seniority = ['Entry level', 'Mid-Senior level', 'Not Applicable', 'Executive', 'Associate', 'Internship', 'Director']
+    functions = ['Engineering and Information Technology', 'Research and Design', 'Design and Product Management',
+                 'Analyst, Information Technology, and Engineering', 'Sales and Business Development', 'Other',
+                 'Research, Analyst, and Information Technology', 'Finance', 'N/A', '']
+    return pd.DataFrame({
+        'Title': [f'Title {i}' for i in range(rows)],
+        'Company': 'Company A',
+        'Location': 'Monterrey',
+        'Remote': 'REMOTE',
+        'SeniorityLevel': [rng.choice(seniority) for _ in range(rows)],
+        'EmploymentType': [rng.choice(['Full-time', 'Contract', 'Part-time']) for _ in range(rows)],
+        'Industries': 'IT Services',
+        'PostedTime': [f'{rng.randint(1, 6)} days ago' for _ in range(rows)],
+        'NumApplicants': [rng.choice(applicants) for _ in range(rows)],
+        'JobFunction': [rng.choice(functions) for _ in range(rows)],
+        'Description': 'Description',
+        'Url': 'https://mx.linkedin.com/jobs/view/4012345678',
+        'JobID': '4012345678',
+    }, index=range(5, 5 + rows))
+
+
+class TestDetailFieldNormalization:
+
+    @pytest.fixture
+    def reference(self):
+        logger = MagicMock()
+        logger.log = MagicMock()
+        return ReferenceDetailCleaner(logger)
+
+    def test_num_applicants_int16(self, cleaner, reference):
+        df = random_job_details(300)
+
+        expected = reference.clean_num_applicants(df.copy())['NumApplicants'].replace('N/A', pd.NA)
+        result = cleaner.clean_num_applicants(df.copy())['NumApplicants']
+
+        assert result.dtype == 'Int16'
+        pd.testing.assert_series_equal(result, expected.astype('Int16'))
+
+    def test_seniority_level(self, cleaner, reference):
+        df = random_job_details(300)
+
+        pd.testing.assert_series_equal(cleaner.clean_seniority_level(df.copy())['SeniorityLevel'],
+                                       reference.clean_seniority_level(df.copy())['SeniorityLevel'])
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_job_functions_match_reference(self, cleaner, reference, seed):
+        df = random_job_details(300, seed)
+
+        expected = reference.split_job_functions(reference.standardize_job_function(df.copy()))
+        standardized = cleaner.standardize_job_function(df.copy())
+        result = cleaner.split_job_functions(standardized.copy())
+
+        pd.testing.assert_series_equal(standardized['JobFunction'],
+                                       reference.standardize_job_function(df.copy())['JobFunction'])
+        pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+        for column in ['JobFunction1', 'JobFunction2', 'JobFunction3']:
+            assert set(result[column].cat.categories) == set(expected[column].cat.categories)
+
+    def test_clean_extracted_job_data_columns(self, cleaner, reference):
+        df = random_job_details(100)
+
+        result = cleaner.clean_extracted_job_data(df.copy())
+        expected = reference.clean_extracted_job_data(df.copy())
+
+        assert result.columns.tolist() == expected.columns.tolist()
+        assert result['NumApplicants'].dtype == 'Int16'
+        assert result['DatePosted'].dtype == 'datetime64[ns]'
@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.near_duplicate_index import NearDuplicateIndex
+from LinkedInWebScraper.rate_limiter import RequestBudget
+from LinkedInWebScraper.replay import FakeOpenAIClient
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+ENRICHMENT_COLUMNS = ['ShortDescription', 'TechStack', 'YoE', 'MinLevelStudies', 'English']
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def description(seed, words=120):
+    rng = random.Random(seed)
+    vocabulary = ['Python', 'SQL', 'models', 'data', 'team', 'pipelines', 'Spark', 'AWS', 'experience', 'years',
+                  'English', 'Bachelor', 'degree', 'dashboards', 'stakeholders', 'Airflow', 'statistics', 'Docker']
+    return ' '.join(rng.choice(vocabulary) + str(rng.randint(0, 50)) for _ in range(words))
+
+
+def jobs(count):
+    return pd.DataFrame({
+        'JobID': [str(4000000000 + position) for position in range(count)],
+        'Description': [description(position) for position in range(count)],
+    })
+
+
+class ConcurrencyTrackingClient(FakeOpenAIClient):
+    """A fake client recording the highest number of requests in flight at the same time."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._tracking_lock = threading.Lock()
+
+    def _create(self, messages, **kwargs):
+        with self._tracking_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super()._create(messages, **kwargs)
+        finally:
+            with self._tracking_lock:
+                self.in_flight -= 1
+
+
+class TestConcurrentEnrichment:
+
+    def test_matches_sequential_results(self, logger):
+        sequential = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(jobs(12))
+        concurrent = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient(latency=0.01)), logger,
+                                             max_in_flight=4).process_job_descriptions(jobs(12))
+
+        pd.testing.assert_frame_equal(concurrent, sequential)
+
+    def test_bounds_requests_in_flight(self, logger):
+        client = ConcurrencyTrackingClient(latency=0.05)
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, max_in_flight=3)
+
+        start = time.perf_counter()
+        processor.process_job_descriptions(jobs(12))
+        elapsed = time.perf_counter() - start
+
+        assert client.calls == 12 and processor.api_calls == 12
+        assert client.max_in_flight == 3
+        # Four waves of three requests instead of twelve round trips
+        assert elapsed < 12 * 0.05
+
+    def test_keeps_index_alignment(self, logger):
+        df_jobs = jobs(6).set_index(pd.Index([10, 3, 7, 1, 8, 5]))
+        result = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient(latency=0.01)), logger,
+                                         max_in_flight=4).process_job_descriptions(df_jobs)
+
+        expected = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(jobs(6))
+        assert result[ENRICHMENT_COLUMNS].values.tolist() == expected[ENRICHMENT_COLUMNS].values.tolist()
+
+    def test_reuses_near_duplicates_of_the_same_batch(self, logger, tmp_path):
+        client = FakeOpenAIClient(latency=0.01)
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger,
+                                            NearDuplicateIndex(str(tmp_path / 'near.sqlite')), max_in_flight=4)
+        df_jobs = jobs(3)
+        df_jobs.loc[3] = ['4000000003', ' '.join(description(0).split()[:-4] + ['Based in Monterrey.'])]
+
+        result = processor.process_job_descriptions(df_jobs)
+
+        assert client.calls == 3
+        assert processor.stats()['api_calls_saved'] == 1
+        assert result.loc[3, ENRICHMENT_COLUMNS].tolist() == result.loc[0, ENRICHMENT_COLUMNS].tolist()
+
+    def test_propagates_api_errors(self, logger):
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient(error_rate=1.0)), logger,
+                                            max_in_flight=4)
+
+        with pytest.raises(Exception):
+            processor.process_job_descriptions(jobs(4))
+
+
+class TestRequestBudget:
+
+    def test_unlimited_budget_never_waits(self):
+        budget = RequestBudget()
+        for _ in range(100):
+            budget.acquire(10000)
+
+        assert budget.waited == 0
+
+    def test_waits_for_the_token_budget(self):
+        budget = RequestBudget(tokens_per_minute=6000)
+        budget.acquire(6000)
+
+        start = time.perf_counter()
+        budget.acquire(30)
+
+        assert time.perf_counter() - start >= 0.25
+        assert budget.waited > 0
+
+    def test_waits_for_the_request_budget(self):
+        budget = RequestBudget(requests_per_minute=600)
+        for _ in range(600):
+            budget.acquire()
+
+        start = time.perf_counter()
+        budget.acquire()
+
+        assert time.perf_counter() - start >= 0.05
+
+    def test_processor_acquires_estimated_tokens(self, logger):
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger,
+                                            max_in_flight=2, requests_per_minute=1000, tokens_per_minute=1000000)
+        processor.budget = MagicMock(wraps=processor.budget)
+
+        processor.process_job_descriptions(jobs(3))
+
+        assert processor.budget.acquire.call_count == 3
+        messages = OpenAIHandler(logger, client=FakeOpenAIClient()).create_messages(description(0))
+        assert processor.budget.acquire.call_args_list[0][0][0] > sum(len(message['content']) for message in messages) // 4
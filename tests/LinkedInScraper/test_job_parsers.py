@@ -0,0 +1,98 @@
+import os
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_parsers import BeautifulSoupJobParser, empty_job_details, get_job_parser
+
+pytest.importorskip('lxml')
+from LinkedInWebScraper.job_parsers import LxmlJobParser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+SEARCH_FIXTURES = ['search_page.html', 'guest_search_results.html']
+POSTING_FIXTURES = ['job_posting_full.html', 'job_posting_bullet_applicants.html', 'job_posting_minimal.html']
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as file:
+        return file.read()
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+@pytest.fixture
+def parsers(logger):
+    return BeautifulSoupJobParser(logger), LxmlJobParser(logger)
+
+
+@pytest.mark.parametrize('name', SEARCH_FIXTURES)
+@pytest.mark.parametrize('as_text', [False, True])
+def test_job_cards_match_bs4(parsers, name, as_text):
+    html_content = read_fixture(name)
+    if as_text:
+        html_content = html_content.decode('utf-8')
+    bs4_parser, lxml_parser = parsers
+
+    expected = bs4_parser.parse_job_cards(html_content)
+
+    assert lxml_parser.parse_job_cards(html_content) == expected
+    assert any(card['Url'] != 'N/A' for card in expected)
+
+
+@pytest.mark.parametrize('name', SEARCH_FIXTURES + POSTING_FIXTURES)
+def test_total_jobs_match_bs4(parsers, name):
+    bs4_parser, lxml_parser = parsers
+    html_content = read_fixture(name)
+
+    assert lxml_parser.parse_total_jobs(html_content) == bs4_parser.parse_total_jobs(html_content)
+
+
+@pytest.mark.parametrize('name', POSTING_FIXTURES)
+@pytest.mark.parametrize('as_text', [False, True])
+def test_job_details_match_bs4(parsers, name, as_text):
+    html_content = read_fixture(name)
+    if as_text:
+        html_content = html_content.decode('utf-8')
+    bs4_parser, lxml_parser = parsers
+
+    assert lxml_parser.parse_job_details(html_content) == bs4_parser.parse_job_details(html_content)
+
+
+def test_search_page_fields(parsers):
+    _, lxml_parser = parsers
+    html_content = read_fixture('search_page.html')
+
+    cards = [card for card in lxml_parser.parse_job_cards(html_content) if card['Url'] != 'N/A']
+
+    assert lxml_parser.parse_total_jobs(html_content) == 1234
+    assert len(cards) == 6
+    assert cards[1]['Title'] == 'Sr. Machine Learning Engineer & MLOps'
+    assert cards[3]['Location'] == 'N/A' and cards[3]['ListedDate'] is None
+    assert cards[4]['Title'] == 'Científico de Datos Sr. – IA Generativa'
+
+
+def test_job_details_fields(parsers):
+    _, lxml_parser = parsers
+
+    details = lxml_parser.parse_job_details(read_fixture('job_posting_bullet_applicants.html'))
+
+    assert details['NumApplicants'] == 'Be among the first 25 applicants'
+    assert details['JobFunction'] == 'Research and Design'
+    assert details['EmploymentType'] == 'N/A'
+
+
+def test_empty_content(parsers):
+    for parser in parsers:
+        assert parser.parse_job_cards(b'') == []
+        assert parser.parse_total_jobs(b'') == 0
+        assert parser.parse_job_details(b'') == empty_job_details()
+
+
+def test_get_job_parser(logger):
+    assert isinstance(get_job_parser('bs4', logger), BeautifulSoupJobParser)
+    assert isinstance(get_job_parser('lxml', logger), LxmlJobParser)
+    with pytest.raises(ValueError):
+        get_job_parser('selectolax', logger)
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_schema import JOB_SCHEMA, enforce_schema, memory_report, text_dtype
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import FakeOpenAIClient, ReplayServer, build_synthetic_archive
+from LinkedInWebScraper.utils import HttpFetcher
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def enriched_jobs(rows=300):
+    return pd.DataFrame({
+        'Title': [f'Data Scientist {i % 7}' for i in range(rows)],
+        'Company': [f'Company {i % 3}' for i in range(rows)],
+        'Remote': 'REMOTE',
+        'JobID': [str(4000000000 + i) for i in range(rows)],
+        'Industries': 'IT Services and IT Consulting',
+        'NumApplicants': [25, 'N/A', 200] * (rows // 3),
+        'DatePosted': [pd.Timestamp('2024-05-01'), 'N/A', pd.Timestamp('2024-04-20')] * (rows // 3),
+        'Description': 'Full posting text ' * 20,
+        'MinYoE': [3, 'N/A', 300] * (rows // 3),
+        'English': [True, 'N/A', False] * (rows // 3),
+        'Cloud': [1, 0, 0] * (rows // 3),
+        'Notes': 'not in the schema',
+    })
+
+
+class TestEnforceSchema:
+
+    def test_compact_dtypes(self):
+        result = enforce_schema(enriched_jobs(), one_hot_columns=['Cloud'])
+
+        assert isinstance(result['Company'].dtype, pd.CategoricalDtype)
+        assert isinstance(result['Remote'].dtype, pd.CategoricalDtype)
+        assert result['Title'].dtype == text_dtype()
+        assert result['NumApplicants'].dtype == 'Int16'
+        assert result['DatePosted'].dtype == 'datetime64[ns]'
+        assert result['English'].dtype == 'boolean'
+        assert result['Cloud'].dtype == 'uint8'
+        assert result['Notes'].dtype == enriched_jobs()['Notes'].dtype
+
+    def test_sentinels_become_missing(self):
+        result = enforce_schema(enriched_jobs(3))
+
+        assert result['NumApplicants'].tolist()[::2] == [25, 200] and result['NumApplicants'].isna()[1]
+        assert result['English'].tolist()[::2] == [True, False] and result['English'].isna()[1]
+        assert result['DatePosted'].isna().tolist() == [False, True, False]
+        # 300 does not fit the Int8 MinYoE column
+        assert result['MinYoE'].isna().tolist() == [False, True, True]
+
+    def test_idempotent_and_keeps_columns(self):
+        once = enforce_schema(enriched_jobs())
+        twice = enforce_schema(once)
+
+        assert once.columns.tolist() == enriched_jobs().columns.tolist()
+        pd.testing.assert_frame_equal(once, twice)
+
+    def test_memory_report(self):
+        before = enriched_jobs()
+        report = memory_report(before, enforce_schema(before, one_hot_columns=['Cloud']))
+
+        assert report.index.tolist() == before.columns.tolist() + ['Total']
+        assert report.loc['Total', 'bytes_after'] < report.loc['Total', 'bytes_before']
+        assert report.loc['Company', 'dtype_after'] == 'category'
+        assert report.loc['Total', 'bytes_before'] == report['bytes_before'].iloc[:-1].sum()
+
+    def test_schema_covers_pipeline_output_columns(self):
+        assert {'Title', 'Company', 'Location', 'DatePosted', 'NumApplicants', 'English'} <= set(JOB_SCHEMA)
+
+
+def test_pipeline_output_follows_schema(logger):
+    archive = build_synthetic_archive(num_jobs=10, remote_types=('REMOTE',))
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                  base_url=server.url, memory_report=True)
+        jobs = LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=FakeOpenAIClient(archive)).run()
+
+    assert not jobs.empty
+    assert isinstance(jobs['Company'].dtype, pd.CategoricalDtype)
+    assert jobs['NumApplicants'].dtype == 'Int16'
+    assert jobs['English'].dtype == 'boolean'
+    assert jobs['Description'].dtype == text_dtype()
+    logged = [call.args[0] for call in logger.log.info.call_args_list]
+    assert any(message.startswith('Memory after final processing') for message in logged)
@@ -0,0 +1,273 @@
+import asyncio
+import time
+import pytest
+import pandas as pd
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlparse, parse_qs
+from LinkedInWebScraper.job_scraper import JobScraper
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.search_watermark import SearchWatermarkStore
+
+
+def job_card(job_id, listed_date='2024-09-15'):
+    """Build a minimal LinkedIn search card for the given job id."""
+    return f"""
+    <li>
+      <div class="base-card">
+        <a class="base-card__full-link" href="https://mx.linkedin.com/jobs/view/data-scientist-{job_id}?position=1"></a>
+        <div class="base-search-card__info">
+          <h3 class="base-search-card__title"> Data Scientist {job_id} </h3>
+          <h4 class="base-search-card__subtitle"> Company {job_id} </h4>
+          <div class="base-search-card__metadata">
+            <span class="job-search-card__location"> Monterrey, Nuevo León, Mexico </span>
+            <time class="job-search-card__listdate" datetime="{listed_date}">1 day ago</time>
+          </div>
+        </div>
+      </div>
+    </li>"""
+
+
+def fake_page(start):
+    """Build a search page holding ten cards whose ids depend on the page offset."""
+    return ''.join(job_card(4000000000 + start + i) for i in range(10)).encode()
+
+
+def fake_fetcher(fetch):
+    """Build an HttpFetcher stand-in that answers with the given fetch function."""
+    fetcher = MagicMock()
+    fetcher.fetch_until_success.side_effect = fetch
+    return fetcher
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def fake_fetch(url, logger=None, cache=None):
+    """Return the page for the `start` offset of a 95 job search, finishing later pages first."""
+    start = int(parse_qs(urlparse(url).query).get('start', ['0'])[0])
+    time.sleep(0.001 * (50 - start // 10))
+    response = MagicMock()
+    response.content = response.text = b'<span class="results-context-header__job-count">95</span>' + fake_page(start)
+    return response
+
+
+class TestScrapeJobs:
+
+    def scrape(self, logger, **options):
+        config = JobScraperConfig('Data Scientist', 'Monterrey', remote='REMOTE', **options)
+        scraper = JobScraper(config, logger, fetcher=fake_fetcher(fake_fetch))
+        with patch.object(JobScraper, 'fetch_total_jobs') as mock_total:
+            df = scraper.scrape_jobs()
+        mock_total.assert_not_called()
+        return df
+
+    def test_async_pages_match_sequential(self, logger):
+        """The async page mode returns the same DataFrame, in page order, as the sequential mode."""
+        sequential = self.scrape(logger)
+        concurrent = self.scrape(logger, async_pages=True, max_pages_in_flight=4)
+
+        assert len(sequential) == 100
+        pd.testing.assert_frame_equal(sequential, concurrent)
+
+    def test_each_page_is_fetched_once(self, logger):
+        """The total is read from the first page, so no separate count request is made."""
+        config = JobScraperConfig('Data Scientist', 'Monterrey', remote='REMOTE')
+        fetcher = fake_fetcher(fake_fetch)
+        JobScraper(config, logger, fetcher=fetcher).scrape_jobs()
+
+        urls = [call.args[0] for call in fetcher.fetch_until_success.call_args_list]
+        assert len(urls) == len(set(urls)) == 10
+        assert all('start=' in url for url in urls)
+
+    def test_async_pages_respect_in_flight_limit(self, logger):
+        """No more than max_pages_in_flight pages are fetched at the same time."""
+        in_flight = []
+        peak = []
+
+        def tracking_fetch(url, logger=None, cache=None):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            try:
+                return fake_fetch(url, logger)
+            finally:
+                in_flight.remove(url)
+
+        config = JobScraperConfig('Data Scientist', 'Monterrey', async_pages=True, max_pages_in_flight=3)
+        scraper = JobScraper(config, logger, fetcher=fake_fetcher(tracking_fetch))
+        scraper.scrape_jobs()
+
+        assert max(peak) <= 3
+
+    def test_async_pages_inside_running_event_loop(self, logger):
+        """The synchronous API keeps working when called from a running event loop, as in Jupyter."""
+        async def scrape_in_loop():
+            return self.scrape(logger, async_pages=True, max_pages_in_flight=4)
+
+        assert len(asyncio.run(scrape_in_loop())) == 100
+
+
+def detail_page(job_id):
+    """Build a minimal job posting page for the given job id."""
+    return f"""
+    <section>
+      <span class="posted-time-ago__text"> {job_id % 7 + 1} days ago </span>
+      <figcaption class="num-applicants__caption"> {job_id % 90} applicants </figcaption>
+      <div class="show-more-less-html__markup"><p>Posting {job_id}</p><ul><li>Python</li><li>SQL</li></ul></div>
+      <ul class="description__job-criteria-list">
+        <li class="description__job-criteria-item"><h3>Seniority level</h3><span class="description__job-criteria-text"> Entry level </span></li>
+        <li class="description__job-criteria-item"><h3>Employment type</h3><span class="description__job-criteria-text"> Full-time </span></li>
+        <li class="description__job-criteria-item"><h3>Job function</h3><span class="description__job-criteria-text"> Engineering and Information Technology </span></li>
+        <li class="description__job-criteria-item"><h3>Industries</h3><span class="description__job-criteria-text"> Software Development </span></li>
+      </ul>
+    </section>""".encode()
+
+
+def fake_detail_fetch(url, logger=None, cache=None):
+    """Return the posting page for the JobID at the end of the URL, finishing out of order."""
+    job_id = int(url.rsplit('/', 1)[-1])
+    time.sleep(0.001 * (job_id % 5))
+    response = MagicMock()
+    response.content = detail_page(job_id)
+    return response
+
+
+class TestFetchJobDetails:
+
+    @pytest.fixture
+    def df_jobs(self):
+        job_ids = [str(4000000000 + i) for i in range(30)]
+        return pd.DataFrame({'JobID': job_ids, 'Title': [f'Data Scientist {i}' for i in job_ids]}, index=range(100, 130))
+
+    def fetch_details(self, logger, df_jobs, fetch=fake_detail_fetch, **options):
+        scraper = JobScraper(JobScraperConfig('Data Scientist', 'Monterrey', **options), logger, fetcher=fake_fetcher(fetch))
+        return scraper.fetch_job_details(df_jobs.copy())
+
+    def test_concurrent_details_match_sequential(self, logger, df_jobs):
+        """Worker-pool fetching keeps every extracted row aligned with its JobID."""
+        sequential = self.fetch_details(logger, df_jobs)
+        concurrent = self.fetch_details(logger, df_jobs, detail_workers=8, max_requests_per_host=4)
+
+        pd.testing.assert_frame_equal(sequential, concurrent)
+        assert concurrent.loc[0, 'Description'] == 'Posting 4000000000 Python SQL'
+        assert concurrent.loc[0, 'SeniorityLevel'] == 'Entry level'
+
+    def test_max_requests_per_host(self, logger, df_jobs):
+        """Detail requests to the same host never exceed max_requests_per_host."""
+        in_flight = []
+        peak = []
+
+        def tracking_fetch(url, logger=None, cache=None):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            try:
+                return fake_detail_fetch(url, logger)
+            finally:
+                in_flight.remove(url)
+
+        self.fetch_details(logger, df_jobs, fetch=tracking_fetch, detail_workers=8, max_requests_per_host=2)
+
+        assert max(peak) <= 2
+
+    def test_failed_fetch_yields_na_row(self, logger, df_jobs):
+        """A posting that cannot be fetched is kept with 'N/A' details."""
+        result = self.fetch_details(logger, df_jobs.head(3), fetch=lambda url, logger=None, cache=None: None, detail_workers=2)
+
+        assert result.shape[0] == 3
+        assert (result['Description'] == 'N/A').all()
+
+
+class TestWatermarkPagination:
+
+    def scrape(self, logger, watermark_file, listed_date=lambda start: '2024-09-15'):
+        requested = []
+
+        def fetch(url, logger=None, cache=None):
+            start = int(parse_qs(urlparse(url).query).get('start', ['0'])[0])
+            requested.append(start)
+            response = MagicMock()
+            cards = ''.join(job_card(4000000000 + start + i, listed_date(start)) for i in range(10))
+            response.content = response.text = f"""
+                <span class="results-context-header__job-count">95</span><ul>{cards}</ul>""".encode()
+            return response
+
+        config = JobScraperConfig('Data Scientist', 'Monterrey', remote='REMOTE', watermark_file=watermark_file)
+        scraper = JobScraper(config, logger, fetcher=fake_fetcher(fetch))
+        with patch.object(JobScraper, 'fetch_total_jobs') as mock_total:
+            df = scraper.scrape_jobs()
+        mock_total.assert_not_called()
+        return scraper, df, requested
+
+    def test_stops_at_first_page_of_known_jobs(self, logger, tmp_path):
+        """Pagination stops once a page holds only JobIDs from the watermark."""
+        watermark_file = str(tmp_path / 'watermarks.json')
+        scraper, _, _ = self.scrape(logger, watermark_file)
+        SearchWatermarkStore(watermark_file).update(scraper.generate_main_url(),
+                                                    [str(4000000020 + i) for i in range(10)], datetime(2024, 9, 1))
+
+        _, df, requested = self.scrape(logger, watermark_file)
+
+        assert requested == [0, 10, 20]
+        assert len(df) == 30
+
+    def test_stops_at_first_page_of_older_postings(self, logger, tmp_path):
+        """Pagination stops once every card on a page was listed before the last run."""
+        watermark_file = str(tmp_path / 'watermarks.json')
+        scraper, _, _ = self.scrape(logger, watermark_file)
+        SearchWatermarkStore(watermark_file).update(scraper.generate_main_url(), [], datetime(2024, 9, 15, 8))
+
+        _, _, requested = self.scrape(logger, watermark_file,
+                                      listed_date=lambda start: '2024-09-15' if start < 30 else '2024-09-10')
+
+        assert requested == [0, 10, 20, 30]
+
+    def test_update_watermark_records_seen_job_ids(self, logger, tmp_path):
+        """A successful run stores its JobIDs and start time for the search."""
+        watermark_file = str(tmp_path / 'watermarks.json')
+        scraper, _, requested = self.scrape(logger, watermark_file)
+        scraper.update_watermark()
+
+        watermark = SearchWatermarkStore(watermark_file).get(scraper.generate_main_url())
+        assert requested == list(range(0, 100, 10))
+        assert watermark.is_known('4000000095')
+        assert watermark.last_run == scraper.watermark_run_time
+
+
+class TestIterJobs:
+
+    def fetch_with_total(self, total_jobs, requested):
+        def fetch(url, logger=None, cache=None):
+            start = int(parse_qs(urlparse(url).query).get('start', ['0'])[0])
+            requested.append(start)
+            response = MagicMock()
+            response.content = response.text = (
+                f'<span class="results-context-header__job-count">{total_jobs}</span>'.encode() + fake_page(start))
+            return response
+        return fetch
+
+    def test_batches_match_scrape_jobs(self, logger):
+        """The streamed batches hold the same jobs, in order, as a full scrape."""
+        config = JobScraperConfig('Data Scientist', 'Monterrey', remote='REMOTE', async_pages=True, max_pages_in_flight=3)
+        scraper = JobScraper(config, logger, fetcher=fake_fetcher(self.fetch_with_total(95, [])))
+
+        batches = list(scraper.iter_jobs(batch_size=15))
+
+        assert [len(batch) for batch in batches] == [15] * 6 + [10]
+        expected = TestScrapeJobs().scrape(logger).reset_index(drop=True)
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+        assert scraper.jobs == []
+
+    def test_pages_are_fetched_lazily(self, logger):
+        """Only the pages needed for the consumed batches are requested."""
+        requested = []
+        config = JobScraperConfig('Data Scientist', 'Monterrey', remote='REMOTE')
+        scraper = JobScraper(config, logger, fetcher=fake_fetcher(self.fetch_with_total(95, requested)))
+
+        batches = scraper.iter_jobs(batch_size=10)
+        next(batches)
+
+        assert requested == [0]
@@ -0,0 +1,69 @@
+import random
+import re
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_title_classifier import JobTitleClassifier, build_keyword_pattern
+from Utils.constants import DATA_SCIENCE_KEYWORDS
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def reference_is_related(title, keywords):
+    """The original per-keyword search of JobTitleClassifier._classify_single_title, with escaped keywords."""
+    return any(re.search(rf'\b{re.escape(keyword)}\b', title.lower()) for keyword in keywords)
+
+
+def random_titles(rows, seed=0):
+    rng = random.Random(seed)
+    words = ['Data', 'Scientist', 'Senior', 'ML', 'Engineer', 'HTML', 'Power BI', 'BIology', 'Analyst', 'AI',
+             'Retail', 'Sales', 'Dataset', 'C++', 'Statistics', 'Deep Learning', 'Mobile', 'Nail']
+    return pd.Series([' '.join(rng.sample(words, rng.randint(1, 4))) for _ in range(rows)], index=range(5, 5 + rows))
+
+
+class TestJobTitleClassifier:
+
+    @pytest.mark.parametrize('memoize', [True, False])
+    def test_matches_per_keyword_search(self, logger, memoize):
+        titles = random_titles(500)
+        classifier = JobTitleClassifier(logger, 'Data Scientist', DATA_SCIENCE_KEYWORDS, memoize=memoize)
+
+        result = classifier.classify_titles(titles)
+
+        assert result.tolist() == [reference_is_related(title, classifier.keywords) for title in titles]
+        assert result.index.equals(titles.index)
+
+    def test_classify_title_filters_rows(self, logger):
+        df = pd.DataFrame({'Title': ['Data Scientist', 'Sales Manager', 'ML Engineer', 'Data Scientist']})
+
+        result = JobTitleClassifier(logger, 'Data Scientist', ['Data', 'ML']).classify_title(df)
+
+        assert result['Title'].tolist() == ['Data Scientist', 'ML Engineer', 'Data Scientist']
+        assert list(result.columns) == ['Title']
+
+    def test_keywords_are_escaped(self, logger):
+        classifier = JobTitleClassifier(logger, 'Developer', ['C++', 'node.js', 'data'], memoize=False)
+
+        assert classifier._classify_single_title('Senior C++ Developer') == 0
+        assert classifier._classify_single_title('Node.js Developer') == 1
+        assert classifier._classify_single_title('Nodexjs Developer') == 0
+        assert classifier._classify_single_title('Database Administrator') == 0
+
+    def test_memo_is_shared_between_classifiers(self, logger):
+        keywords = ['data', 'analytics']
+        titles = pd.Series(['Data Analyst', 'Chef'])
+        JobTitleClassifier(logger, 'Data Analyst', keywords).classify_titles(titles)
+
+        classifier = JobTitleClassifier(logger, 'Data Analyst', keywords)
+        classifier.pattern = MagicMock(pattern=classifier.pattern.pattern)
+
+        assert classifier.classify_titles(titles).tolist() == [True, False]
+
+    def test_trie_pattern(self):
+        assert build_keyword_pattern(['data', 'data science', 'ml']) == r'\b(?:data(?:\ science)?|ml)\b'
+        assert not re.search(build_keyword_pattern([]), 'anything')
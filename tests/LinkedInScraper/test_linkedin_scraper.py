@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+@pytest.fixture
+def cleaned_jobs():
+    return pd.DataFrame({
+        'Title': ['Data Scientist', 'ML Engineer', 'Data Analyst'],
+        'Company': ['Company A', 'Company B', 'Company C'],
+        'Location': ['Monterrey', 'Monterrey', 'Monterrey'],
+        'JobID': ['4000000001', '4000000002', '4000000003']
+    })
+
+
+class TestIncrementalMode:
+
+    def test_known_jobs_skip_detail_fetch(self, logger, cleaned_jobs, tmp_path):
+        """Jobs already stored in the known jobs file never reach fetch_job_details."""
+        known_jobs_file = tmp_path / 'known.csv'
+        cleaned_jobs.head(2).to_csv(known_jobs_file, index=False)
+        config = JobScraperConfig('Data Scientist', 'Monterrey', incremental=True, known_jobs_file=str(known_jobs_file))
+        scraper = LinkedInJobScraper(logger, config)
+
+        with patch.object(scraper, 'scrape_jobs', return_value=cleaned_jobs), \
+             patch.object(scraper, 'clean_jobs', return_value=cleaned_jobs), \
+             patch.object(scraper, 'fetch_job_details', side_effect=lambda df: df) as mock_fetch, \
+             patch.object(scraper, 'clean_job_details', side_effect=lambda df: df):
+            scraper.run()
+
+        assert mock_fetch.call_args[0][0]['JobID'].tolist() == ['4000000003']
+        assert scraper.skipped_known_jobs == 2
+
+
+class TestStream:
+
+    def test_stream_processes_batches_and_drops_duplicates(self, logger, cleaned_jobs):
+        """Each batch goes through the pipeline on its own, and postings seen in earlier batches are dropped."""
+        scraped_batches = [
+            pd.DataFrame({'Title': ['Data Scientist', 'ML Engineer'], 'Company': ['Company A', 'Company B'],
+                          'Location': ['Monterrey', 'Monterrey'], 'Remote': ['REMOTE', 'REMOTE'],
+                          'Url': ['https://mx.linkedin.com/jobs/view/ds-4000000001?position=1',
+                                  'https://mx.linkedin.com/jobs/view/mle-4000000002?position=2']}),
+            pd.DataFrame({'Title': ['Data Scientist', 'Data Analyst'], 'Company': ['Company A', 'Company C'],
+                          'Location': ['Monterrey', 'Monterrey'], 'Remote': ['REMOTE', 'REMOTE'],
+                          'Url': ['https://mx.linkedin.com/jobs/view/ds-4000000001?position=3',
+                                  'https://mx.linkedin.com/jobs/view/da-4000000003?position=4']}),
+        ]
+        scraper = LinkedInJobScraper(logger, JobScraperConfig('Data Scientist', 'Monterrey'))
+
+        with patch.object(scraper.job_scraper, 'iter_jobs', return_value=iter(scraped_batches)), \
+             patch.object(scraper, 'fetch_job_details', side_effect=lambda df: df) as mock_fetch, \
+             patch.object(scraper.job_scraper, 'update_watermark') as mock_update:
+            batches = list(scraper.stream(batch_size=2))
+
+        assert [batch['JobID'].tolist() for batch in batches] == [['4000000001', '4000000002'], ['4000000003']]
+        assert mock_fetch.call_count == 2
+        mock_update.assert_called_once()
+
+    def test_batches_share_the_run_reference_time(self, logger, cleaned_jobs):
+        """Every batch of a run converts its posted times against the same run-start timestamp."""
+        scraped_batches = [
+            pd.DataFrame({'Title': [title], 'Company': [company], 'Location': ['Monterrey'], 'Remote': ['REMOTE'],
+                          'Url': [f'https://mx.linkedin.com/jobs/view/job-{job_id}?position=1']})
+            for title, company, job_id in zip(cleaned_jobs['Title'], cleaned_jobs['Company'], cleaned_jobs['JobID'])
+        ]
+        scraper = LinkedInJobScraper(logger, JobScraperConfig('Data Scientist', 'Monterrey'))
+
+        with patch.object(scraper.job_scraper, 'iter_jobs', return_value=iter(scraped_batches)), \
+             patch.object(scraper, 'fetch_job_details', side_effect=lambda df: df), \
+             patch.object(scraper.job_data_cleaner, 'clean_extracted_job_data',
+                          side_effect=lambda df, reference_time: df) as mock_clean, \
+             patch.object(scraper.job_scraper, 'update_watermark'):
+            list(scraper.stream(batch_size=1))
+
+        reference_times = {call.args[1] for call in mock_clean.call_args_list}
+        assert mock_clean.call_count == 3
+        assert reference_times == {scraper.run_start_time}
@@ -0,0 +1,74 @@
+import json
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner
+from LinkedInWebScraper.location_resolver import LocationResolver, fold_location
+from Utils.constants import LOCATION_MAPPING
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def test_fold_location():
+    assert fold_location('  San Nicolás de  Los Garza ') == 'san nicolas de los garza'
+    assert fold_location('ÁLVARO OBREGÓN') == 'alvaro obregon'
+
+
+class TestLocationResolver:
+
+    def test_folded_exact_matches(self):
+        resolver = LocationResolver(LOCATION_MAPPING, fuzzy_cutoff=None)
+
+        assert resolver.resolve('San Nicolas de los Garza, Nuevo León, Mexico') == 'Monterrey Metropolitan Area'
+        assert resolver.resolve('MONTERREY') == 'Monterrey Metropolitan Area'
+        assert resolver.resolve('Coyoacan, Mexico City') == 'Mexico City Metropolitan Area'
+        assert resolver.resolve('Monterey') is None
+
+    def test_fuzzy_fallback(self):
+        resolver = LocationResolver(LOCATION_MAPPING)
+
+        assert resolver.resolve('Monterey, Nuevo León') == 'Monterrey Metropolitan Area'
+        assert resolver.resolve('Tlalnepantla de Baz') is None
+        assert resolver.resolve('Austin, Texas') is None
+        assert resolver.resolve('') is None
+
+    def test_fuzzy_matches_are_persisted(self, tmp_path):
+        cache_file = str(tmp_path / 'locations.json')
+        resolver = LocationResolver(LOCATION_MAPPING, cache_file=cache_file)
+        resolver.resolve_all(['Guadalajra, Jalisco', 'Austin', 'Monterrey'])
+        resolver.save()
+
+        with open(cache_file, encoding='utf-8') as file:
+            assert json.load(file)['matches'] == {'guadalajra': 'Guadalajara', 'austin': None}
+
+        with patch('difflib.get_close_matches') as get_close_matches:
+            cached = LocationResolver(LOCATION_MAPPING, cache_file=cache_file)
+            assert cached.resolve_all(['Guadalajra', 'Austin']) == ['Guadalajara', None]
+        get_close_matches.assert_not_called()
+
+    def test_cache_is_discarded_when_the_mapping_changes(self, tmp_path):
+        cache_file = str(tmp_path / 'locations.json')
+        resolver = LocationResolver({'Guadalajara': 'Guadalajara'}, cache_file=cache_file)
+        resolver.resolve('Austin')
+        resolver.save()
+
+        changed = LocationResolver({'Guadalajara': 'Guadalajara', 'Austin': 'Texas'}, cache_file=cache_file)
+
+        assert changed.resolve('Austin') == 'Texas'
+        assert changed.resolve('Austn') == 'Texas'
+
+
+def test_cleaner_uses_the_given_mapping(logger, tmp_path):
+    cleaner = JobDataCleaner(logger, location_cache_file=str(tmp_path / 'locations.json'))
+    df = pd.DataFrame({'Location': ['Bogotá, Colombia', 'bogota', 'Medellin, Antioquia', 'Monterrey, Nuevo León']})
+
+    result = cleaner.process_location_data(df, {'Bogotá': 'Bogotá D.C.', 'Medellín': 'Medellín'})
+
+    assert result['Location'].tolist() == ['Bogotá D.C.', 'Bogotá D.C.', 'Medellín']
+    with open(tmp_path / 'locations.json', encoding='utf-8') as file:
+        assert json.load(file)['matches'] == {'monterrey': None}
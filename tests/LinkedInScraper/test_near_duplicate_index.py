@@ -0,0 +1,117 @@
+import random
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.near_duplicate_index import NearDuplicateIndex
+from LinkedInWebScraper.replay import FakeOpenAIClient
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def description(seed, words=300):
+    rng = random.Random(seed)
+    vocabulary = ['Python', 'SQL', 'models', 'data', 'team', 'pipelines', 'Spark', 'AWS', 'experience', 'years',
+                  'English', 'Bachelor', 'degree', 'dashboards', 'stakeholders', 'Airflow', 'statistics', 'Docker']
+    return ' '.join(rng.choice(vocabulary) + str(rng.randint(0, 50)) for _ in range(words))
+
+
+def repost(text, city='Guadalajara'):
+    """The same posting with the location line and a few words changed."""
+    words = text.split()
+    return ' '.join(words[:-4] + [f'Based in {city}.'])
+
+
+class TestNearDuplicateIndex:
+
+    def test_finds_reposts_only(self, tmp_path):
+        index = NearDuplicateIndex(str(tmp_path / 'near.sqlite'))
+        index.add('4000000001', description(1), {'YoE': '3+ years'})
+
+        enrichment, job_id, similarity = index.find(repost(description(1)))
+
+        assert enrichment == {'YoE': '3+ years'} and job_id == '4000000001'
+        assert similarity >= 0.9
+        assert index.find(description(2)) is None
+
+    def test_short_texts_are_ignored(self, tmp_path):
+        index = NearDuplicateIndex(str(tmp_path / 'near.sqlite'))
+        index.add('4000000001', 'N/A', {'YoE': 'N/A'})
+
+        assert len(index) == 0
+        assert index.find('N/A') is None
+
+    def test_persists_across_runs(self, tmp_path):
+        path = str(tmp_path / 'near.sqlite')
+        NearDuplicateIndex(path).add('4000000001', description(1), {'YoE': '3+ years'})
+
+        assert NearDuplicateIndex(path).find(description(1))[0] == {'YoE': '3+ years'}
+
+    def test_similarity_estimate(self, tmp_path):
+        index = NearDuplicateIndex(str(tmp_path / 'near.sqlite'), num_perm=256, bands=32)
+        words = description(3, words=400).split()
+        half = ' '.join(words[:200] + description(4, words=200).split())
+
+        exact = index.shingles(' '.join(words)), index.shingles(half)
+        jaccard = len(set(exact[0]) & set(exact[1])) / len(set(exact[0]) | set(exact[1]))
+        estimate = (index.signature(' '.join(words)) == index.signature(half)).mean()
+
+        assert abs(estimate - jaccard) < 0.1
+
+    def test_adding_again_replaces_the_entry(self, tmp_path):
+        index = NearDuplicateIndex(str(tmp_path / 'near.sqlite'))
+        for _ in range(3):
+            index.add('4000000001', description(1), {'YoE': '3+ years'})
+        index.add('4000000001', description(2), {'YoE': '5+ years'})
+        index.add('4000000002', description(2), {'YoE': '6+ years'})
+
+        assert len(index) == 1
+        assert index._connection.execute("SELECT COUNT(*) FROM bands").fetchone()[0] == index.bands
+        assert index.find(description(2))[:2] == ({'YoE': '6+ years'}, '4000000002')
+        assert index.find(description(1)) is None
+
+    def test_expired_entries_are_not_reused(self, tmp_path):
+        path = str(tmp_path / 'near.sqlite')
+        index = NearDuplicateIndex(path, max_age_days=30)
+        index.add('4000000001', description(1), {'YoE': '3+ years'})
+        index.add('4000000002', description(2), {'YoE': '5+ years'})
+        index._connection.execute("UPDATE postings SET stored_at = stored_at - 31 * 86400 WHERE job_id = '4000000001'")
+        index._connection.commit()
+
+        assert index.find(description(1)) is None
+        assert NearDuplicateIndex(path, max_age_days=30).purge_expired() == 0
+        assert len(index) == 1
+        assert index._connection.execute("SELECT COUNT(*) FROM bands").fetchone()[0] == index.bands
+
+    def test_bands_must_divide_num_perm(self, tmp_path):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(str(tmp_path / 'near.sqlite'), num_perm=100, bands=16)
+
+
+def test_processor_reuses_enrichment_of_reposts(logger, tmp_path):
+    client = FakeOpenAIClient()
+    index = NearDuplicateIndex(str(tmp_path / 'near.sqlite'))
+    processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, index)
+    df_jobs = pd.DataFrame({
+        'JobID': ['4000000001', '4000000002', '4000000003', '4000000004'],
+        'Description': [description(1), description(2), repost(description(1)), repost(description(2), 'Monterrey')],
+    })
+
+    result = processor.process_job_descriptions(df_jobs)
+
+    assert client.calls == 2
+    assert processor.stats() == {'api_calls': 2, 'api_calls_saved': 2, 'saved_rate': 0.5}
+    enrichment_columns = ['ShortDescription', 'TechStack', 'YoE', 'MinLevelStudies', 'English']
+    assert result.loc[2, enrichment_columns].tolist() == result.loc[0, enrichment_columns].tolist()
+    assert result.loc[3, enrichment_columns].tolist() == result.loc[1, enrichment_columns].tolist()
+
+    # A later run finds the postings enriched by this one
+    JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, NearDuplicateIndex(str(tmp_path / 'near.sqlite'))) \
+        .process_job_descriptions(df_jobs.head(2).copy())
+    assert client.calls == 2
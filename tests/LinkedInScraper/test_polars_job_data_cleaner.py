@@ -0,0 +1,126 @@
+import random
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_data_cleaner import JobDataCleaner, get_job_data_cleaner
+from Utils.constants import LOCATION_MAPPING, TECH_STACK_CATEGORIES
+
+pl = pytest.importorskip('polars')
+
+from LinkedInWebScraper.polars_job_data_cleaner import PolarsJobDataCleaner
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def scraped_jobs(rows, seed=0):
+    """Scraped job cards with mapped, misspelled and unmapped locations, malformed URLs and duplicates."""
+    rng = random.Random(seed)
+    cities = list(LOCATION_MAPPING) + ['Austin', 'monterey', 'Zapopan ', 'Ciudad de México', '']
+    suffixes = ['?position=1&pageNum=0', '?position=12', '', '?refId=abc']
+    ids = [str(4000000000 + rng.randint(0, rows)) for _ in range(5)] + ['401234567', 'abcdefghij', '４０１２３４５６７８']
+    return pd.DataFrame({
+        'Location': [f"{rng.choice(cities)}{rng.choice(['', ', Nuevo León, Mexico', ', Jalisco'])}" for _ in range(rows)],
+        'Title': [f'Data Scientist {rng.randint(0, 30)}' for _ in range(rows)],
+        'Company': [f'Company {rng.randint(0, 10)}' for _ in range(rows)],
+        'Url': [f'https://mx.linkedin.com/jobs/view/job-{rng.choice(ids)}{rng.choice(suffixes)}' for _ in range(rows)],
+        'Remote': 'REMOTE',
+    })
+
+
+def job_details(rows, seed=0):
+    """Job cards with the detail field texts LinkedIn shows."""
+    rng = random.Random(seed)
+    applicants = ['Be among the first 25 applicants', 'Over 200 applicants', '37 applicants', 'N/A', '99999 applicants']
+    seniority = ['Entry level', 'Mid-Senior level', 'Not Applicable', 'Executive', 'Associate', 'Director']
+    functions = ['Engineering and Information Technology', 'Research and Design', 'Design and Product Management',
+                 'Analyst, Information Technology, and Engineering', 'Other', 'N/A', '',
+                 'Research, Analyst, Sales, and Information Technology']
+    posted = ['2 hours ago', '3 days ago', '1 week ago', 'Reposted 2 weeks ago', '1 month ago', 'N/A', '30 minutes ago']
+    return pd.DataFrame({
+        'Title': [f'Title {i}' for i in range(rows)],
+        'Company': 'Company A',
+        'Location': 'Monterrey Metropolitan Area',
+        'Remote': 'REMOTE',
+        'SeniorityLevel': [rng.choice(seniority) for _ in range(rows)],
+        'EmploymentType': [rng.choice(['Full-time', 'Contract', 'Part-time']) for _ in range(rows)],
+        'Industries': 'IT Services',
+        'PostedTime': [rng.choice(posted) for _ in range(rows)],
+        'NumApplicants': [rng.choice(applicants) for _ in range(rows)],
+        'JobFunction': [rng.choice(functions) for _ in range(rows)],
+        'Description': 'Description',
+        'Url': 'https://mx.linkedin.com/jobs/view/4012345678',
+        'JobID': '4012345678',
+    }, index=range(3, 3 + rows))
+
+
+def enriched_jobs(rows, seed=0, with_missing_years=True):
+    rng = random.Random(seed)
+    years = ['3+ years', '2-5 years', '10 years', 'At least 1 year or 4 with a degree']
+    if with_missing_years:
+        years += ['N/A', 'Professional software development experience required', 'Several years']
+    studies = ["Bachelor's degree in CS", 'Master in Statistics', 'PhD', 'Student', 'BS or MS', 'N/A', 'Ingeniería']
+    vocabulary = [item for items in TECH_STACK_CATEGORIES.values() for item in items] + ['Excel', 'C++', '']
+    return pd.DataFrame({
+        'YoE': [rng.choice(years) for _ in range(rows)],
+        'MinLevelStudies': [rng.choice(studies) for _ in range(rows)],
+        'TechStack': [', '.join(rng.sample(vocabulary, rng.randint(0, 5))) for _ in range(rows)],
+    }, index=range(7, 7 + rows))
+
+
+class TestPolarsParity:
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_clean_jobs_dataframe(self, logger, seed):
+        df = scraped_jobs(600, seed)
+
+        expected = JobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING)
+        result = PolarsJobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_clean_jobs_dataframe_without_mapping(self, logger):
+        df = scraped_jobs(300)
+
+        expected = JobDataCleaner(logger).clean_jobs_dataframe(df.copy(), None)
+        result = PolarsJobDataCleaner(logger).clean_jobs_dataframe(df.copy(), None)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_clean_extracted_job_data(self, logger, seed):
+        df = job_details(400, seed)
+
+        reference_time = pd.Timestamp('2024-09-15 08:30')
+        expected = JobDataCleaner(logger).clean_extracted_job_data(df.copy(), reference_time)
+        result = PolarsJobDataCleaner(logger).clean_extracted_job_data(df.copy(), reference_time)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('with_missing_years', [True, False])
+    def test_process_enriched_job_data(self, logger, with_missing_years):
+        df = enriched_jobs(400, with_missing_years=with_missing_years)
+
+        expected = JobDataCleaner(logger).process_enriched_job_data(df.copy(), TECH_STACK_CATEGORIES)
+        result = PolarsJobDataCleaner(logger).process_enriched_job_data(df.copy(), TECH_STACK_CATEGORIES)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_empty_dataframe(self, logger):
+        df = scraped_jobs(0)
+
+        expected = JobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING)
+        result = PolarsJobDataCleaner(logger).clean_jobs_dataframe(df.copy(), LOCATION_MAPPING)
+
+        assert result.empty and result.columns.tolist() == expected.columns.tolist()
+
+
+def test_get_job_data_cleaner(logger):
+    assert type(get_job_data_cleaner('pandas', logger)) is JobDataCleaner
+    assert isinstance(get_job_data_cleaner('polars', logger), PolarsJobDataCleaner)
+    with pytest.raises(ValueError):
+        get_job_data_cleaner('spark', logger)
@@ -0,0 +1,76 @@
+import time
+import threading
+import pytest
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter, TokenBucket, parse_retry_after
+
+URL = "https://www.linkedin.com/jobs/search/?keywords=Data%20Scientist"
+HOST = "www.linkedin.com"
+
+
+class TestAdaptiveRateLimiter:
+
+    @pytest.fixture
+    def limiter(self):
+        return AdaptiveRateLimiter(initial_rate=10.0, increase_step=1.0, decrease_factor=0.5,
+                                   initial_concurrency=2, max_concurrency=8)
+
+    def test_additive_increase_on_success(self, limiter):
+        """Each 200 response grows the rate additively."""
+        for _ in range(3):
+            limiter.release(limiter.acquire(URL), 200)
+
+        assert limiter.get_rate(HOST) == pytest.approx(13.0)
+        assert limiter.metrics()[HOST]['concurrency'] > 2
+
+    def test_multiplicative_decrease_on_throttling(self, limiter):
+        """Throttling status codes halve the rate and the concurrency window."""
+        limiter.release(limiter.acquire(URL), 429)
+        limiter.release(limiter.acquire(URL), 999)
+
+        metrics = limiter.metrics()[HOST]
+        assert limiter.get_rate(HOST) == pytest.approx(2.5)
+        assert metrics['concurrency'] == 1.0
+        assert metrics['throttled'] == 2
+
+    def test_retry_after_blocks_host(self, limiter):
+        """A Retry-After header holds every caller back until it expires."""
+        limiter.release(limiter.acquire(URL), 429, retry_after='0.3')
+
+        start = time.monotonic()
+        limiter.release(limiter.acquire(URL), 200)
+        assert time.monotonic() - start >= 0.25
+
+    def test_concurrency_window_bounds_in_flight(self, limiter):
+        """No more requests are in flight than the current concurrency window."""
+        peak = []
+
+        def worker():
+            host = limiter.acquire(URL)
+            peak.append(limiter.metrics()[HOST]['in_flight'])
+            time.sleep(0.01)
+            limiter.release(host, 500)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 2
+
+
+def test_token_bucket_paces_requests():
+    """Once the burst is used, tokens become available at the refill rate."""
+    bucket = TokenBucket(rate=10.0)
+
+    assert all(bucket.consume() for _ in range(10))
+    assert not bucket.consume()
+    assert 0 < bucket.time_until_available() <= 0.1
+
+
+def test_parse_retry_after():
+    """Retry-After accepts seconds, rejects garbage and ignores non-string values."""
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
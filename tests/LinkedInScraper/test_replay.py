@@ -0,0 +1,108 @@
+import pytest
+import requests
+from unittest.mock import MagicMock
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import (FakeOpenAIClient, FakeOpenAIError, FixtureArchive, RecordingFetcher,
+                                       ReplayServer, build_synthetic_archive)
+from LinkedInWebScraper.utils import HttpFetcher
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+@pytest.fixture
+def archive():
+    archive = FixtureArchive()
+    archive.add_response('https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/4000000001?trackingId=abc', 200,
+                         'Científico de Datos'.encode('utf-8'))
+    archive.add_completion([{'role': 'user', 'content': 'hello'}], '{"TechStack": ["Python"]}')
+    return archive
+
+
+class TestFixtureArchive:
+
+    def test_save_and_load(self, archive, tmp_path):
+        path = str(tmp_path / 'fixtures.json.gz')
+        archive.save(path)
+
+        loaded = FixtureArchive.load(path)
+
+        assert loaded.get_response('http://127.0.0.1:8000/jobs-guest/jobs/api/jobPosting/4000000001') == \
+            (200, 'Científico de Datos'.encode('utf-8'))
+        assert loaded.get_completion([{'role': 'user', 'content': 'hello'}]) == '{"TechStack": ["Python"]}'
+        assert loaded.get_response('/jobs/search/?keywords=unknown') is None
+
+    def test_recording_fetcher(self, logger):
+        response = MagicMock(status_code=200, content=b'<li></li>')
+        fetcher = MagicMock()
+        fetcher.fetch_until_success.return_value = response
+        archive = FixtureArchive()
+
+        assert RecordingFetcher(fetcher, archive).fetch_until_success('https://www.linkedin.com/jobs/search/?start=10', logger) is response
+        assert archive.get_response('/jobs/search/?start=10') == (200, b'<li></li>')
+
+
+class TestReplayServer:
+
+    def test_serves_recorded_responses(self, archive):
+        with ReplayServer(archive) as server:
+            found = requests.get(f"{server.url}/jobs-guest/jobs/api/jobPosting/4000000001", timeout=5)
+            missing = requests.get(f"{server.url}/jobs-guest/jobs/api/jobPosting/4000000002", timeout=5)
+
+        assert found.status_code == 200
+        assert found.content == 'Científico de Datos'.encode('utf-8')
+        assert missing.status_code == 404
+        assert server.requests_served == 2
+
+    def test_error_rate(self, archive):
+        with ReplayServer(archive, error_rate=1.0) as server:
+            response = requests.get(f"{server.url}/jobs-guest/jobs/api/jobPosting/4000000001", timeout=5)
+
+        assert response.status_code == 429
+
+
+class TestFakeOpenAIClient:
+
+    def test_replays_recorded_completion(self, archive):
+        completion = FakeOpenAIClient(archive).chat.completions.create(messages=[{'role': 'user', 'content': 'hello'}])
+
+        assert completion.choices[0].message.content == '{"TechStack": ["Python"]}'
+
+    def test_synthetic_completion(self, logger):
+        handler = OpenAIHandler(logger, client=FakeOpenAIClient())
+
+        result = handler.generate_chat_completion(handler.create_messages('3+ years with Python and SQL. Advanced English.'))
+
+        assert result['TechStack'] == ['Python', 'SQL']
+        assert result['YoE'] == '3+ years'
+        assert result['English'] is True
+
+    def test_error_rate(self):
+        with pytest.raises(FakeOpenAIError):
+            FakeOpenAIClient(error_rate=1.0).chat.completions.create(messages=[{'role': 'user', 'content': 'hello'}])
+
+
+def test_pipeline_runs_offline(logger):
+    """The full pipeline runs against the replay server and the fake OpenAI client."""
+    archive = build_synthetic_archive(num_jobs=25, remote_types=('REMOTE',))
+    openai_client = FakeOpenAIClient(archive)
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                  base_url=server.url, detail_workers=4)
+        jobs = LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=openai_client).run()
+
+    assert not jobs.empty
+    assert openai_client.calls == len(jobs)
+    assert jobs['JobID'].str.fullmatch(r'41\d{8}').all()
+    assert {'TechStack', 'MinYoE', 'DatePosted'} <= set(jobs.columns)
+    # The total is read from the first of the 3 search pages, then one request per posting
+    assert server.requests_served == 3 + len(jobs)
@@ -0,0 +1,171 @@
+import json
+import random
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from LinkedInWebScraper.completion_cache import CompletionCache
+from LinkedInWebScraper.job_description_processor import JobDescriptionProcessor
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.rate_limiter import AdaptiveRateLimiter
+from LinkedInWebScraper.replay import FakeOpenAIClient, ReplayServer, build_synthetic_archive
+from LinkedInWebScraper.request_packer import RequestPacker
+from LinkedInWebScraper.utils import HttpFetcher
+from OpenAIHandler.openai_handler import OpenAIHandler
+
+
+@pytest.fixture
+def logger():
+    mock_logger = MagicMock()
+    mock_logger.log = MagicMock()
+    return mock_logger
+
+
+def jobs(count, words=40, seed=0):
+    rng = random.Random(seed)
+    vocabulary = ['Python', 'SQL', 'Spark', 'AWS', 'models', 'data', 'team', 'English', 'degree', 'dashboards']
+    return pd.DataFrame({
+        'JobID': [str(4000000000 + position) for position in range(count)],
+        'Description': [f"{rng.randint(1, 9)}+ years. " + ' '.join(rng.choice(vocabulary) for _ in range(words))
+                        for _ in range(count)],
+    })
+
+
+class PackTrackingClient(FakeOpenAIClient):
+    """A fake client recording how many descriptions each request held."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.pack_sizes = []
+
+    def _create(self, messages, **kwargs):
+        content = messages[-1]['content']
+        if 'Now process each of the following job descriptions' in content:
+            self.pack_sizes.append(content.count('"JobID"'))
+        else:
+            self.pack_sizes.append(1)
+        return super()._create(messages, **kwargs)
+
+
+class TestRequestPacker:
+
+    def test_packs_within_the_token_budget(self):
+        packer = RequestPacker(token_budget=2000, max_pack_size=20, fixed_chars=2000,
+                               tokens_per_char=0.25, completion_tokens=100)
+
+        # 500 fixed tokens, then 100 prompt plus 100 completion tokens per entry
+        assert packer.next_pack_size([400] * 30) == 7
+        assert packer.next_pack_size([4000] * 30) == 1
+        assert packer.next_pack_size([4] * 30) == 14
+        assert packer.next_pack_size([4] * 3) == 3
+        assert packer.next_pack_size([]) == 0
+
+    def test_max_pack_size(self):
+        packer = RequestPacker(token_budget=10 ** 9, max_pack_size=5)
+        assert packer.next_pack_size([10] * 30) == 5
+
+    def test_measured_tokens_resize_the_packs(self):
+        packer = RequestPacker(token_budget=4000, max_pack_size=50, fixed_chars=2000, smoothing=1.0)
+        initial = packer.next_pack_size([400] * 50)
+
+        # Responses turn out much shorter than the initial 300 tokens per description
+        packer.record(prompt_chars=10000, prompt_tokens=2500, completion_tokens=300, answered=10)
+        assert packer.completion_tokens == 30
+        assert packer.next_pack_size([400] * 50) > initial
+
+        # A tokenizer producing twice as many tokens per character shrinks them again
+        packer.record(prompt_chars=10000, prompt_tokens=5000, completion_tokens=300, answered=10)
+        assert packer.tokens_per_char == 0.5
+        assert packer.next_pack_size([400] * 50) < packer.max_pack_size
+        assert packer.stats()['packs'] == 3
+
+
+class TestPackedResponse:
+
+    def test_splits_the_response_per_job_id(self):
+        content = json.dumps({'Jobs': [
+            {'JobID': '2', 'Description': 'b', 'TechStack': ['SQL'], 'YoE': 'N/A', 'MinLevelStudies': 'N/A', 'English': True},
+            {'JobID': '1', 'Description': 'a', 'TechStack': [], 'YoE': '2+ years', 'MinLevelStudies': 'N/A', 'English': False},
+            {'JobID': '9', 'Description': 'not requested', 'TechStack': [], 'YoE': 'N/A', 'MinLevelStudies': 'N/A', 'English': True},
+            {'JobID': '3', 'Description': 'missing keys'},
+            'not an object',
+        ]})
+
+        results, failed = OpenAIHandler.parse_packed_response(content, ['1', '2', '3', '4'])
+
+        assert results['1']['YoE'] == '2+ years' and results['2']['TechStack'] == ['SQL']
+        assert 'JobID' not in results['1']
+        assert failed == ['3', '4']
+
+    def test_invalid_json_fails_every_entry(self):
+        assert OpenAIHandler.parse_packed_response('{"Jobs": [', ['1', '2']) == ({}, ['1', '2'])
+        assert OpenAIHandler.parse_packed_response('[]', ['1']) == ({}, ['1'])
+
+
+class TestPackedEnrichment:
+
+    def test_matches_unpacked_results_with_fewer_requests(self, logger):
+        client = PackTrackingClient()
+        packer = RequestPacker(token_budget=6000, max_pack_size=8)
+        packed = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, packer=packer) \
+            .process_job_descriptions(jobs(20))
+        single = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(jobs(20))
+
+        pd.testing.assert_frame_equal(packed, single)
+        assert sum(client.pack_sizes) == 20
+        assert len(client.pack_sizes) < 20 and max(client.pack_sizes) <= 8
+
+    def test_retries_only_the_failed_entries(self, logger):
+        client = PackTrackingClient(entry_error_rate=0.3, seed=7)
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger,
+                                            packer=RequestPacker(max_pack_size=10), pack_retries=1)
+
+        result = processor.process_job_descriptions(jobs(10))
+        single = JobDescriptionProcessor(OpenAIHandler(logger, client=FakeOpenAIClient()), logger) \
+            .process_job_descriptions(jobs(10))
+
+        pd.testing.assert_frame_equal(result, single)
+        # One pack of ten, a retry holding only the missing entries, then single requests for the rest
+        assert client.pack_sizes[0] == 10
+        assert 0 < client.pack_sizes[1] < 10
+        assert all(size == 1 for size in client.pack_sizes[2:])
+
+    def test_concurrent_packs(self, logger):
+        client = PackTrackingClient(latency=0.01)
+        processor = JobDescriptionProcessor(OpenAIHandler(logger, client=client), logger, max_in_flight=3,
+                                            packer=RequestPacker(max_pack_size=4))
+
+        result = processor.process_job_descriptions(jobs(30))
+
+        assert result['ShortDescription'].notna().all()
+        assert processor.api_calls == len(client.pack_sizes) and sum(client.pack_sizes) == 30
+
+    def test_completion_cache_uses_the_packed_prompt_version(self, logger, tmp_path):
+        client = PackTrackingClient()
+        cache = CompletionCache(str(tmp_path / 'completions.sqlite'))
+        handler = OpenAIHandler(logger, client=client)
+
+        JobDescriptionProcessor(handler, logger, completion_cache=cache, packer=RequestPacker()) \
+            .process_job_descriptions(jobs(5))
+        JobDescriptionProcessor(handler, logger, completion_cache=cache, packer=RequestPacker()) \
+            .process_job_descriptions(jobs(5))
+
+        assert len(client.pack_sizes) == 1
+        assert cache.versions() == [(handler.packed_prompt_version, handler.model, 5)]
+
+
+def test_pipeline_runs_with_packed_requests(logger):
+    """The full pipeline enriches every job with fewer OpenAI requests than jobs."""
+    archive = build_synthetic_archive(num_jobs=25, remote_types=('REMOTE',))
+    openai_client = FakeOpenAIClient(archive)
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000)
+
+    with ReplayServer(archive) as server, HttpFetcher(logger, rate_limiter=rate_limiter) as fetcher:
+        config = JobScraperConfig('Data Scientist', 'Monterrey', openai_enabled=True, remote='REMOTE',
+                                  base_url=server.url, openai_pack_requests=True, openai_max_pack_size=10)
+        jobs = LinkedInJobScraper(logger, config, fetcher=fetcher, openai_client=openai_client).run()
+
+    assert not jobs.empty
+    assert 0 < openai_client.calls < len(jobs)
+    assert {'TechStack', 'MinYoE', 'DatePosted'} <= set(jobs.columns)
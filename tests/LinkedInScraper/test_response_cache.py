@@ -0,0 +1,99 @@
+import os
+import pandas as pd
+import pytest
+import sqlite3
+from unittest.mock import MagicMock, patch
+from LinkedInWebScraper.job_scraper_config import JobScraperConfig
+from LinkedInWebScraper.linkedin_scraper import LinkedInJobScraper
+from LinkedInWebScraper.response_cache import ResponseCache
+from LinkedInWebScraper.utils import HttpFetcher
+
+POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/4012345678"
+SEARCH_URL = "https://www.linkedin.com/jobs/search/?keywords=Data%20Scientist&location=Monterrey&start=10"
+
+
+def make_response(content):
+    response = MagicMock()
+    response.status_code = 200
+    response.content = content
+    response.encoding = 'utf-8'
+    return response
+
+
+def cache_time(cache):
+    """Returns the timestamp of the most recently stored entry."""
+    return cache._connection.execute("SELECT MAX(stored_at) FROM responses").fetchone()[0]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(os.path.join(tmp_path, 'cache.sqlite'))
+    yield cache
+    cache.close()
+
+
+class TestResponseCache:
+
+    def test_normalize_url(self):
+        """Query order, tracking parameters and host case do not change the cache key."""
+        a = ResponseCache.normalize_url("https://WWW.linkedin.com/jobs/search/?location=Monterrey&keywords=Data&position=3#top")
+        b = ResponseCache.normalize_url("https://www.linkedin.com/jobs/search/?keywords=Data&location=Monterrey")
+        assert a == b
+
+    def test_hit_and_miss_counters(self, cache):
+        """A stored body is served back and the lookups are counted."""
+        assert cache.get(POSTING_URL) is None
+        cache.put(POSTING_URL, make_response(b'<html>posting</html>'))
+
+        cached = cache.get(POSTING_URL)
+        assert cached.content == b'<html>posting</html>'
+        assert cached.text == '<html>posting</html>'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_ttl_per_url_class(self, cache):
+        """Search pages expire after their short TTL while postings are still served."""
+        cache.put(POSTING_URL, make_response(b'posting'))
+        cache.put(SEARCH_URL, make_response(b'search'))
+
+        with patch('LinkedInWebScraper.response_cache.time.time', return_value=cache_time(cache) + 2 * 3600):
+            assert cache.get(SEARCH_URL) is None
+            assert cache.get(POSTING_URL) is not None
+
+    def test_lru_eviction(self, tmp_path):
+        """Once the size limit is exceeded the least recently used entries are evicted."""
+        cache = ResponseCache(os.path.join(tmp_path, 'small.sqlite'), max_size_mb=0.01)
+        for i in range(6):
+            cache.put(f"{POSTING_URL}{i}", make_response(os.urandom(3000)))
+            cache.get(f"{POSTING_URL}0")
+
+        assert cache.get(f"{POSTING_URL}0") is not None
+        assert cache.get(f"{POSTING_URL}1") is None
+        assert cache.stats()['size_bytes'] <= 0.01 * 1024 * 1024
+        cache.close()
+
+    def test_fetcher_serves_repeated_requests_from_cache(self, cache):
+        """The fetcher only goes to the network on a cache miss."""
+        fetcher = HttpFetcher()
+        with patch.object(fetcher.session, 'get', return_value=make_response(b'posting')) as mock_get:
+            first = fetcher.fetch_until_success(POSTING_URL, logger=MagicMock(), cache=cache)
+            second = fetcher.fetch_until_success(POSTING_URL, logger=MagicMock(), cache=cache)
+
+        assert mock_get.call_count == 1
+        assert first.content == second.content == b'posting'
+
+    def test_scraper_closes_the_cache_after_each_run(self, tmp_path):
+        """The pipeline closes the cache connection when a run ends and opens it again for the next run."""
+        logger = MagicMock()
+        config = JobScraperConfig('Data Scientist', 'Monterrey', response_cache_file=os.path.join(tmp_path, 'cache.sqlite'))
+        scraper = LinkedInJobScraper(logger, config)
+
+        caches = []
+        with patch.object(scraper, 'scrape_jobs', side_effect=lambda: caches.append(scraper.job_scraper.response_cache) or pd.DataFrame()):
+            scraper.run()
+            scraper.run()
+
+        assert all(isinstance(cache, ResponseCache) for cache in caches) and caches[0] is not caches[1]
+        assert scraper.job_scraper.response_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            caches[1].get(POSTING_URL)
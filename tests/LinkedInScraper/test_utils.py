@@ -3,7 +3,7 @@ import requests
 from Utils.logger import Logger
 from Utils.constants import USER_AGENT_HEADERS
 from unittest.mock import patch, MagicMock
-from LinkedInWebScraper.utils import get_random_header, fetch_until_success
+from LinkedInWebScraper.utils import get_random_header, fetch_until_success, get_default_fetcher, HttpFetcher
 
 # Test get_random_header
 def test_get_random_header():
@@ -21,7 +21,7 @@ class TestFetchUntilSuccess:
         mock_logger.log = MagicMock()
         return mock_logger
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('random.choice', return_value={'User-Agent': 'Mozilla/5.0'})
     def test_fetch_success_on_first_try(self, mock_random_choice, mock_requests_get, logger):
         """Test fetch_until_success succeeds on the first try."""
@@ -39,7 +39,7 @@ class TestFetchUntilSuccess:
         assert response == mock_response
         logger.log.debug.assert_called_with(f"Successfully fetched data from {url}")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('time.sleep', return_value=None)  # Mock time.sleep to avoid actual delays
     def test_fetch_retries_on_failure(self, mock_sleep, mock_requests_get, logger):
         """Test fetch_until_success retries on failure with status code other than 200."""
@@ -60,7 +60,7 @@ class TestFetchUntilSuccess:
         logger.log.debug.assert_any_call(f"Received status code 500 from {url}")
         logger.log.debug.assert_any_call(f"Max retries reached. Unable to fetch jobs from {url}")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('time.sleep', return_value=None)  # Mock time.sleep to avoid delays
     def test_fetch_handles_request_exception(self, mock_sleep, mock_requests_get, logger):
         """Test fetch_until_success handles RequestException and retries."""
@@ -79,7 +79,7 @@ class TestFetchUntilSuccess:
         logger.log.debug.assert_any_call(f"Request error: . Retrying... (Attempt 1/{max_retries})")
         logger.log.debug.assert_any_call(f"Max retries reached. Unable to fetch jobs from {url}")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('time.sleep', return_value=None)  # Mock time.sleep to avoid delays
     def test_fetch_exponential_backoff(self, mock_sleep, mock_requests_get, logger):
         """Test that fetch_until_success uses exponential backoff between retries."""
@@ -102,3 +102,29 @@ class TestFetchUntilSuccess:
         
         assert actual_backoff_times == expected_backoff_times
 
+
+class TestHttpFetcher:
+
+    def test_fetcher_reuses_pooled_session(self):
+        """All requests of a fetcher go through the same keep-alive session."""
+        fetcher = HttpFetcher(pool_size=4)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        with patch.object(fetcher.session, 'get', return_value=mock_response) as mock_get:
+            fetcher.fetch_until_success("http://example.com/a", logger=MagicMock())
+            fetcher.fetch_until_success("http://example.com/b", logger=MagicMock())
+
+        assert mock_get.call_count == 2
+        assert fetcher.session.headers['connection'] == 'keep-alive'
+        assert 'gzip' in fetcher.session.headers['accept-encoding']
+        assert fetcher.session.get_adapter("https://www.linkedin.com")._pool_maxsize == 4
+
+    def test_fetch_until_success_uses_default_fetcher(self):
+        """The module-level wrapper delegates to the shared default fetcher."""
+        assert get_default_fetcher() is get_default_fetcher()
+
+        with patch.object(HttpFetcher, 'fetch_until_success', return_value='response') as mock_fetch:
+            assert fetch_until_success("http://example.com", logger=None) == 'response'
+
+        mock_fetch.assert_called_once_with("http://example.com", None, max_retries=5, backoff_time=1, cache=None)
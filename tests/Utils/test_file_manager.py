@@ -105,3 +105,27 @@ class TestFileManager:
 
         cleaned_df = file_manager.clean_job_ids(sample_df_dirty)
         assert cleaned_df['JobID'].tolist() == ['12345', '67890']
+
+    def test_load_known_job_ids(self, file_manager, sample_df, tmp_path):
+        """Test that the stored JobIDs are loaded as a set of stripped strings."""
+        file_name = tmp_path / 'jobs.csv'
+        sample_df.assign(JobID=[' 12345', '67890 ']).to_csv(file_name, index=False)
+
+        assert file_manager.load_known_job_ids(str(file_name)) == {'12345', '67890'}
+        assert file_manager.load_known_job_ids(str(tmp_path / 'missing.csv')) == set()
+
+    def test_stream_jobs_to_csv(self, file_manager, sample_df, tmp_path):
+        """Test that batches are appended as they arrive, skipping JobIDs already in the file."""
+        file_name = str(tmp_path / 'jobs.csv')
+        sample_df.head(1).to_csv(file_name, index=False)
+        later_batch = pd.DataFrame({
+            'Title': ['ML Engineer'], 'JobID': ['24680'], 'Company': ['Company C'],
+            'Location': ['Remote'], 'Url': ['http://example.com/24680']
+        })
+
+        written_count = file_manager.stream_jobs_to_csv(iter([sample_df.copy(), later_batch]), file_name)
+
+        stored = pd.read_csv(file_name, dtype={'JobID': str})
+        assert written_count == 2
+        assert stored['JobID'].tolist() == ['12345', '67890', '24680']
+        assert stored.columns.tolist() == sample_df.columns.tolist()